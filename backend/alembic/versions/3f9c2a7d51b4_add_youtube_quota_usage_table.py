@@ -0,0 +1,38 @@
+"""Add youtube_quota_usage table for quota accounting
+
+Revision ID: 3f9c2a7d51b4
+Revises: ea03dbde3e59
+Create Date: 2026-10-17 10:12:40.518203
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f9c2a7d51b4'
+down_revision: Union[str, None] = 'ea03dbde3e59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table(
+        'youtube_quota_usage',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('quota_date', sa.Date(), nullable=False),
+        sa.Column('key_id', sa.String(length=32), nullable=False),
+        sa.Column('endpoint', sa.String(length=50), nullable=False),
+        sa.Column('units', sa.Integer(), nullable=False),
+        sa.Column('request_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('quota_date', 'key_id', 'endpoint', name='uq_quota_date_key_endpoint'),
+    )
+    op.create_index(op.f('ix_youtube_quota_usage_id'), 'youtube_quota_usage', ['id'], unique=False)
+    op.create_index(
+        op.f('ix_youtube_quota_usage_quota_date'), 'youtube_quota_usage', ['quota_date'], unique=False
+    )
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_youtube_quota_usage_quota_date'), table_name='youtube_quota_usage')
+    op.drop_index(op.f('ix_youtube_quota_usage_id'), table_name='youtube_quota_usage')
+    op.drop_table('youtube_quota_usage')
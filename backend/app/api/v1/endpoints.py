@@ -2,7 +2,7 @@
 API v1 endpoints for keyword and comment analysis.
 """
 import logging
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from app.schemas import (
     ApiResponse,
     KeywordAnalyzeRequest,
@@ -10,8 +10,13 @@ from app.schemas import (
     CommentAnalyzeRequest,
     CommentAnalyzeResponse,
 )
+from app.core.deadline import Deadline, request_deadline
 from app.services.comment_collector import CommentCollectorService
-from app.services.youtube import YouTubeAPIError, YouTubeQuotaExceededError
+from app.services.youtube import (
+    YouTubeAPIError,
+    YouTubeDeadlineExceededError,
+    YouTubeQuotaExceededError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +32,10 @@ router = APIRouter()
     description="Analyze comments from a YouTube video and extract insights.",
     tags=["comments"]
 )
-async def analyze_comments(request: CommentAnalyzeRequest):
+async def analyze_comments(
+    request: CommentAnalyzeRequest,
+    deadline: Deadline = Depends(request_deadline("comments"))
+):
     """
     Analyze YouTube video comments.
 
@@ -38,12 +46,16 @@ async def analyze_comments(request: CommentAnalyzeRequest):
     - Frequent words and phrases
     - Viewer requests and feedback
     - Sentiment analysis (positive, neutral, negative)
+
+    The analysis must finish within settings.REQUEST_DEADLINES["comments"]
+    seconds, or the X-Request-Timeout header's value. When time runs low,
+    the comments collected so far are analyzed and `partial` is true.
     """
     service = CommentCollectorService()
 
     try:
         logger.info(f"Starting comment analysis for URL: {request.video_url}")
-        result = await service.collect_comments(request.video_url)
+        result = await service.collect_comments(request.video_url, deadline=deadline)
         logger.info(f"Comment analysis completed for video: {result.video_info.video_id}")
 
         return ApiResponse(
@@ -69,6 +81,15 @@ async def analyze_comments(request: CommentAnalyzeRequest):
             error="YouTube API quota exceeded. Please try again later."
         )
 
+    except YouTubeDeadlineExceededError as e:
+        # Not even the video details and first comment page arrived in time
+        logger.warning(f"Comment analysis deadline exceeded: {str(e)}")
+        return ApiResponse(
+            success=False,
+            data=None,
+            error=f"Comment analysis did not finish within {deadline.seconds:g}s."
+        )
+
     except YouTubeAPIError as e:
         # Other YouTube API errors
         logger.error(f"YouTube API error: {str(e)}")
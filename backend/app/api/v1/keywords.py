@@ -9,8 +9,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.keyword import KeywordAnalyzeRequest, KeywordAnalyzeResponse
 from app.schemas.common import ApiResponse
 from app.services.keyword_analyzer import KeywordAnalyzerService
-from app.services.youtube import YouTubeAPIClient, YouTubeAPIError, get_youtube_client
+from app.services.youtube import (
+    YouTubeAPIClient,
+    YouTubeAPIError,
+    YouTubeDeadlineExceededError,
+    get_youtube_client,
+)
 from app.core.database import get_db
+from app.core.deadline import Deadline, request_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +27,8 @@ router = APIRouter(prefix="/keywords", tags=["keywords"])
 async def analyze_keyword(
     request: KeywordAnalyzeRequest,
     db: AsyncSession = Depends(get_db),
-    youtube_client: YouTubeAPIClient = Depends(get_youtube_client)
+    youtube_client: YouTubeAPIClient = Depends(get_youtube_client),
+    deadline: Deadline = Depends(request_deadline("keywords"))
 ):
     """
     Analyze a keyword for YouTube content opportunities.
@@ -33,7 +40,12 @@ async def analyze_keyword(
     - Related keyword suggestions
 
     The analysis uses YouTube search results to estimate keyword performance.
-    Results are cached for 7 days.
+    Results are cached for 7 days. For another 7 days they are returned
+    right away with "stale": true while they are refreshed in the background.
+
+    The analysis must finish within settings.REQUEST_DEADLINES["keywords"]
+    seconds, or the X-Request-Timeout header's value. When time runs low,
+    the result is returned with "partial": true instead of waiting.
 
     **Example Request:**
     ```json
@@ -72,14 +84,16 @@ async def analyze_keyword(
         analyzer = KeywordAnalyzerService(db=db, youtube_client=youtube_client)
 
         # Perform analysis
-        result = await analyzer.analyze(request.keyword)
+        result = await analyzer.analyze(request.keyword, deadline=deadline)
 
         # Convert to response schema
         response_data = KeywordAnalyzeResponse(
             keyword=result["keyword"],
             metrics=result["metrics"],
             related_keywords=result["related_keywords"],
-            analyzed_at=result["analyzed_at"]
+            analyzed_at=result["analyzed_at"],
+            stale=result.get("stale", False),
+            partial=result.get("partial", False)
         )
 
         return ApiResponse(
@@ -91,6 +105,13 @@ async def analyze_keyword(
         logger.warning(f"Invalid keyword: {e}")
         raise HTTPException(status_code=422, detail=str(e))
 
+    except YouTubeDeadlineExceededError as e:
+        logger.warning(f"Keyword analysis deadline exceeded: {e}")
+        raise HTTPException(
+            status_code=504,
+            detail=f"Keyword analysis did not finish within {deadline.seconds:g}s"
+        )
+
     except YouTubeAPIError as e:
         logger.error(f"YouTube API error: {e}")
         raise HTTPException(
@@ -0,0 +1,46 @@
+"""
+API v1 metrics endpoint.
+Runtime statistics of the YouTube client and the keyword analysis cache.
+"""
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from app.schemas import ApiResponse
+from app.services.keyword_cache import get_keyword_cache
+from app.services.youtube import YouTubeAPIClient, get_youtube_client
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    response_model=ApiResponse[Dict[str, Any]],
+    summary="Runtime statistics",
+    description="Cache, rate limiter, circuit breaker and hedging statistics of this process.",
+    tags=["metrics"]
+)
+async def get_metrics(
+    youtube_client: YouTubeAPIClient = Depends(get_youtube_client)
+):
+    """
+    Report in-process statistics for monitoring.
+
+    Returns:
+    - youtube.response_cache: YouTube response cache size and hit rate (null if disabled)
+    - youtube.rate_limiter: Outbound queue depth and wait times
+    - youtube.circuit_breaker: Breaker state and recent failure rate
+    - youtube.hedging: Hedged requests, hedge win rate and current hedge delays
+    - keyword_cache: In-memory keyword analysis cache size and hit rate (null if disabled)
+
+    Counters are per process and reset on restart.
+    """
+    keyword_cache = get_keyword_cache()
+    return ApiResponse(
+        success=True,
+        data={
+            "youtube": youtube_client.stats(),
+            "keyword_cache": keyword_cache.stats() if keyword_cache is not None else None,
+        }
+    )
@@ -10,6 +10,82 @@ class Settings(BaseSettings):
 
     # YouTube API
     YOUTUBE_API_KEY: Optional[str] = None
+    YOUTUBE_API_KEYS: list[str] = []  # optional key pool, rotated by remaining quota
+    YOUTUBE_API_BASE_URL: str = "https://www.googleapis.com/youtube/v3"  # or a stand-in (benchmarks.fake_youtube)
+
+    # YouTube HTTP connection pool (shared process-wide, see app.services.youtube)
+    YOUTUBE_HTTP_MAX_CONNECTIONS: int = 100
+    YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    YOUTUBE_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    YOUTUBE_HTTP2: bool = False  # requires the optional `h2` package
+
+    # YouTube request retries (exponential backoff with full jitter, seconds)
+    YOUTUBE_MAX_RETRIES: int = 3
+    YOUTUBE_RETRY_BASE_DELAY: float = 0.5
+    YOUTUBE_RETRY_MAX_DELAY: float = 8.0
+    YOUTUBE_RETRY_BUDGET: float = 20.0  # total time allowed for one request incl. retries
+    YOUTUBE_RETRY_STATUSES: list[int] = [429, 500, 502, 503, 504]
+
+    # YouTube outbound rate limiting (token bucket + in-flight cap)
+    YOUTUBE_RATE_LIMIT_PER_SECOND: float = 10.0
+    YOUTUBE_RATE_LIMIT_BURST: float = 20.0
+    YOUTUBE_MAX_IN_FLIGHT: int = 10
+    YOUTUBE_RATE_LIMIT_WEIGHTS: dict[str, float] = {"search": 5.0}
+
+    # YouTube API record/replay (offline benchmarking, see app.services.youtube_replay)
+    YOUTUBE_REPLAY_MODE: str = ""  # "record" saves live responses, "replay" serves them offline
+    YOUTUBE_REPLAY_DIR: str = "./youtube_recordings"
+    YOUTUBE_REPLAY_LATENCY: Optional[float] = None  # seconds per replayed response; None = as recorded
+    YOUTUBE_REPLAY_JITTER: float = 0.0  # +/- seconds of uniform random jitter
+
+    # YouTube circuit breaker (fail fast while the API is erroring or slow)
+    YOUTUBE_BREAKER_WINDOW_SIZE: int = 20  # recent calls the failure rate is computed over
+    YOUTUBE_BREAKER_MIN_CALLS: int = 10
+    YOUTUBE_BREAKER_FAILURE_RATE: float = 0.5  # 0 disables the breaker
+    YOUTUBE_BREAKER_SLOW_CALL_SECONDS: float = 5.0  # slower calls count as failures
+    YOUTUBE_BREAKER_OPEN_SECONDS: float = 30.0
+    YOUTUBE_BREAKER_HALF_OPEN_CALLS: int = 1
+
+    # YouTube request hedging (duplicate slow reads, see app.services.youtube_hedge)
+    YOUTUBE_HEDGE_ENDPOINTS: list[str] = []  # opt-in, e.g. ["videos", "channels"]; search is never hedged
+    YOUTUBE_HEDGE_PERCENTILE: float = 0.95  # hedge once a request is slower than this latency percentile
+    YOUTUBE_HEDGE_MIN_SAMPLES: int = 20  # responses seen before an endpoint is hedged
+    YOUTUBE_HEDGE_MIN_DELAY: float = 0.05
+    YOUTUBE_HEDGE_MAX_DELAY: float = 2.0
+    YOUTUBE_HEDGE_BUDGET: float = 0.05  # hedges per request, bounds the extra quota spent
+
+    # YouTube response cache (in-memory TTL + LRU, TTLs in seconds)
+    YOUTUBE_CACHE_ENABLED: bool = True
+    YOUTUBE_CACHE_MAX_ENTRIES: int = 2000
+    YOUTUBE_CACHE_TTL_SEARCH: float = 1800.0
+    YOUTUBE_CACHE_TTL_VIDEOS: float = 300.0  # view/like counts change quickly
+    YOUTUBE_CACHE_TTL_CHANNELS: float = 86400.0
+    YOUTUBE_CACHE_TTL_COMMENT_THREADS: float = 600.0
+    YOUTUBE_CACHE_TTL_NEGATIVE: float = 120.0  # deleted videos/channels, comments off; can come back
+
+    # YouTube search paging (50 results and 100 quota units per page)
+    YOUTUBE_SEARCH_LIMIT: int = 50  # results per query; above 50 pages (opt-in, max 500)
+    YOUTUBE_SEARCH_MIN_RELEVANCE: float = 0.3  # keyword analysis stops paging below this share
+
+    # YouTube comment collection
+    YOUTUBE_COMMENT_LIMIT: int = 1000  # comments streamed per video (100 per page, 1 unit each)
+    YOUTUBE_REPLY_THREAD_LIMIT: int = 50  # threads per video whose replies are fetched (0 disables)
+    YOUTUBE_REPLY_LIMIT: int = 100  # replies fetched per thread
+    YOUTUBE_REPLY_CONCURRENCY: int = 5  # threads fetched at once
+
+    # YouTube quota ledger (units per API key per Pacific-time day)
+    YOUTUBE_DAILY_QUOTA: int = 10000
+    YOUTUBE_QUOTA_RESERVE: int = 500  # kept for cheap calls; expensive ones (search) are shed first
+    YOUTUBE_QUOTA_FLUSH_INTERVAL: float = 5.0
+
+    # Keyword analysis cache (in-process LRU in front of the keyword_analyses table)
+    KEYWORD_CACHE_MAX_ENTRIES: int = 1000  # 0 disables it; entries expire with their rows
+
+    # Request deadlines (seconds an API request may take end to end, see app.core.deadline)
+    REQUEST_DEADLINES: dict[str, float] = {"keywords": 20.0, "comments": 30.0}
+    REQUEST_DEADLINE_DEFAULT: float = 30.0
+    REQUEST_DEADLINE_MAX: float = 60.0  # cap for deadlines asked for with X-Request-Timeout
+    REQUEST_DEADLINE_RESERVE: float = 2.0  # optional enrichment is skipped with less time left
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -0,0 +1,125 @@
+"""
+Request deadlines
+Time budgets set per API request and honored by the services and the YouTube client.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+import time
+
+from fastapi import Header, HTTPException
+
+from app.core.config import settings
+
+
+class Deadline:
+    """
+    Point in time by which a request should be answered
+
+    Services skip optional work once the deadline is running low (less than
+    `reserve` seconds left) and return what they have, flagged as partial.
+    YouTubeAPIClient bounds each HTTP call by the time remaining.
+    """
+
+    def __init__(self, seconds: float, reserve: Optional[float] = None):
+        """
+        Initialize deadline
+
+        Args:
+            seconds: Time budget from now
+            reserve: Seconds kept for finishing up (analysis, response);
+                default settings.REQUEST_DEADLINE_RESERVE
+        """
+        self.seconds = seconds
+        self.reserve = settings.REQUEST_DEADLINE_RESERVE if reserve is None else reserve
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Get seconds left until the deadline (0 once it has passed)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def extend_to(self, other: Optional["Deadline"]) -> None:
+        """
+        Push the deadline back to another one's, if that is later
+
+        Args:
+            other: Deadline to cover, or None to lift the deadline altogether
+        """
+        expires_at = float("inf") if other is None else other.expires_at
+        self.expires_at = max(self.expires_at, expires_at)
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed"""
+        return self.remaining() <= 0
+
+    @property
+    def running_low(self) -> bool:
+        """True once no more than `reserve` seconds are left"""
+        return self.remaining() <= self.reserve
+
+
+# Deadline of the request being served, read by YouTubeAPIClient
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Get the deadline of the current request
+
+    Returns:
+        Deadline set by deadline_scope(), or None outside of one
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make a deadline current for the code (and tasks it starts) in the block
+
+    Args:
+        deadline: Deadline to apply, or None for no deadline
+
+    Yields:
+        The deadline
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def request_deadline(endpoint: str) -> Callable[..., Deadline]:
+    """
+    Build a FastAPI dependency starting the deadline of an endpoint's requests
+
+    The budget is settings.REQUEST_DEADLINES[endpoint] (default
+    settings.REQUEST_DEADLINE_DEFAULT). Clients may ask for another one
+    with the X-Request-Timeout header (seconds), capped at
+    settings.REQUEST_DEADLINE_MAX.
+
+    Args:
+        endpoint: Endpoint name in settings.REQUEST_DEADLINES
+
+    Returns:
+        Dependency returning a new Deadline
+    """
+    def dependency(x_request_timeout: Optional[str] = Header(default=None)) -> Deadline:
+        seconds = settings.REQUEST_DEADLINES.get(endpoint, settings.REQUEST_DEADLINE_DEFAULT)
+        if x_request_timeout is not None:
+            try:
+                requested = float(x_request_timeout)
+            except ValueError:
+                requested = 0.0
+            if not 0 < requested < float("inf"):
+                raise HTTPException(
+                    status_code=422,
+                    detail="X-Request-Timeout must be a positive number of seconds"
+                )
+            seconds = min(requested, settings.REQUEST_DEADLINE_MAX)
+        return Deadline(seconds)
+
+    return dependency
@@ -1,9 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.db.session import engine
+from app.db.session import engine, AsyncSessionLocal
 from app.db.base import Base
 from app.routers import youtube, comments
+from app.services.youtube import init_http_client, close_http_client
+from app.services.youtube_quota import init_quota_ledger, close_quota_ledger
+from app.services.keyword_analyzer import cancel_keyword_refreshes
 
 # FastAPI app instance
 app = FastAPI(
@@ -32,15 +35,20 @@ async def health_check():
         "version": "0.1.0"
     }
 
-# Startup event - create tables
+# Startup event - create tables, open the shared YouTube HTTP pool and quota ledger
 @app.on_event("startup")
 async def startup_event():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    init_http_client()
+    await init_quota_ledger(AsyncSessionLocal)
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
+    await cancel_keyword_refreshes()
+    await close_quota_ledger()
+    await close_http_client()
     await engine.dispose()
 
 # Root endpoint
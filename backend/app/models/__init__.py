@@ -2,5 +2,6 @@
 Database models.
 """
 from app.models.analysis import KeywordAnalysis
+from app.models.quota import QuotaUsage
 
-__all__ = ["KeywordAnalysis"]
+__all__ = ["KeywordAnalysis", "QuotaUsage"]
@@ -12,7 +12,9 @@ class KeywordAnalysis(Base):
     Keyword analysis results with caching support.
 
     Stores analyzed keyword metrics and related keywords.
-    Uses expires_at for TTL-based cache invalidation (7 days).
+    Uses expires_at for TTL-based cache invalidation (7 days); expired
+    results are still served while they are refreshed (see
+    KeywordAnalyzerService.CACHE_HARD_TTL_DAYS).
     """
     __tablename__ = "keyword_analyses"
 
@@ -39,6 +41,10 @@ class KeywordAnalysis(Base):
         """Check if this cached result has expired."""
         return datetime.utcnow() >= self.expires_at
 
+    def is_older_than(self, days: int) -> bool:
+        """Check if this result was analyzed at least `days` days ago."""
+        return datetime.utcnow() >= self.analyzed_at + timedelta(days=days)
+
     def to_dict(self):
         """Convert model to dictionary for response serialization."""
         return {
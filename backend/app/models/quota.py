@@ -0,0 +1,30 @@
+"""
+Database models for YouTube API quota accounting.
+Stores units spent per API key and endpoint per quota day (Pacific time).
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from app.db.base import Base
+
+
+class QuotaUsage(Base):
+    """
+    YouTube Data API quota units spent by one API key on one endpoint during one quota day.
+
+    The API quota resets at midnight Pacific time, so quota_date is the
+    Pacific calendar date the units were spent on. key_id is a fingerprint
+    of the API key, never the key itself.
+    """
+    __tablename__ = "youtube_quota_usage"
+
+    id = Column(Integer, primary_key=True, index=True)
+    quota_date = Column(Date, nullable=False, index=True)
+    key_id = Column(String(32), nullable=False, default="default")
+    endpoint = Column(String(50), nullable=False)
+    units = Column(Integer, nullable=False, default=0)
+    request_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('quota_date', 'key_id', 'endpoint', name='uq_quota_date_key_endpoint'),
+    )
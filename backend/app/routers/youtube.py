@@ -3,7 +3,7 @@ YouTube API Router
 Provides REST endpoints for YouTube video search and data retrieval
 """
 
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, Path, Depends
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -12,6 +12,7 @@ from app.services.youtube import (
     YouTubeAPIClient,
     YouTubeAPIError,
     YouTubeAPIKeyError,
+    YouTubeCircuitOpenError,
     YouTubeQuotaExceededError,
     get_youtube_client
 )
@@ -27,7 +28,7 @@ class VideoSearchResult(BaseModel):
     description: str = Field(..., description="Video description")
     channel_id: str = Field(..., description="Channel ID")
     channel_title: str = Field(..., description="Channel name")
-    published_at: datetime = Field(..., description="Publication date")
+    published_at: Optional[datetime] = Field(None, description="Publication date")
     thumbnail_url: str = Field(..., description="Video thumbnail URL")
 
 
@@ -38,7 +39,7 @@ class VideoDetails(BaseModel):
     description: str = Field(..., description="Video description")
     channel_id: str = Field(..., description="Channel ID")
     channel_title: str = Field(..., description="Channel name")
-    published_at: datetime = Field(..., description="Publication date")
+    published_at: Optional[datetime] = Field(None, description="Publication date")
     duration: str = Field(..., description="Video duration (ISO 8601)")
     view_count: int = Field(..., description="Number of views")
     like_count: int = Field(..., description="Number of likes")
@@ -54,8 +55,8 @@ class VideoComment(BaseModel):
     author_name: str = Field(..., description="Author display name")
     author_channel_id: str = Field(..., description="Author channel ID")
     like_count: int = Field(..., description="Number of likes")
-    published_at: datetime = Field(..., description="Publication date")
-    updated_at: datetime = Field(..., description="Last update date")
+    published_at: Optional[datetime] = Field(None, description="Publication date")
+    updated_at: Optional[datetime] = Field(None, description="Last update date")
     reply_count: int = Field(..., description="Number of replies")
 
 
@@ -65,7 +66,7 @@ class ChannelInfo(BaseModel):
     title: str = Field(..., description="Channel title")
     description: str = Field(..., description="Channel description")
     custom_url: str = Field(..., description="Custom channel URL")
-    published_at: datetime = Field(..., description="Channel creation date")
+    published_at: Optional[datetime] = Field(None, description="Channel creation date")
     thumbnail_url: str = Field(..., description="Channel thumbnail URL")
     subscriber_count: int = Field(..., description="Number of subscribers")
     video_count: int = Field(..., description="Number of videos")
@@ -76,6 +77,10 @@ class QuotaStatus(BaseModel):
     """API quota status schema"""
     available: bool = Field(..., description="Whether API is available")
     message: str = Field(..., description="Status message")
+    daily_limit: Optional[int] = Field(None, description="Quota units per day")
+    used_units: Optional[int] = Field(None, description="Quota units used today")
+    remaining_units: Optional[int] = Field(None, description="Quota units remaining today")
+    resets_at: Optional[datetime] = Field(None, description="Next quota reset (midnight Pacific time)")
 
 
 class YouTuberRanking(BaseModel):
@@ -133,6 +138,9 @@ async def search_videos(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    except YouTubeCircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
     except YouTubeAPIError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -173,6 +181,9 @@ async def get_video_details(
     except YouTubeQuotaExceededError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
+    except YouTubeCircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
     except YouTubeAPIError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -217,6 +228,9 @@ async def get_video_comments(
     except YouTubeQuotaExceededError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
+    except YouTubeCircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
     except YouTubeAPIError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -257,6 +271,9 @@ async def get_channel_info(
     except YouTubeQuotaExceededError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
+    except YouTubeCircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
     except YouTubeAPIError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -266,8 +283,10 @@ async def check_quota():
     """
     Check YouTube API quota status
 
+    Reads today's usage from the quota ledger instead of probing the API.
+
     Returns:
-        Quota availability status
+        Quota availability status with used/remaining units
 
     Raises:
         500: API error
@@ -318,47 +337,45 @@ async def get_youtuber_ranking(
             if not videos:
                 return []
 
-            # 2. Get video details for view counts
-            video_ids = [v["video_id"] for v in videos]
-            video_details = {}
-
-            for video_id in video_ids:
-                try:
-                    details = await client.get_video_details(video_id)
-                    video_details[video_id] = details
-                except Exception:
-                    continue
+            # 2. Get video details for view counts (batched, 50 IDs per request)
+            video_ids = [v.video_id for v in videos]
+            try:
+                video_details = await client.get_videos_details(
+                    video_ids, fields=["view_count"]
+                )
+            except Exception:
+                video_details = {}
 
             # 3. Group by channel
             channel_data = {}
             for video in videos:
-                channel_id = video["channel_id"]
-                video_id = video["video_id"]
+                channel_id = video.channel_id
+                video_id = video.video_id
 
                 if channel_id not in channel_data:
                     channel_data[channel_id] = {
-                        "channel_title": video["channel_title"],
+                        "channel_title": video.channel_title,
                         "videos": [],
                         "total_views": 0
                     }
 
-                if video_id in video_details:
-                    details = video_details[video_id]
-                    view_count = details.get("view_count", 0)
+                details = video_details.get(video_id)
+                if details:
+                    view_count = details.view_count
                     channel_data[channel_id]["videos"].append({
-                        "title": video["title"],
+                        "title": video.title,
                         "views": view_count
                     })
                     channel_data[channel_id]["total_views"] += view_count
 
-            # 4. Get channel info for each unique channel
-            channel_infos = {}
-            for channel_id in list(channel_data.keys())[:top_n * 2]:
-                try:
-                    info = await client.get_channel_info(channel_id)
-                    channel_infos[channel_id] = info
-                except Exception:
-                    continue
+            # 4. Get channel info for every unique channel (batched, one request per 50)
+            try:
+                channel_infos = await client.get_channels_info(
+                    list(channel_data.keys()),
+                    fields=["thumbnail_url", "subscriber_count", "view_count"]
+                )
+            except Exception:
+                channel_infos = {}
 
             # 5. Build ranking
             rankings = []
@@ -366,15 +383,15 @@ async def get_youtuber_ranking(
                 if not data["videos"]:
                     continue
 
-                info = channel_infos.get(channel_id, {})
+                info = channel_infos.get(channel_id)
                 top_video = max(data["videos"], key=lambda x: x["views"])
 
                 rankings.append({
                     "channel_id": channel_id,
                     "channel_title": data["channel_title"],
-                    "thumbnail_url": info.get("thumbnail_url", ""),
-                    "subscriber_count": info.get("subscriber_count", 0),
-                    "total_views": info.get("view_count", 0),
+                    "thumbnail_url": info.thumbnail_url if info else "",
+                    "subscriber_count": info.subscriber_count if info else 0,
+                    "total_views": info.view_count if info else 0,
                     "video_count_for_keyword": len(data["videos"]),
                     "avg_views_per_video": data["total_views"] // len(data["videos"]),
                     "top_video_title": top_video["title"],
@@ -401,5 +418,8 @@ async def get_youtuber_ranking(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    except YouTubeCircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
     except YouTubeAPIError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -355,3 +355,11 @@ class CommentAnalyzeResponse(BaseModel):
         default_factory=datetime.utcnow,
         description="Analysis timestamp in UTC"
     )
+    stale: bool = Field(
+        default=False,
+        description="True if this is an earlier result served because YouTube API is unavailable"
+    )
+    partial: bool = Field(
+        default=False,
+        description="True if the deadline ran low and comments or reply threads were skipped"
+    )
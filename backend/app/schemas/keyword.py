@@ -158,3 +158,14 @@ class KeywordAnalyzeResponse(BaseModel):
         default_factory=datetime.utcnow,
         description="Analysis timestamp in UTC"
     )
+    stale: bool = Field(
+        default=False,
+        description=(
+            "True if served from an expired cache, while it is refreshed "
+            "in the background or because YouTube API is unavailable"
+        )
+    )
+    partial: bool = Field(
+        default=False,
+        description="True if the deadline ran low and search pages or channel stats were skipped"
+    )
@@ -11,6 +11,7 @@ from collections import Counter
 from typing import List, Dict, Any
 
 from app.schemas.comment import FrequentWord, ViewerRequest, ViewerQuestion, TopComment, SentimentAnalysis
+from app.services.youtube_records import Comment
 
 
 class CommentAnalyzerService:
@@ -102,20 +103,20 @@ class CommentAnalyzerService:
 
     def extract_frequent_words(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Comment]
     ) -> List[FrequentWord]:
         """
         Extract frequent words from comments.
 
         Args:
-            comments: List of comment dictionaries with 'text' field
+            comments: Comment records
 
         Returns:
             List of FrequentWord objects (max 20), sorted by frequency
         """
         all_words = []
         for comment in comments:
-            text = comment.get("text", "")
+            text = comment.text
             # 한글, 영문, 숫자만 추출
             words = re.findall(r'[가-힣a-zA-Z0-9]+', text)
             # 불용어 및 짧은 단어 제거
@@ -139,7 +140,7 @@ class CommentAnalyzerService:
 
     def extract_viewer_requests(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Comment]
     ) -> List[ViewerRequest]:
         """
         Extract viewer requests from comments based on patterns.
@@ -149,7 +150,7 @@ class CommentAnalyzerService:
         - 영어: please make, can you, would love to see
 
         Args:
-            comments: List of comment dictionaries
+            comments: Comment records
 
         Returns:
             List of ViewerRequest objects (max 10), sorted by like_count
@@ -159,7 +160,7 @@ class CommentAnalyzerService:
         patterns_en = [re.compile(p, re.IGNORECASE) for p in self.REQUEST_PATTERNS_EN]
 
         for comment in comments:
-            text = comment.get("text", "")
+            text = comment.text
             text_lower = text.lower()
 
             # 한국어 패턴 매칭
@@ -179,8 +180,8 @@ class CommentAnalyzerService:
             if matched:
                 requests.append(ViewerRequest(
                     text=text[:200],  # 긴 댓글 자르기
-                    like_count=comment.get("like_count", 0),
-                    author=comment.get("author_name", comment.get("author", "익명"))
+                    like_count=comment.like_count,
+                    author=comment.author_name or "익명"
                 ))
 
         # 좋아요 순 정렬
@@ -190,7 +191,7 @@ class CommentAnalyzerService:
 
     def analyze_sentiment(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Comment]
     ) -> SentimentAnalysis:
         """
         Analyze sentiment of comments using keyword-based approach.
@@ -201,7 +202,7 @@ class CommentAnalyzerService:
         - Neutral: Equal or no keywords
 
         Args:
-            comments: List of comment dictionaries
+            comments: Comment records
 
         Returns:
             SentimentAnalysis with ratios and total count
@@ -219,7 +220,7 @@ class CommentAnalyzerService:
         neutral_count = 0
 
         for comment in comments:
-            text = comment.get("text", "").lower()
+            text = comment.text.lower()
 
             # 긍정/부정 키워드 카운트
             pos_score = sum(1 for w in self.POSITIVE_WORDS if w in text)
@@ -243,13 +244,13 @@ class CommentAnalyzerService:
 
     def extract_viewer_questions(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Comment]
     ) -> List[ViewerQuestion]:
         """
         Extract questions from comments.
 
         Args:
-            comments: List of comment dictionaries
+            comments: Comment records
 
         Returns:
             List of ViewerQuestion objects (max 10), sorted by like_count
@@ -258,7 +259,7 @@ class CommentAnalyzerService:
         patterns = [re.compile(p, re.IGNORECASE) for p in self.QUESTION_PATTERNS]
 
         for comment in comments:
-            text = comment.get("text", "").strip()
+            text = comment.text.strip()
             if len(text) < 5:  # 너무 짧은 댓글 제외
                 continue
 
@@ -266,8 +267,8 @@ class CommentAnalyzerService:
                 if pattern.match(text):
                     questions.append(ViewerQuestion(
                         text=text[:200],
-                        like_count=comment.get("like_count", 0),
-                        author=comment.get("author_name", comment.get("author", "익명"))
+                        like_count=comment.like_count,
+                        author=comment.author_name or "익명"
                     ))
                     break
 
@@ -277,44 +278,44 @@ class CommentAnalyzerService:
 
     def extract_top_comments(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Comment]
     ) -> List[TopComment]:
         """
         Extract top engaging comments by likes.
 
         Args:
-            comments: List of comment dictionaries
+            comments: Comment records
 
         Returns:
             List of TopComment objects (max 5), sorted by like_count
         """
         sorted_comments = sorted(
             comments,
-            key=lambda x: x.get("like_count", 0),
+            key=lambda x: x.like_count,
             reverse=True
         )
 
         top_comments = []
         for comment in sorted_comments[:5]:
-            text = comment.get("text", "").strip()
+            text = comment.text.strip()
             if text:
                 top_comments.append(TopComment(
                     text=text[:200],
-                    like_count=comment.get("like_count", 0),
-                    author=comment.get("author_name", comment.get("author", "익명"))
+                    like_count=comment.like_count,
+                    author=comment.author_name or "익명"
                 ))
 
         return top_comments
 
     async def analyze_all(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Comment]
     ) -> Dict[str, Any]:
         """
         Execute all analysis operations.
 
         Args:
-            comments: List of comment dictionaries
+            comments: Comment records
 
         Returns:
             Dictionary with all analysis results
@@ -3,12 +3,21 @@ Comment Collection Service
 
 Collects and processes YouTube video comments for analysis.
 """
+from collections import OrderedDict
+from contextlib import aclosing
 from datetime import datetime
 import re
 import logging
-from typing import List, Dict, Any
-
-from app.services.youtube import YouTubeAPIClient, YouTubeAPIError
+from typing import List, Dict, Any, Optional
+
+from app.core.config import settings
+from app.core.deadline import Deadline, deadline_scope
+from app.services.youtube import (
+    YouTubeAPIClient,
+    YouTubeAPIError,
+    YouTubeCircuitOpenError,
+    YouTubeDeadlineExceededError,
+)
 from app.services.comment_analyzer import CommentAnalyzerService
 from app.schemas.comment import VideoInfo, CommentAnalyzeResponse
 
@@ -22,60 +31,151 @@ class CommentCollectorService:
     This service handles:
     - Extracting video ID from various YouTube URL formats
     - Fetching video details via YouTube Data API
-    - Collecting comments (max 100 for T2.1)
+    - Streaming comments page by page (up to settings.YOUTUBE_COMMENT_LIMIT)
+    - Completing reply threads the comment pages only partly include
+    - Stopping comment paging and skipping reply fetching when the request
+      deadline runs low, returning the partial analysis flagged as such
     - Preparing data structure for analysis (T2.2)
+    - Serving the last result per video, marked stale, while the YouTube API
+      circuit breaker is open
     """
 
     # YouTube video ID is always 11 characters
     VIDEO_ID_LENGTH = 11
 
-    def __init__(self):
-        """Initialize the comment collector service."""
+    # Last analysis per video, shared across instances (LRU, in-memory)
+    LAST_RESULTS_MAX_ENTRIES = 200
+    _last_results: "OrderedDict[str, CommentAnalyzeResponse]" = OrderedDict()
+
+    def __init__(self, youtube_client: Optional[YouTubeAPIClient] = None):
+        """
+        Initialize the comment collector service.
+
+        Args:
+            youtube_client: YouTube API client to reuse. If not provided, a client
+                bound to the shared HTTP connection pool is created per call.
+        """
+        self.youtube_client = youtube_client
         self.analyzer = CommentAnalyzerService()
 
-    async def collect_comments(self, video_url: str) -> CommentAnalyzeResponse:
+    async def collect_comments(
+        self, video_url: str, deadline: Optional[Deadline] = None
+    ) -> CommentAnalyzeResponse:
         """
         Collect comments from a YouTube video and prepare analysis response.
 
         Args:
             video_url: YouTube video URL (validated by Pydantic schema)
+            deadline: Time budget for the analysis. When it runs low, the
+                comments collected so far are analyzed without completing
+                reply threads and the result has partial=True. None means
+                no deadline.
 
         Returns:
-            CommentAnalyzeResponse with video info and empty analysis fields
+            CommentAnalyzeResponse with video info and analysis. While the
+            YouTube API circuit is open, the last result for the video is
+            returned with stale=True.
 
         Raises:
             ValueError: If video ID cannot be extracted or video not found
             YouTubeAPIError: If API request fails
+            YouTubeCircuitOpenError: If the circuit is open and no earlier result exists
+            YouTubeDeadlineExceededError: If the deadline passes before the video
+                details and first comment page arrive
         """
         # Extract video ID from URL
         video_id = self._extract_video_id(video_url)
         logger.info(f"Extracting video ID: {video_id} from URL: {video_url}")
 
-        async with YouTubeAPIClient() as client:
+        try:
+            with deadline_scope(deadline):
+                result = await self._collect_and_analyze(video_id, deadline)
+        except YouTubeCircuitOpenError:
+            last_result = self._last_results.get(video_id)
+            if last_result is None:
+                raise
+            logger.warning(
+                f"YouTube API circuit open; returning stale analysis for video {video_id}"
+            )
+            return last_result.model_copy(update={"stale": True})
+
+        self._remember_result(video_id, result)
+        return result
+
+    async def _collect_and_analyze(
+        self, video_id: str, deadline: Optional[Deadline] = None
+    ) -> CommentAnalyzeResponse:
+        """
+        Fetch video details and comments from YouTube and analyze them.
+
+        Args:
+            video_id: 11-character video ID
+            deadline: Time budget for the analysis (see collect_comments)
+
+        Returns:
+            CommentAnalyzeResponse with video info and analysis
+
+        Raises:
+            ValueError: If video not found
+            YouTubeAPIError: If API request fails
+        """
+        async with (self.youtube_client or YouTubeAPIClient()) as client:
             # 1. Fetch video details
             video_details = await client.get_video_details(video_id)
-            logger.info(f"Fetched video details: {video_details['title']}")
+            logger.info(f"Fetched video details: {video_details.title}")
 
-            # 2. Collect comments (max 100 for API quota efficiency)
-            comments = await client.get_video_comments(
+            # 2. Collect comments, following pages up to the configured ceiling
+            # or until the deadline runs low
+            comments = []
+            partial = False
+            pages = client.iter_video_comments(
                 video_id,
-                max_results=100,
+                limit=settings.YOUTUBE_COMMENT_LIMIT,
                 order="relevance"
             )
-            logger.info(f"Collected {len(comments)} comments for video {video_id}")
+            try:
+                async with aclosing(pages):
+                    async for page in pages:
+                        comments.extend(page)
+                        if deadline is not None and deadline.running_low:
+                            logger.warning(
+                                f"Stopped comment paging for video {video_id}: "
+                                "deadline running low"
+                            )
+                            partial = True
+                            break
+            except YouTubeDeadlineExceededError:
+                if not comments:
+                    raise
+                partial = True
+
+            # Replies are analyzed alongside the top-level comments
+            if deadline is not None and deadline.running_low:
+                # No time to complete the threads; keep the replies they embed
+                replies = [reply for comment in comments for reply in comment.replies]
+                partial = partial or any(c.reply_count > len(c.replies) for c in comments)
+            else:
+                thread_replies = await client.get_thread_replies(comments)
+                replies = [reply for thread in thread_replies.values() for reply in thread]
+                # Threads that ran out of time kept only their embedded replies
+                partial = partial or (deadline is not None and deadline.expired)
+            logger.info(
+                f"Collected {len(comments)} comments and {len(replies)} replies "
+                f"for video {video_id}"
+            )
 
             # 3. Build VideoInfo schema
             video_info = VideoInfo(
                 video_id=video_id,
-                title=video_details["title"],
-                channel_title=video_details["channel_title"],
-                view_count=video_details["view_count"],
-                comment_count=video_details["comment_count"]
+                title=video_details.title,
+                channel_title=video_details.channel_title,
+                view_count=video_details.view_count,
+                comment_count=video_details.comment_count
             )
 
             # 4. Analyze comments (T2.2)
-            analysis = await self.analyzer.analyze_all(comments)
-            logger.info(f"Text analysis completed for {len(comments)} comments")
+            analysis = await self.analyzer.analyze_all(comments + replies)
+            logger.info(f"Text analysis completed for {len(comments) + len(replies)} comments")
 
             # 5. Return complete analysis response
             return CommentAnalyzeResponse(
@@ -85,9 +185,24 @@ class CommentCollectorService:
                 viewer_questions=analysis["viewer_questions"],
                 top_comments=analysis["top_comments"],
                 sentiment=analysis["sentiment"],
-                analyzed_at=datetime.utcnow()
+                analyzed_at=datetime.utcnow(),
+                partial=partial
             )
 
+    @classmethod
+    def _remember_result(cls, video_id: str, result: CommentAnalyzeResponse) -> None:
+        """
+        Keep a result as the stale fallback for its video, evicting the oldest if full.
+
+        Args:
+            video_id: 11-character video ID
+            result: Fresh analysis result
+        """
+        cls._last_results[video_id] = result
+        cls._last_results.move_to_end(video_id)
+        while len(cls._last_results) > cls.LAST_RESULTS_MAX_ENTRIES:
+            cls._last_results.popitem(last=False)
+
     def _extract_video_id(self, url: str) -> str:
         """
         Extract YouTube video ID from various URL formats.
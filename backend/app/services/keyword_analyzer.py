@@ -2,46 +2,87 @@
 Keyword Analyzer Service
 Analyzes YouTube keywords using search metrics, competition, and related keywords.
 """
+import asyncio
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from contextlib import aclosing
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
-from app.services.youtube import YouTubeAPIClient
+from app.core.config import settings
+from app.core.deadline import Deadline, deadline_scope
+from app.services.keyword_cache import KeywordAnalysisCache, get_keyword_cache
+from app.services.youtube import YouTubeAPIClient, YouTubeAPIError, YouTubeCircuitOpenError
 from app.models.analysis import KeywordAnalysis
+from app.services.youtube_records import SearchResult, VideoDetails
 
 logger = logging.getLogger(__name__)
 
+# Background refreshes of stale cached analyses, at most one per keyword
+_refresh_tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+
+def _release_refresh(keyword: str, task: "asyncio.Task[None]") -> None:
+    """Forget a finished refresh task"""
+    if _refresh_tasks.get(keyword) is task:
+        del _refresh_tasks[keyword]
+    if not task.cancelled():
+        task.exception()
+
+
+async def cancel_keyword_refreshes() -> None:
+    """Cancel pending background refreshes (application shutdown)."""
+    tasks = list(_refresh_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class KeywordAnalyzerService:
     """
     Service for analyzing YouTube keywords.
 
     Features:
-    - Search volume estimation (based on YouTube search results)
+    - Search volume estimation (based on up to settings.YOUTUBE_SEARCH_LIMIT
+      search results, one page by default; larger limits page while results
+      stay relevant and are scaled to a one-page sample)
     - Competition analysis (based on top videos' performance)
     - Recommendation score calculation
     - Related keyword extraction (5-10 keywords)
-    - Database caching with 7-day TTL
+    - Request deadlines: optional lookups are skipped when time runs low and
+      the result is flagged partial (and not cached)
+    - Database caching with 7-day TTL, stale-while-revalidate up to 14 days
+    - In-process LRU of fresh cached analyses, so hot keywords skip the database
 
     Constants:
-    - CACHE_TTL_DAYS: How long to cache analysis results
-    - MAX_SEARCH_RESULTS: Maximum videos to fetch for analysis
+    - CACHE_TTL_DAYS: How long cached analysis results are fresh
+    - CACHE_HARD_TTL_DAYS: Age up to which expired results are served (stale)
+      while a background task refreshes them
     - TOP_VIDEOS_FOR_COMPETITION: Top N videos to analyze for competition
+    - COMPETITION_VIDEO_FIELDS / COMPETITION_CHANNEL_FIELDS: Partial-response projections
     - MAX_RELATED_KEYWORDS: Maximum related keywords to return (10)
     - MIN_RELATED_KEYWORDS: Minimum related keywords to guarantee (5)
     - PHRASE_LENGTHS: Word lengths for phrase extraction (2-4 words)
+    - VOLUME_SAMPLE_SIZE: Result count search volume estimates are scaled to
     """
 
     CACHE_TTL_DAYS = 7
-    MAX_SEARCH_RESULTS = 50
+    CACHE_HARD_TTL_DAYS = 14
     TOP_VIDEOS_FOR_COMPETITION = 10
     MAX_RELATED_KEYWORDS = 10
     MIN_RELATED_KEYWORDS = 5
     PHRASE_LENGTHS = [2, 3, 4]
 
+    # Only the fields competition scoring reads are requested from the API
+    COMPETITION_VIDEO_FIELDS = ["channel_id", "published_at", "view_count", "like_count"]
+    COMPETITION_CHANNEL_FIELDS = ["subscriber_count"]
+
+    # Search volume is estimated on the scale of one 50-result search page
+    VOLUME_SAMPLE_SIZE = 50
+
     # Related keyword estimation parameters
     VOLUME_MULTIPLIER = 100
     MAX_ESTIMATED_VOLUME = 5000
@@ -49,25 +90,46 @@ class KeywordAnalyzerService:
     COMPETITION_INCREMENT = 0.05
     MAX_COMPETITION = 0.9
 
-    def __init__(self, db: AsyncSession, youtube_client: YouTubeAPIClient):
+    def __init__(
+        self,
+        db: AsyncSession,
+        youtube_client: YouTubeAPIClient,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        cache: Optional[KeywordAnalysisCache] = None
+    ):
         """
         Initialize analyzer with database session and YouTube client.
 
         Args:
             db: SQLAlchemy async session
             youtube_client: YouTube API client
+            session_factory: Session factory for background refreshes, which
+                outlive the request's session (default: bound to db's engine)
+            cache: In-memory cache in front of the database (default: shared
+                cache from settings, None if disabled there)
         """
         self.db = db
         self.youtube_client = youtube_client
+        self.session_factory = session_factory
+        self.cache = cache if cache is not None else get_keyword_cache()
 
-    async def analyze(self, keyword: str) -> Dict[str, Any]:
+    async def analyze(
+        self, keyword: str, deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Analyze a keyword and return metrics with related keywords.
 
         Uses cache if available and not expired, otherwise performs fresh analysis.
+        An expired cached analysis younger than CACHE_HARD_TTL_DAYS is returned
+        right away with "stale": True while a background task refreshes it.
+        Older ones are re-analyzed, except while the YouTube API circuit
+        breaker is open, when they are returned stale instead of failing.
 
         Args:
             keyword: Keyword to analyze
+            deadline: Time budget for the analysis. When it runs low, further
+                search pages and channel lookups are skipped and the result
+                is returned with "partial": True. None means no deadline.
 
         Returns:
             Dict with structure:
@@ -79,36 +141,98 @@ class KeywordAnalyzerService:
                     "recommendation_score": float
                 },
                 "related_keywords": List[Dict],
-                "analyzed_at": datetime
+                "analyzed_at": datetime,
+                "stale": bool,
+                "partial": bool
             }
 
         Raises:
             ValueError: If keyword is invalid
             YouTubeAPIError: If YouTube API fails
+            YouTubeDeadlineExceededError: If the deadline passes before the
+                first search page arrives
         """
         keyword = keyword.strip()
         if not keyword:
             raise ValueError("Keyword cannot be empty")
 
-        # Check cache first
+        # Check the in-memory cache, then the database
+        if self.cache is not None:
+            analysis = self.cache.get(keyword)
+            if analysis is not None:
+                logger.debug(f"Returning in-memory cached analysis for keyword: {keyword}")
+                return {**analysis, "stale": False, "partial": False}
+
         cached = await self._get_cached_analysis(keyword)
         if cached and not cached.is_expired():
             logger.info(f"Returning cached analysis for keyword: {keyword}")
-            return cached.to_dict()
+            analysis = cached.to_dict()
+            if self.cache is not None:
+                self.cache.set(keyword, analysis, cached.expires_at)
+            return {**analysis, "stale": False, "partial": False}
+
+        if cached and not cached.is_older_than(self.CACHE_HARD_TTL_DAYS):
+            logger.info(f"Returning stale analysis for keyword {keyword}; refreshing")
+            self._refresh_in_background(keyword)
+            return {**cached.to_dict(), "stale": True, "partial": False}
+
+        try:
+            with deadline_scope(deadline):
+                return await self._analyze_fresh(keyword, deadline)
+        except YouTubeCircuitOpenError:
+            if cached is None:
+                raise
+            logger.warning(
+                f"YouTube API circuit open; returning stale analysis for keyword: {keyword}"
+            )
+            return {**cached.to_dict(), "stale": True, "partial": False}
 
-        # Perform fresh analysis
+    async def _analyze_fresh(
+        self, keyword: str, deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze a keyword against the YouTube API and save the result to cache.
+
+        Partial results (some search pages or lookups skipped or failed) are
+        returned but not cached.
+
+        Args:
+            keyword: Normalized keyword to analyze
+            deadline: Time budget for the analysis (see analyze)
+
+        Returns:
+            Analysis dict (see analyze)
+
+        Raises:
+            YouTubeAPIError: If YouTube API fails
+        """
         logger.info(f"Performing fresh analysis for keyword: {keyword}")
         async with self.youtube_client:
-            # Get search results for the keyword
-            search_results = await self.youtube_client.search_videos(
-                query=keyword,
-                max_results=self.MAX_SEARCH_RESULTS,
-                order="relevance"
+            # Get search results for the keyword. Competition only needs the
+            # top videos, so it is scored from the first page while the
+            # remaining pages are still being fetched.
+            pages = self.youtube_client.iter_search_results(
+                keyword,
+                order="relevance",
+                min_relevance=settings.YOUTUBE_SEARCH_MIN_RELEVANCE
+            )
+            async with aclosing(pages):
+                first_page = await anext(pages, [])
+                # Subscriber counts only refine the score; skip them when short on time
+                include_channels = deadline is None or not deadline.running_low
+                (more_results, complete), (competition, scored) = await asyncio.gather(
+                    self._collect_remaining_pages(keyword, pages, deadline),
+                    self._calculate_competition(first_page, include_channels),
+                )
+            search_results = first_page + more_results
+            # Lookups that failed or ran out of time fell back to defaults
+            partial = (
+                not complete or not scored or not include_channels
+                or (deadline is not None and deadline.expired)
             )
 
             # Calculate metrics
             search_volume = await self._estimate_search_volume(keyword, search_results)
-            competition = await self._calculate_competition(search_results)
             recommendation_score = self._calculate_recommendation_score(
                 search_volume, competition
             )
@@ -118,7 +242,7 @@ class KeywordAnalyzerService:
                 keyword, search_results
             )
 
-        # Save to cache
+        # Save to cache (partial results would be served in full for days)
         analysis_data = {
             "keyword": keyword,
             "search_volume": search_volume,
@@ -128,7 +252,10 @@ class KeywordAnalyzerService:
             "analyzed_at": datetime.utcnow(),
         }
 
-        await self._save_to_cache(analysis_data)
+        if partial:
+            logger.warning(f"Returning partial analysis for keyword {keyword}; not cached")
+        else:
+            await self._save_to_cache(analysis_data)
 
         return {
             "keyword": keyword,
@@ -139,8 +266,81 @@ class KeywordAnalyzerService:
             },
             "related_keywords": related_keywords,
             "analyzed_at": analysis_data["analyzed_at"],
+            "stale": False,
+            "partial": partial,
         }
 
+    def _refresh_in_background(self, keyword: str) -> None:
+        """
+        Start re-analyzing a keyword unless a refresh is already running.
+
+        Args:
+            keyword: Normalized keyword to refresh
+        """
+        if keyword in _refresh_tasks:
+            return
+        task = asyncio.create_task(self._refresh(keyword))
+        _refresh_tasks[keyword] = task
+        task.add_done_callback(lambda done: _release_refresh(keyword, done))
+
+    async def _refresh(self, keyword: str) -> None:
+        """
+        Re-analyze a keyword in its own database session and update the cache.
+
+        Failures are logged; the stale result stays cached until the next try.
+
+        Args:
+            keyword: Normalized keyword to refresh
+        """
+        session_factory = self.session_factory or async_sessionmaker(
+            self.db.bind, expire_on_commit=False
+        )
+        try:
+            # The request's deadline does not apply to the refresh
+            with deadline_scope(None):
+                async with session_factory() as session:
+                    refresher = KeywordAnalyzerService(
+                        session, self.youtube_client, cache=self.cache
+                    )
+                    await refresher._analyze_fresh(keyword)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Background refresh failed for keyword {keyword}: {e}")
+
+    @staticmethod
+    async def _collect_remaining_pages(
+        keyword: str,
+        pages: AsyncIterator[List[SearchResult]],
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[List[SearchResult], bool]:
+        """
+        Collect the search pages after the first one.
+
+        A failing page or a deadline running low ends collection; the
+        analysis uses the results so far.
+
+        Args:
+            keyword: Searched keyword (for logging)
+            pages: Search page stream, first page already consumed
+            deadline: Time budget of the analysis
+
+        Returns:
+            Tuple of (search results of the remaining pages, False if
+            collection stopped before the stream ended)
+        """
+        results: List[SearchResult] = []
+        try:
+            while deadline is None or not deadline.running_low:
+                page = await anext(pages, None)
+                if page is None:
+                    return results, True
+                results.extend(page)
+            logger.warning(f"Stopped search paging for keyword {keyword}: deadline running low")
+        except YouTubeAPIError as e:
+            logger.warning(f"Stopped search paging for keyword {keyword}: {e}")
+        return results, False
+
     async def _get_cached_analysis(self, keyword: str) -> Optional[KeywordAnalysis]:
         """
         Retrieve cached analysis from database.
@@ -157,44 +357,69 @@ class KeywordAnalyzerService:
 
     async def _save_to_cache(self, analysis_data: Dict[str, Any]) -> None:
         """
-        Save or update analysis in database cache.
+        Save or update analysis in database cache and the in-memory cache.
+
+        If a concurrent first analysis of the keyword inserts its row in the
+        meantime, that row is updated instead.
 
         Args:
             analysis_data: Analysis data to cache
         """
+        keyword = analysis_data["keyword"]
+        expires_at = KeywordAnalysis.create_expires_at(self.CACHE_TTL_DAYS)
+        if self.cache is not None:
+            self.cache.invalidate(keyword)
+
+        columns = {
+            "search_volume": analysis_data["search_volume"],
+            "competition": analysis_data["competition"],
+            "recommendation_score": analysis_data["recommendation_score"],
+            "related_keywords": analysis_data["related_keywords"],
+            "analyzed_at": analysis_data["analyzed_at"],
+            "expires_at": expires_at,
+        }
+
         # Check if already exists
-        existing = await self._get_cached_analysis(analysis_data["keyword"])
+        existing = await self._get_cached_analysis(keyword)
 
-        if existing:
-            # Update existing record
-            existing.search_volume = analysis_data["search_volume"]
-            existing.competition = analysis_data["competition"]
-            existing.recommendation_score = analysis_data["recommendation_score"]
-            existing.related_keywords = analysis_data["related_keywords"]
-            existing.analyzed_at = analysis_data["analyzed_at"]
-            existing.expires_at = KeywordAnalysis.create_expires_at(self.CACHE_TTL_DAYS)
-        else:
+        if existing is None:
             # Create new record
-            new_analysis = KeywordAnalysis(
-                keyword=analysis_data["keyword"],
-                search_volume=analysis_data["search_volume"],
-                competition=analysis_data["competition"],
-                recommendation_score=analysis_data["recommendation_score"],
-                related_keywords=analysis_data["related_keywords"],
-                analyzed_at=analysis_data["analyzed_at"],
-                expires_at=KeywordAnalysis.create_expires_at(self.CACHE_TTL_DAYS),
-            )
-            self.db.add(new_analysis)
+            self.db.add(KeywordAnalysis(keyword=keyword, **columns))
+            try:
+                await self.db.commit()
+            except IntegrityError:
+                # Lost the insert race (unique keyword); update the winner's row
+                await self.db.rollback()
+                existing = await self._get_cached_analysis(keyword)
 
-        await self.db.commit()
+        if existing is not None:
+            # Update existing record
+            for name, value in columns.items():
+                setattr(existing, name, value)
+            await self.db.commit()
+
+        if self.cache is not None:
+            self.cache.set(keyword, {
+                "keyword": keyword,
+                "metrics": {
+                    "search_volume": analysis_data["search_volume"],
+                    "competition": analysis_data["competition"],
+                    "recommendation_score": analysis_data["recommendation_score"],
+                },
+                "related_keywords": analysis_data["related_keywords"],
+                "analyzed_at": analysis_data["analyzed_at"],
+            }, expires_at)
 
     async def _estimate_search_volume(
-        self, keyword: str, search_results: List[Dict[str, Any]]
+        self, keyword: str, search_results: List[SearchResult]
     ) -> int:
         """
         Estimate monthly search volume based on search results.
 
         Uses number of results and video ages to estimate popularity.
+        Samples larger than VOLUME_SAMPLE_SIZE (paged search) are scaled
+        down to it, so estimates stay comparable whatever
+        settings.YOUTUBE_SEARCH_LIMIT is.
 
         Args:
             keyword: The search keyword
@@ -212,7 +437,7 @@ class KeywordAnalyzerService:
         # Analyze video ages to estimate trend
         recent_videos = 0
         for video in search_results:
-            published_at = video.get("published_at")
+            published_at = video.published_at
             if published_at:
                 age_days = (datetime.utcnow().replace(tzinfo=None) -
                            published_at.replace(tzinfo=None)).days
@@ -224,13 +449,15 @@ class KeywordAnalyzerService:
         trend_bonus = recent_videos * 50  # Bonus for recent uploads
 
         estimated_volume = base_volume + trend_bonus
+        if result_count > self.VOLUME_SAMPLE_SIZE:
+            estimated_volume = estimated_volume * self.VOLUME_SAMPLE_SIZE // result_count
 
         # Cap at reasonable maximum
         return min(estimated_volume, 100000)
 
     async def _calculate_competition(
-        self, search_results: List[Dict[str, Any]]
-    ) -> float:
+        self, search_results: List[SearchResult], include_channels: bool = True
+    ) -> Tuple[float, bool]:
         """
         Calculate competition level (0.0 to 1.0) based on top videos' performance.
 
@@ -238,74 +465,124 @@ class KeywordAnalyzerService:
 
         Args:
             search_results: List of video search results
+            include_channels: Look up channel subscriber counts (scored as 0 if not)
 
         Returns:
-            Competition score (0.0 = low competition, 1.0 = high competition)
+            Tuple of (competition score, whether all lookups succeeded). The
+            score is 0.0 for low and 1.0 for high competition; lookups that
+            failed are scored with defaults.
         """
         if not search_results:
-            return 0.0
+            return 0.0, True
 
         # Analyze top videos (up to TOP_VIDEOS_FOR_COMPETITION)
         top_videos = search_results[:self.TOP_VIDEOS_FOR_COMPETITION]
+        video_ids = [video.video_id for video in top_videos if video.video_id]
+        if not video_ids:
+            return 0.5, True
+
+        # Search results already carry channel IDs, so video statistics and
+        # channel subscriber counts are fetched concurrently, not one after another
+        channel_ids = [
+            video.channel_id for video in top_videos if video.channel_id and include_channels
+        ]
+        (video_details, videos_ok), (channel_infos, channels_ok) = await asyncio.gather(
+            self._fetch_or_empty(
+                self.youtube_client.get_videos_details(
+                    video_ids, fields=self.COMPETITION_VIDEO_FIELDS
+                ),
+                "Failed to get video details"
+            ),
+            self._fetch_or_empty(
+                self.youtube_client.get_channels_info(
+                    channel_ids, fields=self.COMPETITION_CHANNEL_FIELDS
+                ),
+                "Failed to get channel info"
+            ),
+        )
 
         competition_scores = []
-        for video in top_videos:
-            video_id = video.get("video_id")
-            if not video_id:
+        for video_id in video_ids:
+            details = video_details.get(video_id)
+            if not details:
+                logger.warning(f"Failed to analyze video {video_id}: not found")
                 continue
 
             try:
-                # Get detailed video statistics
-                details = await self.youtube_client.get_video_details(video_id)
-
-                view_count = details.get("view_count", 0)
-                like_count = details.get("like_count", 0)
-
-                # Get channel info for subscriber count
-                channel_id = details.get("channel_id")
-                if channel_id:
-                    try:
-                        channel_info = await self.youtube_client.get_channel_info(channel_id)
-                        subscriber_count = channel_info.get("subscriber_count", 0)
-                    except Exception as e:
-                        logger.warning(f"Failed to get channel info: {e}")
-                        subscriber_count = 0
-                else:
-                    subscriber_count = 0
-
-                # Calculate video age in days
-                published_at = details.get("published_at")
-                if published_at:
-                    age_days = max(1, (datetime.utcnow().replace(tzinfo=None) -
-                                      published_at.replace(tzinfo=None)).days)
-                else:
-                    age_days = 1
-
-                # Normalize metrics
-                views_per_day = view_count / age_days
-                normalized_views = min(views_per_day / 10000, 1.0)  # Cap at 10k/day
-                normalized_subs = min(subscriber_count / 1000000, 1.0)  # Cap at 1M subs
-                normalized_engagement = min(like_count / view_count if view_count > 0 else 0, 0.1) * 10
-
-                # Competition score for this video
-                video_score = (
-                    normalized_views * 0.5 +
-                    normalized_subs * 0.3 +
-                    normalized_engagement * 0.2
+                channel = channel_infos.get(details.channel_id)
+                competition_scores.append(
+                    self._score_video_competition(
+                        details, channel.subscriber_count if channel else 0
+                    )
                 )
-                competition_scores.append(video_score)
-
             except Exception as e:
                 logger.warning(f"Failed to analyze video {video_id}: {e}")
                 continue
 
+        complete = videos_ok and channels_ok
         if not competition_scores:
-            return 0.5  # Medium competition if we couldn't analyze
+            return 0.5, complete  # Medium competition if we couldn't analyze
 
         # Average competition across top videos
         avg_competition = sum(competition_scores) / len(competition_scores)
 
-        return round(min(max(avg_competition, 0.0), 1.0), 2)
+        return round(min(max(avg_competition, 0.0), 1.0), 2), complete
+
+    @staticmethod
+    async def _fetch_or_empty(
+        coro: Awaitable[Dict[str, Any]], message: str
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Await a batched lookup, logging and returning {} on failure.
+
+        Args:
+            coro: Batched lookup awaitable
+            message: Log message prefix on failure
+
+        Returns:
+            Tuple of (lookup result or empty dict, whether the lookup succeeded)
+        """
+        try:
+            return await coro, True
+        except Exception as e:
+            logger.warning(f"{message}: {e}")
+            return {}, False
+
+    def _score_video_competition(
+        self, details: VideoDetails, subscriber_count: int
+    ) -> float:
+        """
+        Calculate a single video's competition score.
+
+        Args:
+            details: Video details (view_count, like_count, published_at)
+            subscriber_count: Subscriber count of the video's channel
+
+        Returns:
+            Competition score for this video
+        """
+        view_count = details.view_count
+        like_count = details.like_count
+
+        # Calculate video age in days
+        published_at = details.published_at
+        if published_at:
+            age_days = max(1, (datetime.utcnow().replace(tzinfo=None) -
+                              published_at.replace(tzinfo=None)).days)
+        else:
+            age_days = 1
+
+        # Normalize metrics
+        views_per_day = view_count / age_days
+        normalized_views = min(views_per_day / 10000, 1.0)  # Cap at 10k/day
+        normalized_subs = min(subscriber_count / 1000000, 1.0)  # Cap at 1M subs
+        normalized_engagement = min(like_count / view_count if view_count > 0 else 0, 0.1) * 10
+
+        return (
+            normalized_views * 0.5 +
+            normalized_subs * 0.3 +
+            normalized_engagement * 0.2
+        )
 
     def _calculate_recommendation_score(
         self, search_volume: int, competition: float
@@ -332,7 +609,7 @@ class KeywordAnalyzerService:
         return round(min(max(score, 0.0), 1.0), 2)
 
     async def _extract_related_keywords(
-        self, keyword: str, search_results: List[Dict[str, Any]]
+        self, keyword: str, search_results: List[SearchResult]
     ) -> List[Dict[str, Any]]:
         """
         Extract related keywords from video titles.
@@ -361,7 +638,7 @@ class KeywordAnalyzerService:
         keyword_lower = keyword.lower()
 
         for video in search_results:
-            title = video.get("title", "")
+            title = video.title
             if not title:
                 continue
 
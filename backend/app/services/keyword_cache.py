@@ -0,0 +1,131 @@
+"""
+Keyword Analysis Cache
+In-process LRU of serialized keyword analyses in front of the keyword_analyses table.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+
+from app.core.config import settings
+
+
+class KeywordAnalysisCache:
+    """
+    Bounded in-memory cache of fresh keyword analyses
+
+    Entries are analysis dicts (KeywordAnalysis.to_dict() shape) keyed by
+    normalized keyword, and expire at the database row's expires_at, so a
+    hit is exactly what the table would have returned. Expired rows are
+    never cached here; stale-while-revalidate is left to the table. The
+    least recently used entry is evicted once max_entries is reached.
+
+    Cached dicts are shared between callers and must not be mutated.
+    Not thread-safe; meant to be shared by coroutines on one event loop.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        """
+        Initialize keyword analysis cache
+
+        Args:
+            max_entries: Maximum number of cached analyses
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[datetime, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached analysis that has not expired
+
+        Args:
+            keyword: Normalized keyword
+
+        Returns:
+            Analysis dict, or None on a miss
+        """
+        entry = self._entries.get(keyword)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, analysis = entry
+        if datetime.utcnow() >= expires_at:
+            del self._entries[keyword]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(keyword)
+        self.hits += 1
+        return analysis
+
+    def set(self, keyword: str, analysis: Dict[str, Any], expires_at: datetime) -> None:
+        """
+        Cache an analysis until its expiry
+
+        Args:
+            keyword: Normalized keyword
+            analysis: Analysis dict (KeywordAnalysis.to_dict() shape)
+            expires_at: Naive UTC expiry of the database row
+        """
+        if self.max_entries <= 0 or datetime.utcnow() >= expires_at:
+            return
+        self._entries[keyword] = (expires_at, analysis)
+        self._entries.move_to_end(keyword)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keyword: str) -> None:
+        """
+        Drop a keyword's cached analysis
+
+        Args:
+            keyword: Normalized keyword
+        """
+        self._entries.pop(keyword, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size, max_entries, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Process-wide keyword analysis cache shared by all KeywordAnalyzerService instances
+_keyword_cache: Optional[KeywordAnalysisCache] = None
+
+
+def get_keyword_cache() -> Optional[KeywordAnalysisCache]:
+    """
+    Get the shared keyword analysis cache
+
+    Returns:
+        KeywordAnalysisCache instance, or None if KEYWORD_CACHE_MAX_ENTRIES is 0
+    """
+    global _keyword_cache
+    if settings.KEYWORD_CACHE_MAX_ENTRIES <= 0:
+        return None
+    if _keyword_cache is None:
+        _keyword_cache = KeywordAnalysisCache(max_entries=settings.KEYWORD_CACHE_MAX_ENTRIES)
+    return _keyword_cache
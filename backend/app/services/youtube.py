@@ -3,19 +3,80 @@ YouTube Data API v3 Service
 Provides async interface to YouTube API for video search, details, comments, and channel info.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable, Set, Tuple
+from contextlib import aclosing
+import asyncio
 import httpx
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import json
 import logging
+import random
+import time
+
+try:
+    import orjson  # optional, decodes several times faster than the stdlib
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 from app.core.config import settings
+from app.core.deadline import Deadline, current_deadline, deadline_scope
+from app.services.youtube_breaker import CircuitBreaker, get_circuit_breaker
+from app.services.youtube_cache import ResponseCache, get_response_cache
+from app.services.youtube_hedge import RequestHedger, get_request_hedger
+from app.services.youtube_limiter import RateLimiter, get_rate_limiter
+from app.services.youtube_quota import (
+    APIKeyPool,
+    QuotaLedger,
+    configured_api_keys,
+    get_key_pool,
+)
+from app.services.youtube_records import Channel, Comment, SearchResult, VideoDetails
+from app.services.youtube_replay import create_replay_transport
 
 logger = logging.getLogger(__name__)
 
+# In-flight upstream requests keyed by YouTubeAPIClient._flight_key (single-flight)
+_inflight_requests: Dict[Tuple[Any, ...], "asyncio.Future[Dict[str, Any]]"] = {}
+# Deadline each in-flight request runs under: the latest of its callers' (None = unbounded)
+_inflight_deadlines: Dict[Tuple[Any, ...], Optional[Deadline]] = {}
+
+
+def decode_json(content: bytes) -> Any:
+    """
+    Decode a JSON response body straight from bytes
+
+    Uses orjson when installed, otherwise the stdlib decoder. Decoding raw
+    bytes skips the intermediate str httpx's Response.json() builds.
+
+    Raises:
+        ValueError: If content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _release_inflight(key: Tuple[Any, ...], task: "asyncio.Future[Dict[str, Any]]") -> None:
+    """Forget a finished in-flight request and mark its exception as retrieved"""
+    if _inflight_requests.get(key) is task:
+        del _inflight_requests[key]
+        _inflight_deadlines.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
 
 class YouTubeAPIError(Exception):
     """Base exception for YouTube API errors"""
-    pass
+
+    def __init__(self, message: str = "", reasons: Iterable[str] = ()):
+        """
+        Args:
+            message: Error message
+            reasons: error.errors[].reason values of the API error response
+        """
+        super().__init__(message)
+        self.reasons: Set[str] = set(reasons)
 
 
 class YouTubeAPIKeyError(YouTubeAPIError):
@@ -28,268 +89,1061 @@ class YouTubeQuotaExceededError(YouTubeAPIError):
     pass
 
 
+class YouTubeCircuitOpenError(YouTubeAPIError):
+    """Raised without contacting the API while the circuit breaker is open"""
+    pass
+
+
+class YouTubeDeadlineExceededError(YouTubeAPIError):
+    """Raised when the request deadline passes before the API has answered"""
+    pass
+
+
 class YouTubeAPIClient:
     """
     Async client for YouTube Data API v3
 
-    Uses httpx for async HTTP requests and implements retry logic.
+    Uses httpx for async HTTP requests. Network errors and transient HTTP
+    errors (settings.YOUTUBE_RETRY_STATUSES, rate-limit 403s) are retried with
+    exponential backoff and full jitter, honoring Retry-After, within a total
+    time budget. A shared circuit breaker fails requests fast while the API
+    keeps erroring or responding slowly. Reads of opted-in endpoints that
+    answer slower than usual are hedged with a duplicate request. Within a
+    deadline_scope (app.core.deadline), every HTTP call and retry is bounded
+    by the time the request has left.
     """
 
-    BASE_URL = "https://www.googleapis.com/youtube/v3"
-    MAX_RETRIES = 3
+    BASE_URL = settings.YOUTUBE_API_BASE_URL.rstrip("/")
     TIMEOUT = 30.0
-
-    def __init__(self, api_key: Optional[str] = None):
+    MAX_IDS_PER_REQUEST = 50  # videos.list / channels.list id= limit
+    MAX_SEARCH_RESULTS = 500  # search.list serves no more results per query
+
+    # error.errors[].reason values of 403 responses
+    QUOTA_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+    RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+    # Partial-response projections: record field -> API field path. Each call
+    # sends a fields= mask built from the fields it fills, so unused parts of
+    # the resource (other thumbnail sizes, localizations, ...) are never sent.
+    SEARCH_FIELD_PATHS = {
+        "video_id": "id/videoId",
+        "title": "snippet/title",
+        "description": "snippet/description",
+        "channel_id": "snippet/channelId",
+        "channel_title": "snippet/channelTitle",
+        "published_at": "snippet/publishedAt",
+        "thumbnail_url": "snippet/thumbnails/high/url",
+    }
+    VIDEO_FIELD_PATHS = {
+        "video_id": "id",
+        "title": "snippet/title",
+        "description": "snippet/description",
+        "channel_id": "snippet/channelId",
+        "channel_title": "snippet/channelTitle",
+        "published_at": "snippet/publishedAt",
+        "duration": "contentDetails/duration",
+        "view_count": "statistics/viewCount",
+        "like_count": "statistics/likeCount",
+        "comment_count": "statistics/commentCount",
+        "thumbnail_url": "snippet/thumbnails/high/url",
+        "tags": "snippet/tags",
+    }
+    REPLY_FIELD_PATHS = {
+        "comment_id": "id",
+        "text": "snippet/textDisplay",
+        "author_name": "snippet/authorDisplayName",
+        "author_channel_id": "snippet/authorChannelId/value",
+        "like_count": "snippet/likeCount",
+        "published_at": "snippet/publishedAt",
+        "updated_at": "snippet/updatedAt",
+        "parent_id": "snippet/parentId",
+    }
+    COMMENT_FIELD_PATHS = {
+        "comment_id": "snippet/topLevelComment/id",
+        "text": "snippet/topLevelComment/snippet/textDisplay",
+        "author_name": "snippet/topLevelComment/snippet/authorDisplayName",
+        "author_channel_id": "snippet/topLevelComment/snippet/authorChannelId/value",
+        "like_count": "snippet/topLevelComment/snippet/likeCount",
+        "published_at": "snippet/topLevelComment/snippet/publishedAt",
+        "updated_at": "snippet/topLevelComment/snippet/updatedAt",
+        "reply_count": "snippet/totalReplyCount",
+        # commentThreads embed only the first few replies; see get_thread_replies
+        "replies": f"replies/comments({','.join(REPLY_FIELD_PATHS.values())})",
+    }
+    CHANNEL_FIELD_PATHS = {
+        "channel_id": "id",
+        "title": "snippet/title",
+        "description": "snippet/description",
+        "custom_url": "snippet/customUrl",
+        "published_at": "snippet/publishedAt",
+        "thumbnail_url": "snippet/thumbnails/high/url",
+        "subscriber_count": "statistics/subscriberCount",
+        "video_count": "statistics/videoCount",
+        "view_count": "statistics/viewCount",
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        key_pool: Optional[APIKeyPool] = None,
+        limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[RequestHedger] = None
+    ):
         """
         Initialize YouTube API client
 
         Args:
-            api_key: YouTube Data API v3 key. If not provided, uses settings.YOUTUBE_API_KEY
+            api_key: YouTube Data API v3 key. If not provided, rotates across the
+                keys in settings.YOUTUBE_API_KEYS and settings.YOUTUBE_API_KEY
+            http_client: HTTP client to send requests with. If not provided, the
+                process-wide pool from init_http_client() is used when available.
+            cache: Response cache. If not provided, the process-wide cache is used.
+            use_cache: Set False to bypass the response cache for this client
+            key_pool: API key pool with per-key quota ledgers. If not provided,
+                the process-wide pool is used.
+            limiter: Outbound rate limiter. If not provided, the process-wide limiter is used.
+            breaker: Circuit breaker. If not provided, the process-wide breaker is used.
+            hedger: Request hedging policy. If not provided, the process-wide hedger is used.
 
         Raises:
             YouTubeAPIKeyError: If API key is not configured
         """
-        self.api_key = api_key or settings.YOUTUBE_API_KEY
+        self.api_keys: List[str] = [api_key] if api_key else configured_api_keys()
 
-        if not self.api_key:
+        if not self.api_keys:
             raise YouTubeAPIKeyError(
                 "YouTube API key not configured. "
                 "Set YOUTUBE_API_KEY in .env or pass api_key parameter."
             )
+        self.api_key = self.api_keys[0]
 
-        self.client: Optional[httpx.AsyncClient] = None
+        self.client: Optional[httpx.AsyncClient] = http_client
+        self.cache: Optional[ResponseCache] = (
+            (cache if cache is not None else get_response_cache()) if use_cache else None
+        )
+        self.key_pool: APIKeyPool = key_pool or get_key_pool()
+        self.limiter: RateLimiter = limiter or get_rate_limiter()
+        self.breaker: CircuitBreaker = breaker or get_circuit_breaker()
+        self.hedger: RequestHedger = hedger or get_request_hedger()
+        self._owns_client = False
+        self._context_depth = 0
 
     async def __aenter__(self):
-        """Context manager entry - create HTTP client"""
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.TIMEOUT),
-            follow_redirects=True
-        )
+        """
+        Context manager entry - attach to an HTTP client
+
+        Reuses the shared connection pool when the app lifespan has started it,
+        and only falls back to a private client (closed on exit) otherwise.
+        """
+        self._context_depth += 1
+        if self.client is None:
+            shared_client = get_http_client()
+            if shared_client is not None:
+                self.client = shared_client
+            else:
+                self.client = create_http_client()
+                self._owns_client = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close HTTP client"""
-        if self.client:
+        """Context manager exit - close the HTTP client only if this instance created it"""
+        self._context_depth = max(0, self._context_depth - 1)
+        if self._owns_client and self._context_depth == 0 and self.client:
             await self.client.aclose()
+            self.client = None
+            self._owns_client = False
 
     async def _make_request(
         self,
         endpoint: str,
         params: Dict[str, Any],
-        retry_count: int = 0
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """
-        Make HTTP request to YouTube API with retry logic
+        Make HTTP request to YouTube API, served from the response cache when fresh
+
+        Concurrent calls with the same endpoint and params (API key excluded)
+        share a single upstream request and receive its result or exception,
+        provided their clients send through the same HTTP client, API keys,
+        key pool and response cache (see _flight_key).
+        The shared request runs until the latest deadline among its callers
+        (unbounded if one has none); each caller waits for it only until its
+        own deadline, if any.
 
         Args:
             endpoint: API endpoint (e.g., 'search', 'videos')
             params: Query parameters
-            retry_count: Current retry attempt number
+            bypass_cache: Skip the response cache for this call
+
+        Returns:
+            JSON response as dict (shared between callers - do not mutate)
+
+        Raises:
+            YouTubeAPIError: On API errors
+            YouTubeQuotaExceededError: On quota exceeded
+            YouTubeCircuitOpenError: While the circuit breaker is open
+            YouTubeDeadlineExceededError: If the request deadline passes first
+        """
+        key = self._request_key(endpoint, params)
+        cache = None if bypass_cache else self.cache
+
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            raise YouTubeDeadlineExceededError(
+                f"Request deadline passed before calling '{endpoint}'"
+            )
+
+        flight_key = self._flight_key(key, cache)
+        task = _inflight_requests.get(flight_key)
+        if task is None:
+            # A copy, so callers joining later can extend it without touching ours
+            flight_deadline = None
+            if deadline is not None:
+                flight_deadline = Deadline(deadline.remaining(), reserve=0)
+            with deadline_scope(flight_deadline):
+                task = asyncio.ensure_future(self._fetch(endpoint, dict(params), key, cache))
+            _inflight_requests[flight_key] = task
+            _inflight_deadlines[flight_key] = flight_deadline
+            task.add_done_callback(lambda done: _release_inflight(flight_key, done))
+        else:
+            logger.debug(f"Coalescing in-flight request: {endpoint}")
+            flight_deadline = _inflight_deadlines.get(flight_key)
+            if flight_deadline is not None:
+                flight_deadline.extend_to(deadline)
+
+        # Shield so one caller cancelling does not cancel the shared request
+        if deadline is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except TimeoutError:
+            raise YouTubeDeadlineExceededError(
+                f"Request deadline passed waiting for '{endpoint}'"
+            ) from None
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        key: Tuple[str, ...],
+        cache: Optional[ResponseCache]
+    ) -> Dict[str, Any]:
+        """
+        Fetch a response upstream and store it in the cache
+
+        If the cache holds an expired entry with an ETag, the request is sent
+        with If-None-Match; a 304 restarts the entry's TTL and its payload is
+        reused without downloading or parsing the body again.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            key: Request key (see _request_key)
+            cache: Response cache, or None to skip caching
 
         Returns:
             JSON response as dict
+        """
+        stale = cache.peek(key) if cache is not None else None
+        etag = stale.etag if stale is not None else None
+
+        data, response_etag = await self._send_request(endpoint, params, etag=etag)
+
+        if data is None:
+            logger.debug(f"Revalidated cached response: {endpoint}")
+            cache.refresh(key, endpoint)
+            return stale.value
+
+        if cache is not None:
+            cache.set(key, endpoint, data, etag=response_etag)
+        return data
+
+    @staticmethod
+    def _request_key(endpoint: str, params: Dict[str, Any]) -> Tuple[str, ...]:
+        """Build a request identity from endpoint and params, ignoring the API key"""
+        normalized = sorted(
+            f"{name}={value}" for name, value in params.items() if name != "key"
+        )
+        return (endpoint, *normalized)
+
+    def _flight_key(
+        self, key: Tuple[str, ...], cache: Optional[ResponseCache]
+    ) -> Tuple[Any, ...]:
+        """
+        Build the single-flight identity of a request sent by this client
+
+        The shared request runs on the first caller's client, so only
+        clients that would send it the same way may join it: same HTTP
+        client (a private one is closed when its owner exits), API keys,
+        key pool and response cache. The objects stay alive while the
+        request is in flight, so their ids cannot be reused meanwhile.
+
+        Args:
+            key: Request identity from _request_key
+            cache: Response cache the request fills, or None
+
+        Returns:
+            Key of the in-flight request map
+        """
+        transport = self.client or get_http_client()
+        return (
+            id(transport), id(self.key_pool), tuple(self.api_keys),
+            None if cache is None else id(cache), *key
+        )
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Send HTTP request to YouTube API, rotating across API keys
+
+        Each attempt uses the key with the most remaining quota that can
+        afford the request. A key rejected with quotaExceeded is marked
+        exhausted until the daily reset and the request is retried on the
+        next key.
+
+        Args:
+            endpoint: API endpoint (e.g., 'search', 'videos')
+            params: Query parameters
+            etag: ETag of a cached response; sent as If-None-Match
+
+        Returns:
+            Tuple of (JSON response as dict, or None on 304 Not Modified;
+            response ETag or None)
 
         Raises:
             YouTubeAPIError: On API errors
+            YouTubeQuotaExceededError: If no key has quota left for the request
+        """
+        rejected_keys: List[str] = []
+        while True:
+            # Pre-flight budgeting: never send a request today's quota cannot cover
+            selected = self.key_pool.select(endpoint, self.api_keys, exclude=rejected_keys)
+            if selected is None:
+                status = self.key_pool.status(self.api_keys)
+                raise YouTubeQuotaExceededError(
+                    f"YouTube API quota exceeded for '{endpoint}' "
+                    f"({status['remaining_units']} units remaining across "
+                    f"{len(self.api_keys)} key(s)). Please try again later."
+                )
+
+            api_key, ledger = selected
+            try:
+                return await self._send_with_key(endpoint, params, api_key, ledger, etag=etag)
+            except YouTubeQuotaExceededError:
+                ledger.mark_exhausted()
+                rejected_keys.append(api_key)
+                logger.warning(
+                    f"Quota exceeded for API key {ledger.key_id}; trying another key"
+                )
+
+    async def _send_with_key(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        api_key: str,
+        ledger: QuotaLedger,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Send HTTP request to YouTube API with one API key, retrying transient errors
+
+        Args:
+            endpoint: API endpoint (e.g., 'search', 'videos')
+            params: Query parameters
+            api_key: API key to send the request with
+            ledger: Quota ledger of api_key (charged per attempt)
+            etag: ETag of a cached response; sent as If-None-Match
+
+        Returns:
+            Tuple of (JSON response as dict, or None on 304 Not Modified;
+            response ETag or None)
+
+        Raises:
+            YouTubeAPIError: On API errors, or when retries or the retry budget run out
             YouTubeQuotaExceededError: On quota exceeded
+            YouTubeCircuitOpenError: If the circuit breaker rejects an attempt
+            YouTubeDeadlineExceededError: If the request deadline leaves no time
+                for another attempt
         """
-        if not self.client:
+        client = self.client or get_http_client()
+        if not client:
             raise YouTubeAPIError("Client not initialized. Use async context manager.")
 
         url = f"{self.BASE_URL}/{endpoint}"
-        params["key"] = self.api_key
+        request_params = {**params, "key": api_key}
+        headers = {"If-None-Match": etag} if etag else None
+
+        max_retries = settings.YOUTUBE_MAX_RETRIES
+        retry_deadline = time.monotonic() + settings.YOUTUBE_RETRY_BUDGET
+        request_deadline = current_deadline()
+        attempt = 0
+
+        while True:
+            if request_deadline is not None and request_deadline.expired:
+                raise YouTubeDeadlineExceededError(
+                    f"Request deadline passed before calling '{endpoint}'"
+                )
 
-        try:
-            response = await self.client.get(url, params=params)
+            if not self.breaker.allow_request():
+                raise YouTubeCircuitOpenError(
+                    "YouTube API is temporarily unavailable (circuit open). "
+                    f"Retry in {self.breaker.retry_in():.0f}s."
+                )
+
+            retry_after = None
+            reasons: Set[str] = set()
+            response = None
+            healthy: Optional[bool] = None
+            latency = 0.0
+            deadline_bound = False
 
-            # Handle quota exceeded
-            if response.status_code == 403:
-                error_data = response.json()
-                if "quotaExceeded" in str(error_data):
+            try:
+                async with self.limiter.limit(endpoint):
+                    # Each attempt may only use the time the inbound request
+                    # has left once the limiter lets it through
+                    timeout: Any = httpx.USE_CLIENT_DEFAULT
+                    if request_deadline is not None:
+                        timeout = min(self.TIMEOUT, request_deadline.remaining())
+                        deadline_bound = timeout < self.TIMEOUT
+                        if timeout <= 0:
+                            raise YouTubeDeadlineExceededError(
+                                f"Request deadline passed waiting to call '{endpoint}'"
+                            )
+
+                    ledger.charge(endpoint)
+                    started = time.monotonic()
+                    try:
+                        response = await self._get(
+                            client, endpoint, url, request_params, headers, timeout, ledger
+                        )
+                    finally:
+                        latency = time.monotonic() - started
+                healthy = not self._is_upstream_failure(response.status_code)
+            except httpx.TransportError as e:
+                # Timeouts, connection failures and protocol errors such as a
+                # pooled keep-alive connection the server has already closed
+                # A timeout shortened by the request deadline says nothing
+                # about API health; the deadline may have been extended since
+                # by a caller joining the shared request
+                cut_short = isinstance(e, httpx.TimeoutException) and deadline_bound
+                if cut_short and request_deadline.expired:
+                    raise YouTubeDeadlineExceededError(
+                        f"Request deadline passed during '{endpoint}' call"
+                    ) from e
+                healthy = None if cut_short else False
+                error = f"Network error: {e}"
+            except YouTubeAPIError:
+                raise
+            except Exception as e:
+                raise YouTubeAPIError(f"Unexpected error: {e}") from e
+            finally:
+                self.breaker.record(healthy, latency)
+
+            if response is not None:
+                if response.status_code == 304 and etag:
+                    return None, etag
+
+                if response.status_code < 400:
+                    try:
+                        data = decode_json(response.content)
+                    except ValueError as e:
+                        raise YouTubeAPIError(f"Unexpected error: {e}")
+                    if not isinstance(data, dict):
+                        raise YouTubeAPIError("Unexpected error: response is not a JSON object")
+                    return data, response.headers.get("ETag") or data.get("etag")
+
+                message, reasons = self._error_details(response)
+                error = message or f"YouTube API error: {response.status_code}"
+
+                # Handle quota exceeded
+                if response.status_code == 403 and reasons & self.QUOTA_REASONS:
                     raise YouTubeQuotaExceededError(
-                        "YouTube API quota exceeded. Please try again later."
+                        "YouTube API quota exceeded. Please try again later.", reasons
                     )
 
-            # Handle other errors
-            if response.status_code >= 400:
-                error_msg = f"YouTube API error: {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_msg = error_data["error"].get("message", error_msg)
-                except Exception:
-                    pass
-                raise YouTubeAPIError(error_msg)
-
-            response.raise_for_status()
-            return response.json()
-
-        except (httpx.TimeoutException, httpx.NetworkError) as e:
-            # Retry on network errors
-            if retry_count < self.MAX_RETRIES:
-                logger.warning(
-                    f"Network error on attempt {retry_count + 1}/{self.MAX_RETRIES}: {e}"
+                # Non-transient errors fail immediately
+                if not self._is_retryable(response.status_code, reasons):
+                    raise YouTubeAPIError(error, reasons)
+
+                retry_after = self._retry_after(response)
+
+            attempt += 1
+            delay = self._backoff_delay(attempt, retry_after)
+            if request_deadline is not None and delay >= request_deadline.remaining():
+                raise YouTubeDeadlineExceededError(
+                    f"{error} (no time left to retry before the request deadline)", reasons
                 )
-                return await self._make_request(endpoint, params, retry_count + 1)
-            raise YouTubeAPIError(f"Network error after {self.MAX_RETRIES} retries: {e}")
+            if attempt > max_retries or time.monotonic() + delay > retry_deadline:
+                raise YouTubeAPIError(f"{error} (gave up after {attempt} attempts)", reasons)
+
+            logger.warning(
+                f"{error} on {endpoint} attempt {attempt}/{max_retries + 1}; "
+                f"retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+        timeout: Any,
+        ledger: QuotaLedger
+    ) -> httpx.Response:
+        """
+        Send one GET attempt, hedged when the endpoint is opted in
+
+        If no response has arrived after the hedger's delay and its budget
+        allows, a duplicate request (rate limited and charged to the same
+        key) is sent, and the first usable response is returned; the other
+        request is cancelled. Errors and retryable responses (429, 5xx) only
+        win when the other request failed too.
+
+        Only the original request's latency is recorded for the hedge delay.
+        When the duplicate wins, the time the original had taken so far
+        stands in for its latency.
+
+        Args:
+            client: HTTP client
+            endpoint: API endpoint
+            url: Request URL
+            params: Query parameters, API key included
+            headers: Request headers
+            timeout: httpx timeout of each request sent
+            ledger: Quota ledger charged for the duplicate
+
+        Returns:
+            HTTP response
+
+        Raises:
+            httpx.TimeoutException, httpx.NetworkError: If every request sent failed
+        """
+        started = time.monotonic()
+
+        async def send_primary() -> httpx.Response:
+            response = await client.get(url, params=params, headers=headers, timeout=timeout)
+            self.hedger.record_latency(endpoint, time.monotonic() - started)
+            return response
+
+        delay = self.hedger.hedge_delay(endpoint)
+        if delay is None:
+            return await send_primary()
+
+        primary = asyncio.ensure_future(send_primary())
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self.hedger.try_hedge():
+                return await primary
+
+            logger.debug(f"Hedging {endpoint} request after {delay:.3f}s")
+            ledger.charge(endpoint)
+            hedge = asyncio.ensure_future(
+                self._hedge(client, endpoint, url, params, headers, timeout)
+            )
+            racing = {primary, hedge}
+            while True:
+                done, racing = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer a usable response, then a retryable one, then an error;
+                # the latter two only win when no request is left in flight
+                for task in sorted(done, key=self._race_rank):
+                    if self._race_rank(task) == 0 or not racing:
+                        self.hedger.record_race(hedge_won=task is hedge)
+                        return task.result()
+        finally:
+            if not primary.done():
+                # Censored sample: the original took at least this long
+                self.hedger.record_latency(endpoint, time.monotonic() - started)
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    @classmethod
+    def _race_rank(cls, task: "asyncio.Future[httpx.Response]") -> int:
+        """Rank a finished hedged request: 0 usable, 1 retryable response, 2 error"""
+        if task.exception() is not None:
+            return 2
+        return 1 if cls._is_retryable(task.result().status_code, set()) else 0
+
+    async def _hedge(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+        timeout: Any
+    ) -> httpx.Response:
+        """Send the duplicate of a hedged request through the rate limiter"""
+        async with self.limiter.limit(endpoint):
+            return await client.get(url, params=params, headers=headers, timeout=timeout)
+
+    @staticmethod
+    def _error_details(response: httpx.Response) -> Tuple[str, Set[str]]:
+        """
+        Decode an error response body once into its message and reasons
 
-        except YouTubeAPIError:
-            raise
+        Returns:
+            Tuple of (error.message or "", set of error.errors[].reason);
+            empty if the body is not a Google API error object
+        """
+        try:
+            data = decode_json(response.content)
+        except ValueError:
+            return "", set()
+
+        error = data.get("error") if isinstance(data, dict) else None
+        if not isinstance(error, dict):
+            return "", set()
+
+        message = error.get("message")
+        reasons = {
+            item["reason"]
+            for item in error.get("errors") or []
+            if isinstance(item, dict) and isinstance(item.get("reason"), str)
+        }
+        return message if isinstance(message, str) else "", reasons
+
+    @classmethod
+    def _is_retryable(cls, status_code: int, reasons: Set[str]) -> bool:
+        """Check whether an HTTP error is transient and worth retrying"""
+        if status_code in settings.YOUTUBE_RETRY_STATUSES:
+            return True
+        # rateLimitExceeded / userRateLimitExceeded are short-term throttles
+        return status_code == 403 and bool(reasons & cls.RATE_LIMIT_REASONS)
+
+    @staticmethod
+    def _is_upstream_failure(status_code: int) -> bool:
+        """Check whether a response counts against the circuit breaker (5xx, 429)"""
+        return status_code >= 500 or status_code == 429
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date) into seconds"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before a retry
+
+        Uses the server's Retry-After when given, otherwise exponential
+        backoff with full jitter: uniform(0, min(max_delay, base * 2^(attempt-1))).
+        """
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(
+            settings.YOUTUBE_RETRY_MAX_DELAY,
+            settings.YOUTUBE_RETRY_BASE_DELAY * (2 ** (attempt - 1)),
+        )
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _projection(
+        field_paths: Dict[str, str],
+        fields: Optional[Iterable[str]],
+        required: str
+    ) -> Tuple[List[str], str]:
+        """
+        Resolve the record fields a caller asked for into a fields= mask
+
+        Args:
+            field_paths: Record field -> API field path (e.g., VIDEO_FIELD_PATHS)
+            fields: Record fields to fill, or None for all of them
+            required: Field that is always filled (the resource ID)
 
-        except Exception as e:
-            raise YouTubeAPIError(f"Unexpected error: {e}")
+        Returns:
+            Tuple of (requested record fields, fields= mask). The mask also
+            selects the response etag so cached responses can be revalidated.
+
+        Raises:
+            ValueError: If fields contains an unknown key
+        """
+        if fields is None:
+            keys = list(field_paths)
+        else:
+            keys = list(dict.fromkeys([required, *fields]))
+            unknown = [key for key in keys if key not in field_paths]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        paths = ",".join(field_paths[key] for key in keys)
+        return keys, f"etag,items({paths})"
+
+    @staticmethod
+    def _parts_for(field_paths: Dict[str, str], keys: List[str]) -> str:
+        """Get the resource parts (snippet, statistics, ...) the keys are read from"""
+        parts = [field_paths[key].split("/")[0] for key in keys]
+        return ",".join(dict.fromkeys(part for part in parts if part != "id")) or "id"
+
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """Parse an API timestamp; None if absent, current UTC time if malformed"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return datetime.now(timezone.utc)
 
     async def search_videos(
         self,
         query: str,
         max_results: int = 10,
-        order: str = "relevance"
-    ) -> List[Dict[str, Any]]:
+        order: str = "relevance",
+        fields: Optional[Iterable[str]] = None
+    ) -> List[SearchResult]:
         """
         Search for YouTube videos by keyword
 
+        More than 50 results are collected over several pages (see
+        iter_search_results), 100 quota units per page.
+
         Args:
             query: Search query string
-            max_results: Maximum number of results (1-50, default 10)
+            max_results: Maximum number of results (1-500, default 10)
             order: Sort order (relevance, date, rating, viewCount, title)
+            fields: SearchResult fields to fill (see SEARCH_FIELD_PATHS); others
+                keep their defaults. video_id is always filled. Defaults to all.
 
         Returns:
-            List of video info dicts with keys:
-            - video_id: str
-            - title: str
-            - description: str
-            - channel_id: str
-            - channel_title: str
-            - published_at: datetime
-            - thumbnail_url: str
+            List of SearchResult records
 
         Raises:
             YouTubeAPIError: On API errors
         """
+        if not 1 <= max_results <= self.MAX_SEARCH_RESULTS:
+            raise ValueError(f"max_results must be between 1 and {self.MAX_SEARCH_RESULTS}")
+
+        results: List[SearchResult] = []
+        pages = self.iter_search_results(query, limit=max_results, order=order, fields=fields)
+        async with aclosing(pages):
+            async for page in pages:
+                results.extend(page)
+        return results
+
+    async def iter_search_results(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        order: str = "relevance",
+        fields: Optional[Iterable[str]] = None,
+        min_relevance: Optional[float] = None
+    ) -> AsyncIterator[List[SearchResult]]:
+        """
+        Stream search results page by page, following nextPageToken
+
+        The next page is requested as soon as the current one is parsed, so
+        it downloads while the caller works on the current page. Paging stops
+        before requesting a page when:
+        - the results so far reach `limit`
+        - no key of this client can afford a search without dipping into
+          the quota reserve (see QuotaLedger.can_afford)
+        - the share of the last page's results mentioning a query term in
+          their title or description is below `min_relevance`
+
+        Args:
+            query: Search query string
+            limit: Maximum results to yield in total (1-500,
+                default settings.YOUTUBE_SEARCH_LIMIT)
+            order: Sort order (relevance, date, rating, viewCount, title)
+            fields: SearchResult fields to fill (see search_videos); title and
+                description are added when min_relevance is set
+            min_relevance: Relevance share (0-1) a page needs for paging to
+                continue; None disables the check
+
+        Yields:
+            Non-empty lists of up to 50 SearchResult records
+
+        Raises:
+            ValueError: If query is empty or limit is out of range
+            YouTubeAPIError: On API errors
+        """
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
 
-        if not 1 <= max_results <= 50:
-            raise ValueError("max_results must be between 1 and 50")
+        limit = settings.YOUTUBE_SEARCH_LIMIT if limit is None else limit
+        if not 1 <= limit <= self.MAX_SEARCH_RESULTS:
+            raise ValueError(f"limit must be between 1 and {self.MAX_SEARCH_RESULTS}")
 
-        params = {
+        if min_relevance is not None and fields is not None:
+            fields = [*fields, "title", "description"]
+        _, mask = self._projection(self.SEARCH_FIELD_PATHS, fields, "video_id")
+        params: Dict[str, Any] = {
             "part": "snippet",
             "q": query.strip(),
             "type": "video",
-            "maxResults": max_results,
             "order": order,
+            "fields": f"nextPageToken,{mask}",
         }
+        collected = 0
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(
+            self._make_request("search", {**params, "maxResults": min(50, limit)})
+        )
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+
+                page = []
+                for item in data.get("items", []):
+                    video_id = item.get("id", {}).get("videoId")
+                    if video_id:
+                        page.append(self._parse_search_item(item, video_id))
+                page = page[:limit - collected]
+                collected += len(page)
+
+                page_token = data.get("nextPageToken")
+                if page_token and collected < limit and self._should_fetch_next_search_page(
+                    query, page, min_relevance
+                ):
+                    next_params = {
+                        **params,
+                        "maxResults": min(50, limit - collected),
+                        "pageToken": page_token,
+                    }
+                    pending = asyncio.ensure_future(self._make_request("search", next_params))
+
+                if page:
+                    yield page
+        finally:
+            if pending is not None:
+                # Stopped early: drop the prefetched page, including its error
+                pending.cancel()
+                pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def _should_fetch_next_search_page(
+        self,
+        query: str,
+        page: List[SearchResult],
+        min_relevance: Optional[float]
+    ) -> bool:
+        """Check the quota and relevance conditions for following a search page"""
+        ledgers = (self.key_pool.ledger_for(api_key) for api_key in self.api_keys)
+        if not any(ledger.can_afford("search") for ledger in ledgers):
+            logger.warning(f"Stopped paging search for '{query}': quota reserve reached")
+            return False
+
+        if min_relevance is not None:
+            terms = query.lower().split()
+            relevant = sum(
+                1 for result in page
+                if any(term in f"{result.title} {result.description}".lower() for term in terms)
+            )
+            if not page or relevant / len(page) < min_relevance:
+                logger.info(f"Stopped paging search for '{query}': results no longer relevant")
+                return False
 
-        data = await self._make_request("search", params)
-
-        results = []
-        for item in data.get("items", []):
-            video_id = item["id"].get("videoId")
-            snippet = item.get("snippet", {})
-
-            if not video_id:
-                continue
-
-            # Parse published_at
-            published_str = snippet.get("publishedAt", "")
-            try:
-                published_at = datetime.fromisoformat(
-                    published_str.replace("Z", "+00:00")
-                )
-            except Exception:
-                published_at = datetime.now(timezone.utc)
-
-            results.append({
-                "video_id": video_id,
-                "title": snippet.get("title", ""),
-                "description": snippet.get("description", ""),
-                "channel_id": snippet.get("channelId", ""),
-                "channel_title": snippet.get("channelTitle", ""),
-                "published_at": published_at,
-                "thumbnail_url": snippet.get("thumbnails", {})
-                    .get("high", {})
-                    .get("url", ""),
-            })
+        return True
 
-        return results
+    @classmethod
+    def _parse_search_item(cls, item: Dict[str, Any], video_id: str) -> SearchResult:
+        """Convert a search.list item into a SearchResult"""
+        snippet = item.get("snippet", {})
+        return SearchResult(
+            video_id=video_id,
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            channel_id=snippet.get("channelId", ""),
+            channel_title=snippet.get("channelTitle", ""),
+            published_at=cls._parse_timestamp(snippet.get("publishedAt")),
+            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+        )
 
-    async def get_video_details(self, video_id: str) -> Dict[str, Any]:
+    async def get_video_details(
+        self,
+        video_id: str,
+        fields: Optional[Iterable[str]] = None
+    ) -> VideoDetails:
         """
         Get detailed information about a specific video
 
         Args:
             video_id: YouTube video ID
+            fields: VideoDetails fields to fill (see VIDEO_FIELD_PATHS); others
+                keep their defaults. video_id is always filled. Defaults to all.
 
         Returns:
-            Dict with video details:
-            - video_id: str
-            - title: str
-            - description: str
-            - channel_id: str
-            - channel_title: str
-            - published_at: datetime
-            - duration: str (ISO 8601 format, e.g., PT15M30S)
-            - view_count: int
-            - like_count: int
-            - comment_count: int
-            - thumbnail_url: str
-            - tags: List[str]
+            VideoDetails record
 
         Raises:
             YouTubeAPIError: On API errors
-            ValueError: If video not found
+            ValueError: If video not found (remembered for a while, see
+                ResponseCache.mark_missing)
         """
         if not video_id or not video_id.strip():
             raise ValueError("video_id cannot be empty")
 
+        video_id = video_id.strip()
+        if self._known_missing("videos", video_id):
+            raise ValueError(f"Video not found: {video_id}")
+
+        keys, mask = self._projection(self.VIDEO_FIELD_PATHS, fields, "video_id")
         params = {
-            "part": "snippet,contentDetails,statistics",
-            "id": video_id.strip(),
+            "part": self._parts_for(self.VIDEO_FIELD_PATHS, keys),
+            "id": video_id,
+            "fields": mask,
         }
 
         data = await self._make_request("videos", params)
 
         items = data.get("items", [])
         if not items:
+            self._remember_missing("videos", [video_id])
             raise ValueError(f"Video not found: {video_id}")
 
-        item = items[0]
-        snippet = item.get("snippet", {})
-        content_details = item.get("contentDetails", {})
-        statistics = item.get("statistics", {})
+        return self._parse_video_item(items[0], video_id)
 
-        # Parse published_at
-        published_str = snippet.get("publishedAt", "")
-        try:
-            published_at = datetime.fromisoformat(
-                published_str.replace("Z", "+00:00")
+    async def get_videos_details(
+        self,
+        video_ids: List[str],
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[VideoDetails]]:
+        """
+        Get detailed information about many videos in batched requests
+
+        videos.list accepts up to MAX_IDS_PER_REQUEST comma-separated IDs,
+        so N videos cost ceil(N / 50) requests instead of N.
+
+        Args:
+            video_ids: YouTube video IDs (duplicates and blanks are ignored)
+            fields: Keys to return per video (see get_video_details)
+
+        Returns:
+            Dict keyed by video_id, in request order. Values are VideoDetails
+            records, or None if the video was not found.
+
+        Raises:
+            YouTubeAPIError: On API errors
+        """
+        ids = self._normalize_ids(video_ids)
+        keys, mask = self._projection(self.VIDEO_FIELD_PATHS, fields, "video_id")
+        items = await self._fetch_items_by_ids(
+            "videos", self._parts_for(self.VIDEO_FIELD_PATHS, keys), mask, ids
+        )
+
+        results: Dict[str, Optional[VideoDetails]] = {video_id: None for video_id in ids}
+        for item in items:
+            video_id = item.get("id")
+            if video_id in results:
+                results[video_id] = self._parse_video_item(item, video_id)
+
+        missing = [video_id for video_id, details in results.items() if details is None]
+        if missing:
+            logger.info(f"Videos not found: {', '.join(missing)}")
+
+        return results
+
+    async def _fetch_items_by_ids(
+        self,
+        endpoint: str,
+        part: str,
+        fields: str,
+        ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch list items for many IDs, MAX_IDS_PER_REQUEST per request
+
+        Chunks are requested concurrently; the first failing chunk's error
+        is raised. IDs known to be missing are not requested, and IDs the
+        API returns no item for are remembered as missing.
+
+        Args:
+            endpoint: API endpoint accepting comma-separated `id` (videos, channels)
+            part: Resource parts to request
+            fields: Partial-response mask
+            ids: Normalized, de-duplicated IDs
+
+        Returns:
+            All returned items across chunks
+        """
+        ids = [i for i in ids if not self._known_missing(endpoint, i)]
+        chunks = [
+            ids[start:start + self.MAX_IDS_PER_REQUEST]
+            for start in range(0, len(ids), self.MAX_IDS_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(*(
+            self._make_request(
+                endpoint, {"part": part, "id": ",".join(chunk), "fields": fields}
             )
-        except Exception:
-            published_at = datetime.now(timezone.utc)
+            for chunk in chunks
+        ))
+        items = [item for data in responses for item in data.get("items", [])]
+
+        found = {item.get("id") for item in items}
+        self._remember_missing(endpoint, [i for i in ids if i not in found])
+        return items
+
+    def _known_missing(self, kind: str, resource_id: str) -> bool:
+        """Check the negative cache for a resource (see ResponseCache.is_missing)"""
+        return self.cache is not None and self.cache.is_missing(kind, resource_id)
+
+    def _remember_missing(self, kind: str, resource_ids: List[str]) -> None:
+        """Record resources in the negative cache (see ResponseCache.mark_missing)"""
+        if self.cache is not None:
+            for resource_id in resource_ids:
+                self.cache.mark_missing(kind, resource_id)
+
+    @staticmethod
+    def _normalize_ids(ids: List[str]) -> List[str]:
+        """Strip IDs and drop blanks/duplicates while keeping first-seen order"""
+        normalized = (i.strip() for i in ids if i and i.strip())
+        return list(dict.fromkeys(normalized))
+
+    @classmethod
+    def _parse_video_item(cls, item: Dict[str, Any], video_id: str) -> VideoDetails:
+        """Convert a videos.list item into a VideoDetails"""
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
 
-        return {
-            "video_id": item.get("id", video_id),
-            "title": snippet.get("title", ""),
-            "description": snippet.get("description", ""),
-            "channel_id": snippet.get("channelId", ""),
-            "channel_title": snippet.get("channelTitle", ""),
-            "published_at": published_at,
-            "duration": content_details.get("duration", ""),
-            "view_count": int(statistics.get("viewCount", 0)),
-            "like_count": int(statistics.get("likeCount", 0)),
-            "comment_count": int(statistics.get("commentCount", 0)),
-            "thumbnail_url": snippet.get("thumbnails", {})
-                .get("high", {})
-                .get("url", ""),
-            "tags": snippet.get("tags", []),
-        }
+        return VideoDetails(
+            video_id=item.get("id", video_id),
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            channel_id=snippet.get("channelId", ""),
+            channel_title=snippet.get("channelTitle", ""),
+            published_at=cls._parse_timestamp(snippet.get("publishedAt")),
+            duration=item.get("contentDetails", {}).get("duration", ""),
+            view_count=int(statistics.get("viewCount", 0)),
+            like_count=int(statistics.get("likeCount", 0)),
+            comment_count=int(statistics.get("commentCount", 0)),
+            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+            tags=snippet.get("tags", []),
+        )
 
     async def get_video_comments(
         self,
         video_id: str,
         max_results: int = 100,
-        order: str = "relevance"
-    ) -> List[Dict[str, Any]]:
+        order: str = "relevance",
+        fields: Optional[Iterable[str]] = None
+    ) -> List[Comment]:
         """
         Get comments for a specific video
 
@@ -297,17 +1151,11 @@ class YouTubeAPIClient:
             video_id: YouTube video ID
             max_results: Maximum number of comments (1-100, default 100)
             order: Sort order (time, relevance)
+            fields: Comment fields to fill (see COMMENT_FIELD_PATHS); others
+                keep their defaults. comment_id is always filled. Defaults to all.
 
         Returns:
-            List of comment dicts with keys:
-            - comment_id: str
-            - text: str
-            - author_name: str
-            - author_channel_id: str
-            - like_count: int
-            - published_at: datetime
-            - updated_at: datetime
-            - reply_count: int
+            List of Comment records
 
         Raises:
             YouTubeAPIError: On API errors
@@ -318,163 +1166,471 @@ class YouTubeAPIClient:
         if not 1 <= max_results <= 100:
             raise ValueError("max_results must be between 1 and 100")
 
-        params = {
-            "part": "snippet",
-            "videoId": video_id.strip(),
-            "maxResults": max_results,
+        pages = self.iter_video_comments(video_id, limit=max_results, order=order, fields=fields)
+        async with aclosing(pages):
+            async for page in pages:
+                return page
+        return []
+
+    async def iter_video_comments(
+        self,
+        video_id: str,
+        limit: Optional[int] = None,
+        order: str = "relevance",
+        fields: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[List[Comment]]:
+        """
+        Stream a video's comments page by page, following nextPageToken
+
+        Each page is requested only after the previous one was consumed, so
+        callers can stop early without paying for the rest. Paging also
+        stops once this client's keys are down to settings.YOUTUBE_QUOTA_RESERVE
+        units, leaving the reserve for other requests; the first page is
+        always requested.
+
+        Args:
+            video_id: YouTube video ID
+            limit: Maximum comments to yield in total
+                (default settings.YOUTUBE_COMMENT_LIMIT)
+            order: Sort order (time, relevance)
+            fields: Comment fields to fill (see get_video_comments)
+
+        Yields:
+            Non-empty lists of up to 100 Comment records
+
+        Raises:
+            ValueError: If video_id is empty or limit is below 1
+            YouTubeAPIError: On API errors (disabled comments end the stream,
+                and later streams for the video end without a request)
+        """
+        if not video_id or not video_id.strip():
+            raise ValueError("video_id cannot be empty")
+
+        limit = settings.YOUTUBE_COMMENT_LIMIT if limit is None else limit
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        video_id = video_id.strip()
+        if self._known_missing("commentThreads", video_id):
+            logger.debug(f"Comments known to be disabled for video: {video_id}")
+            return
+
+        keys, mask = self._projection(self.COMMENT_FIELD_PATHS, fields, "comment_id")
+        params: Dict[str, Any] = {
+            "part": self._parts_for(self.COMMENT_FIELD_PATHS, keys),
+            "videoId": video_id,
             "order": order,
             "textFormat": "plainText",
+            "fields": f"nextPageToken,{mask}",
         }
 
-        try:
-            data = await self._make_request("commentThreads", params)
-        except YouTubeAPIError as e:
-            # Comments might be disabled
-            if "disabled" in str(e).lower():
-                logger.info(f"Comments disabled for video: {video_id}")
-                return []
-            raise
-
-        results = []
-        for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            top_comment = snippet.get("topLevelComment", {})
-            comment_snippet = top_comment.get("snippet", {})
-
-            comment_id = top_comment.get("id", "")
-
-            # Parse timestamps
-            published_str = comment_snippet.get("publishedAt", "")
-            updated_str = comment_snippet.get("updatedAt", "")
-
-            try:
-                published_at = datetime.fromisoformat(
-                    published_str.replace("Z", "+00:00")
+        collected = 0
+        page_token: Optional[str] = None
+        while collected < limit:
+            if page_token is not None and not self._has_quota_beyond_reserve():
+                logger.warning(
+                    f"Stopped paging comments for video {video_id} at {collected}: "
+                    "quota reserve reached"
                 )
-            except Exception:
-                published_at = datetime.now(timezone.utc)
+                return
+
+            params["maxResults"] = min(100, limit - collected)
+            if page_token is not None:
+                params["pageToken"] = page_token
 
             try:
-                updated_at = datetime.fromisoformat(
-                    updated_str.replace("Z", "+00:00")
-                )
-            except Exception:
-                updated_at = published_at
-
-            results.append({
-                "comment_id": comment_id,
-                "text": comment_snippet.get("textDisplay", ""),
-                "author_name": comment_snippet.get("authorDisplayName", ""),
-                "author_channel_id": comment_snippet.get("authorChannelId", {})
-                    .get("value", ""),
-                "like_count": int(comment_snippet.get("likeCount", 0)),
-                "published_at": published_at,
-                "updated_at": updated_at,
-                "reply_count": int(snippet.get("totalReplyCount", 0)),
-            })
+                data = await self._make_request("commentThreads", params)
+            except YouTubeAPIError as e:
+                # Comments might be disabled
+                if "commentsDisabled" in e.reasons:
+                    logger.info(f"Comments disabled for video: {video_id}")
+                    self._remember_missing("commentThreads", [video_id])
+                    return
+                raise
+
+            page = [
+                self._parse_comment_thread(item)
+                for item in data.get("items", [])[:limit - collected]
+            ]
+            if page:
+                collected += len(page)
+                yield page
+
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                return
+
+    def _has_quota_beyond_reserve(self) -> bool:
+        """Check whether this client's keys have more than the quota reserve left today"""
+        remaining = sum(self.key_pool.ledger_for(api_key).remaining for api_key in self.api_keys)
+        return remaining > settings.YOUTUBE_QUOTA_RESERVE
+
+    async def get_thread_replies(
+        self,
+        threads: List[Comment],
+        max_threads: Optional[int] = None,
+        limit: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, List[Comment]]:
+        """
+        Get the replies of comment threads, fetching only what the threads lack
 
-        return results
+        commentThreads responses embed only the first few replies of each
+        thread. Threads whose reply_count exceeds their embedded replies are
+        completed with comments.list?parentId (1 unit per page), the busiest
+        threads first, with at most `concurrency` threads fetched at once.
+        No thread is fetched once this client's keys are down to
+        settings.YOUTUBE_QUOTA_RESERVE units. A thread whose fetch fails
+        keeps its embedded replies.
 
-    async def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
+        Args:
+            threads: Top-level comments (e.g., pages of iter_video_comments)
+            max_threads: Maximum threads to fetch replies for
+                (default settings.YOUTUBE_REPLY_THREAD_LIMIT)
+            limit: Maximum replies per fetched thread
+                (default settings.YOUTUBE_REPLY_LIMIT)
+            concurrency: Maximum threads fetched at once
+                (default settings.YOUTUBE_REPLY_CONCURRENCY)
+
+        Returns:
+            Dict keyed by parent comment_id, for every thread with replies,
+            in thread order. Values are the fetched replies, or the embedded
+            ones if the thread was not fetched.
+        """
+        max_threads = settings.YOUTUBE_REPLY_THREAD_LIMIT if max_threads is None else max_threads
+        limit = settings.YOUTUBE_REPLY_LIMIT if limit is None else limit
+        concurrency = settings.YOUTUBE_REPLY_CONCURRENCY if concurrency is None else concurrency
+
+        replies: Dict[str, List[Comment]] = {
+            thread.comment_id: list(thread.replies)
+            for thread in threads
+            if thread.reply_count or thread.replies
+        }
+
+        incomplete = sorted(
+            (thread for thread in threads if thread.reply_count > len(thread.replies)),
+            key=lambda thread: thread.reply_count,
+            reverse=True
+        )[:max(max_threads, 0)]
+        if not incomplete or limit < 1:
+            return replies
+
+        slots = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(thread: Comment) -> None:
+            async with slots:
+                if not self._has_quota_beyond_reserve():
+                    return
+                try:
+                    fetched = await self.get_comment_replies(thread.comment_id, limit=limit)
+                except YouTubeAPIError as e:
+                    logger.warning(f"Failed to fetch replies of comment {thread.comment_id}: {e}")
+                    return
+                if len(fetched) > len(replies[thread.comment_id]):
+                    replies[thread.comment_id] = fetched
+
+        await asyncio.gather(*(fetch(thread) for thread in incomplete))
+        return replies
+
+    async def get_comment_replies(
+        self,
+        parent_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[Comment]:
+        """
+        Get the replies to a top-level comment, following nextPageToken
+
+        Follow-up pages are skipped once this client's keys are down to
+        settings.YOUTUBE_QUOTA_RESERVE units.
+
+        Args:
+            parent_id: Top-level comment ID
+            limit: Maximum replies to return (default settings.YOUTUBE_REPLY_LIMIT)
+            fields: Comment fields to fill (see REPLY_FIELD_PATHS); others
+                keep their defaults. comment_id is always filled. Defaults to all.
+
+        Returns:
+            List of reply Comment records, oldest first
+
+        Raises:
+            ValueError: If parent_id is empty or limit is below 1
+            YouTubeAPIError: On API errors
+        """
+        if not parent_id or not parent_id.strip():
+            raise ValueError("parent_id cannot be empty")
+
+        limit = settings.YOUTUBE_REPLY_LIMIT if limit is None else limit
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        _, mask = self._projection(self.REPLY_FIELD_PATHS, fields, "comment_id")
+        params: Dict[str, Any] = {
+            "part": "snippet",
+            "parentId": parent_id.strip(),
+            "textFormat": "plainText",
+            "fields": f"nextPageToken,{mask}",
+        }
+
+        replies: List[Comment] = []
+        while len(replies) < limit:
+            params["maxResults"] = min(100, limit - len(replies))
+            data = await self._make_request("comments", params)
+            replies.extend(
+                self._parse_comment(item) for item in data.get("items", [])[:limit - len(replies)]
+            )
+
+            page_token = data.get("nextPageToken")
+            if not page_token or not self._has_quota_beyond_reserve():
+                break
+            params["pageToken"] = page_token
+
+        return replies
+
+    @classmethod
+    def _parse_comment_thread(cls, item: Dict[str, Any]) -> Comment:
+        """Convert a commentThreads.list item into a Comment with its embedded replies"""
+        snippet = item.get("snippet", {})
+        comment = cls._parse_comment(snippet.get("topLevelComment", {}))
+        comment.reply_count = int(snippet.get("totalReplyCount", 0))
+        comment.replies = [
+            cls._parse_comment(reply)
+            for reply in item.get("replies", {}).get("comments", [])
+        ]
+        return comment
+
+    @classmethod
+    def _parse_comment(cls, item: Dict[str, Any]) -> Comment:
+        """Convert a comment resource (top-level comment or reply) into a Comment"""
+        snippet = item.get("snippet", {})
+        published_at = cls._parse_timestamp(snippet.get("publishedAt"))
+
+        return Comment(
+            comment_id=item.get("id", ""),
+            text=snippet.get("textDisplay", ""),
+            author_name=snippet.get("authorDisplayName", ""),
+            author_channel_id=snippet.get("authorChannelId", {}).get("value", ""),
+            like_count=int(snippet.get("likeCount", 0)),
+            published_at=published_at,
+            updated_at=cls._parse_timestamp(snippet.get("updatedAt")) or published_at,
+            parent_id=snippet.get("parentId", ""),
+        )
+
+    async def get_channel_info(
+        self,
+        channel_id: str,
+        fields: Optional[Iterable[str]] = None
+    ) -> Channel:
         """
         Get information about a YouTube channel
 
         Args:
             channel_id: YouTube channel ID
+            fields: Channel fields to fill (see CHANNEL_FIELD_PATHS); others
+                keep their defaults. channel_id is always filled. Defaults to all.
 
         Returns:
-            Dict with channel info:
-            - channel_id: str
-            - title: str
-            - description: str
-            - custom_url: str
-            - published_at: datetime
-            - thumbnail_url: str
-            - subscriber_count: int
-            - video_count: int
-            - view_count: int
+            Channel record
 
         Raises:
             YouTubeAPIError: On API errors
-            ValueError: If channel not found
+            ValueError: If channel not found (remembered for a while, see
+                ResponseCache.mark_missing)
         """
         if not channel_id or not channel_id.strip():
             raise ValueError("channel_id cannot be empty")
 
+        channel_id = channel_id.strip()
+        if self._known_missing("channels", channel_id):
+            raise ValueError(f"Channel not found: {channel_id}")
+
+        keys, mask = self._projection(self.CHANNEL_FIELD_PATHS, fields, "channel_id")
         params = {
-            "part": "snippet,statistics",
-            "id": channel_id.strip(),
+            "part": self._parts_for(self.CHANNEL_FIELD_PATHS, keys),
+            "id": channel_id,
+            "fields": mask,
         }
 
         data = await self._make_request("channels", params)
 
         items = data.get("items", [])
         if not items:
+            self._remember_missing("channels", [channel_id])
             raise ValueError(f"Channel not found: {channel_id}")
 
-        item = items[0]
+        return self._parse_channel_item(items[0], channel_id)
+
+    async def get_channels_info(
+        self,
+        channel_ids: List[str],
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[Channel]]:
+        """
+        Get information about many channels in batched, concurrent requests
+
+        IDs are de-duplicated and chunked by MAX_IDS_PER_REQUEST, and the
+        chunks are fetched concurrently.
+
+        Args:
+            channel_ids: YouTube channel IDs (duplicates and blanks are ignored)
+            fields: Keys to return per channel (see get_channel_info)
+
+        Returns:
+            Dict keyed by channel_id, in request order. Values are Channel
+            records, or None if the channel was not found.
+
+        Raises:
+            YouTubeAPIError: On API errors
+        """
+        ids = self._normalize_ids(channel_ids)
+        keys, mask = self._projection(self.CHANNEL_FIELD_PATHS, fields, "channel_id")
+        items = await self._fetch_items_by_ids(
+            "channels", self._parts_for(self.CHANNEL_FIELD_PATHS, keys), mask, ids
+        )
+
+        results: Dict[str, Optional[Channel]] = {channel_id: None for channel_id in ids}
+        for item in items:
+            channel_id = item.get("id")
+            if channel_id in results:
+                results[channel_id] = self._parse_channel_item(item, channel_id)
+
+        missing = [channel_id for channel_id, info in results.items() if info is None]
+        if missing:
+            logger.info(f"Channels not found: {', '.join(missing)}")
+
+        return results
+
+    @classmethod
+    def _parse_channel_item(cls, item: Dict[str, Any], channel_id: str) -> Channel:
+        """Convert a channels.list item into a Channel"""
         snippet = item.get("snippet", {})
         statistics = item.get("statistics", {})
 
-        # Parse published_at
-        published_str = snippet.get("publishedAt", "")
-        try:
-            published_at = datetime.fromisoformat(
-                published_str.replace("Z", "+00:00")
-            )
-        except Exception:
-            published_at = datetime.now(timezone.utc)
-
-        return {
-            "channel_id": item.get("id", channel_id),
-            "title": snippet.get("title", ""),
-            "description": snippet.get("description", ""),
-            "custom_url": snippet.get("customUrl", ""),
-            "published_at": published_at,
-            "thumbnail_url": snippet.get("thumbnails", {})
-                .get("high", {})
-                .get("url", ""),
-            "subscriber_count": int(statistics.get("subscriberCount", 0)),
-            "video_count": int(statistics.get("videoCount", 0)),
-            "view_count": int(statistics.get("viewCount", 0)),
-        }
+        return Channel(
+            channel_id=item.get("id", channel_id),
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            custom_url=snippet.get("customUrl", ""),
+            published_at=cls._parse_timestamp(snippet.get("publishedAt")),
+            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+            subscriber_count=int(statistics.get("subscriberCount", 0)),
+            video_count=int(statistics.get("videoCount", 0)),
+            view_count=int(statistics.get("viewCount", 0)),
+        )
 
     async def check_quota(self) -> Dict[str, Any]:
         """
-        Check API quota status by making a minimal API call
+        Check API quota status from the quota ledgers (no API call is made)
+
+        Totals are summed over this client's API keys.
 
         Returns:
             Dict with quota info:
-            - available: bool (True if API is accessible)
+            - available: bool (True if any units remain today)
             - message: str
+            - daily_limit: int
+            - used_units: int
+            - remaining_units: int
+            - resets_at: datetime (UTC, midnight Pacific time)
+        """
+        status = self.key_pool.status(self.api_keys)
+        available = status["remaining_units"] > 0
 
-        Raises:
-            YouTubeQuotaExceededError: If quota is exceeded
+        return {
+            "available": available,
+            "message": (
+                f"{status['remaining_units']} of {status['daily_limit']} quota units remaining"
+                if available else "YouTube API quota exceeded"
+            ),
+            "daily_limit": status["daily_limit"],
+            "used_units": status["used_units"],
+            "remaining_units": status["remaining_units"],
+            "resets_at": status["resets_at"],
+        }
+
+
+    def stats(self) -> Dict[str, Any]:
         """
+        Get runtime statistics of the components this client sends through
+
+        Returns:
+            Dict with response_cache (None if caching is off), rate_limiter,
+            circuit_breaker and hedging statistics
+        """
+        return {
+            "response_cache": self.cache.stats() if self.cache is not None else None,
+            "rate_limiter": self.limiter.stats(),
+            "circuit_breaker": self.breaker.stats(),
+            "hedging": self.hedger.stats(),
+        }
+
+# Process-wide HTTP connection pool, owned by the FastAPI app lifespan
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Build a connection-pooled HTTP client for the YouTube Data API
+
+    Pool limits come from settings. HTTP/2 is enabled only when
+    YOUTUBE_HTTP2 is set and the optional `h2` package is installed.
+    With YOUTUBE_REPLAY_MODE set, responses are recorded to or replayed
+    from YOUTUBE_REPLAY_DIR (see app.services.youtube_replay).
+
+    Returns:
+        New httpx.AsyncClient (caller is responsible for closing it)
+    """
+    http2 = settings.YOUTUBE_HTTP2
+    if http2:
         try:
-            # Make minimal request (costs 1 unit)
-            params = {
-                "part": "id",
-                "maxResults": 1,
-            }
-            await self._make_request("videos", params)
-
-            return {
-                "available": True,
-                "message": "YouTube API is accessible"
-            }
-
-        except YouTubeQuotaExceededError:
-            return {
-                "available": False,
-                "message": "YouTube API quota exceeded"
-            }
-
-        except YouTubeAPIError as e:
-            return {
-                "available": False,
-                "message": f"YouTube API error: {str(e)}"
-            }
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("YOUTUBE_HTTP2 is enabled but `h2` is not installed; using HTTP/1.1")
+            http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.YOUTUBE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.YOUTUBE_HTTP_KEEPALIVE_EXPIRY,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(YouTubeAPIClient.TIMEOUT),
+        transport=create_replay_transport(transport) or transport,
+        follow_redirects=True
+    )
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """
+    Start the shared HTTP connection pool (call from app startup)
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client()
+    return _http_client
+
+
+def get_http_client() -> Optional[httpx.AsyncClient]:
+    """
+    Get the shared HTTP connection pool
+
+    Returns:
+        The shared httpx.AsyncClient, or None if it has not been started
+    """
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP connection pool (call from app shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 # Singleton instance for dependency injection
@@ -0,0 +1,206 @@
+"""
+YouTube API Circuit Breaker
+Stops sending requests to the YouTube API while it is failing or too slow.
+"""
+
+from collections import deque
+from typing import Optional, Dict, Any
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for outbound YouTube API requests
+
+    closed: requests flow; the outcome of the last window_size calls is
+        tracked, and a call counts as failed when it errored (network error,
+        5xx, 429) or took longer than slow_call_seconds. Once at least
+        min_calls are recorded and the failed share reaches failure_rate,
+        the breaker opens.
+    open: requests are rejected without touching the network for
+        open_seconds, then the breaker turns half-open.
+    half_open: up to half_open_calls probe requests are let through; a
+        healthy probe closes the breaker, a failed one opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            window_size: Number of recent calls the failure rate is computed over
+            min_calls: Calls required in the window before the breaker can open
+            failure_rate: Share of failed or slow calls that opens the breaker
+                (<= 0 disables the breaker)
+            slow_call_seconds: Latency above which a successful call counts as failed
+            open_seconds: How long the breaker stays open before probing
+            half_open_calls: Concurrent probe requests allowed while half-open
+        """
+        self.window_size = max(window_size, 1)
+        self.min_calls = max(min(min_calls, self.window_size), 1)
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = max(half_open_calls, 1)
+
+        self._state = self.CLOSED
+        self._outcomes: "deque[bool]" = deque(maxlen=self.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open once open_seconds have passed"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+            logger.info("YouTube API circuit half-open; probing")
+        return self._state
+
+    def retry_in(self) -> float:
+        """Get seconds until an open breaker lets a probe through (0 if not open)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now
+
+        Every allowed request must be followed by exactly one record() call.
+
+        Returns:
+            True if the request may proceed, False to fail fast
+        """
+        if self.failure_rate <= 0:
+            return True
+
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and self._probes < self.half_open_calls:
+            self._probes += 1
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record(self, success: Optional[bool], latency: float = 0.0) -> None:
+        """
+        Record the outcome of an allowed request
+
+        Args:
+            success: False if the upstream failed, True if it answered, or
+                None if the request never completed (e.g., cancelled);
+                None only frees a half-open probe slot
+            latency: Seconds the request took
+        """
+        if self.failure_rate <= 0:
+            return
+
+        if self._state == self.HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+            if success is None:
+                return
+            if success and latency <= self.slow_call_seconds:
+                self._close()
+            else:
+                self._open()
+            return
+
+        # Late results of requests sent before the breaker opened are ignored
+        if success is None or self._state != self.CLOSED:
+            return
+
+        self._outcomes.append(not success or latency > self.slow_call_seconds)
+        if len(self._outcomes) >= self.min_calls:
+            if sum(self._outcomes) / len(self._outcomes) >= self.failure_rate:
+                self._open()
+
+    def _open(self) -> None:
+        """Trip the breaker"""
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._probes = 0
+        self.times_opened += 1
+        logger.warning(
+            f"YouTube API circuit opened; failing fast for {self.open_seconds:.0f}s"
+        )
+
+    def _close(self) -> None:
+        """Resume normal operation"""
+        self._state = self.CLOSED
+        self._outcomes.clear()
+        logger.info("YouTube API circuit closed")
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded calls and counters"""
+        self._state = self.CLOSED
+        self._outcomes.clear()
+        self._probes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker statistics
+
+        Returns:
+            Dict with state, window_failure_rate, times_opened, rejected
+            and retry_in_seconds
+        """
+        failures = sum(self._outcomes)
+        return {
+            "state": self.state,
+            "window_failure_rate": (
+                round(failures / len(self._outcomes), 4) if self._outcomes else 0.0
+            ),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in_seconds": round(self.retry_in(), 2),
+        }
+
+
+# Process-wide circuit breaker shared by all YouTubeAPIClient instances
+_circuit_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """
+    Get the shared circuit breaker
+
+    Returns:
+        CircuitBreaker configured from settings
+    """
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker(
+            window_size=settings.YOUTUBE_BREAKER_WINDOW_SIZE,
+            min_calls=settings.YOUTUBE_BREAKER_MIN_CALLS,
+            failure_rate=settings.YOUTUBE_BREAKER_FAILURE_RATE,
+            slow_call_seconds=settings.YOUTUBE_BREAKER_SLOW_CALL_SECONDS,
+            open_seconds=settings.YOUTUBE_BREAKER_OPEN_SECONDS,
+            half_open_calls=settings.YOUTUBE_BREAKER_HALF_OPEN_CALLS,
+        )
+    return _circuit_breaker
@@ -0,0 +1,252 @@
+"""
+YouTube API Response Cache
+In-memory TTL + LRU cache for raw YouTube Data API responses and for
+resources known not to exist.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Hashable, Tuple
+import time
+
+from app.core.config import settings
+
+
+class CacheEntry:
+    """Cached response with its expiry time and ETag"""
+
+    __slots__ = ("expires_at", "value", "etag")
+
+    def __init__(self, expires_at: float, value: Dict[str, Any], etag: Optional[str] = None):
+        self.expires_at = expires_at
+        self.value = value
+        self.etag = etag
+
+    def is_fresh(self) -> bool:
+        """Check if the entry is still within its TTL"""
+        return self.expires_at > time.monotonic()
+
+
+class ResponseCache:
+    """
+    Bounded in-memory cache for YouTube API responses
+
+    Entries expire after a per-endpoint TTL and the least recently used
+    entry is evicted once max_entries is reached. Expired entries that
+    carry an ETag are kept so they can be revalidated with a conditional
+    request. Not thread-safe; meant to be shared by coroutines on one
+    event loop.
+
+    Negative results (deleted videos and channels, videos with comments
+    turned off) are kept separately, keyed by kind and resource ID, for
+    negative_ttl seconds, so repeat lookups can skip the request.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 300.0,
+        negative_ttl: float = 120.0
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttls: TTL in seconds per endpoint (e.g., {'channels': 86400})
+            default_ttl: TTL in seconds for endpoints not in ttls
+            negative_ttl: TTL in seconds of negative results (<= 0 disables them)
+        """
+        self.max_entries = max_entries
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.negative_hits = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._missing: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get TTL in seconds for an endpoint"""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Get a fresh cached response
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None on miss or expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_fresh():
+            # Keep expired entries with an ETag for conditional revalidation
+            if entry is not None and entry.etag is None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Get an entry whether fresh or expired, without touching counters or LRU order
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry or None
+        """
+        return self._entries.get(key)
+
+    def set(
+        self,
+        key: Hashable,
+        endpoint: str,
+        value: Dict[str, Any],
+        etag: Optional[str] = None
+    ) -> None:
+        """
+        Store a response, evicting least recently used entries if full
+
+        Args:
+            key: Cache key
+            endpoint: API endpoint the response came from (selects TTL)
+            value: Response to cache
+            etag: ETag of the response, for later revalidation
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        self._entries[key] = CacheEntry(time.monotonic() + ttl, value, etag)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: Hashable, endpoint: str) -> Optional[Dict[str, Any]]:
+        """
+        Restart an entry's TTL after a 304 Not Modified revalidation
+
+        Args:
+            key: Cache key
+            endpoint: API endpoint (selects TTL)
+
+        Returns:
+            The still-valid cached response, or None if the entry is gone
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        entry.expires_at = time.monotonic() + self.ttl_for(endpoint)
+        self._entries.move_to_end(key)
+        self.revalidations += 1
+        return entry.value
+
+    def mark_missing(self, kind: str, resource_id: str) -> None:
+        """
+        Remember that a resource does not exist (or has no comments)
+
+        Args:
+            kind: Resource kind (videos, channels, commentThreads)
+            resource_id: Video or channel ID
+        """
+        if self.negative_ttl <= 0 or self.max_entries <= 0:
+            return
+
+        key = (kind, resource_id)
+        self._missing[key] = time.monotonic() + self.negative_ttl
+        self._missing.move_to_end(key)
+        while len(self._missing) > self.max_entries:
+            self._missing.popitem(last=False)
+
+    def is_missing(self, kind: str, resource_id: str) -> bool:
+        """
+        Check whether a resource is known not to exist
+
+        Args:
+            kind: Resource kind (see mark_missing)
+            resource_id: Video or channel ID
+
+        Returns:
+            True if it was marked missing within negative_ttl
+        """
+        key = (kind, resource_id)
+        expires_at = self._missing.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._missing[key]
+            return False
+
+        self.negative_hits += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        self._entries.clear()
+        self._missing.clear()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.negative_hits = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size, max_entries, hits, misses, revalidations, hit_rate,
+            negative_size and negative_hits
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "negative_size": len(self._missing),
+            "negative_hits": self.negative_hits,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide response cache shared by all YouTubeAPIClient instances
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache
+
+    Returns:
+        ResponseCache instance, or None if YOUTUBE_CACHE_ENABLED is off
+    """
+    global _response_cache
+    if not settings.YOUTUBE_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=settings.YOUTUBE_CACHE_MAX_ENTRIES,
+            ttls={
+                "search": settings.YOUTUBE_CACHE_TTL_SEARCH,
+                "videos": settings.YOUTUBE_CACHE_TTL_VIDEOS,
+                "channels": settings.YOUTUBE_CACHE_TTL_CHANNELS,
+                "commentThreads": settings.YOUTUBE_CACHE_TTL_COMMENT_THREADS,
+                "comments": settings.YOUTUBE_CACHE_TTL_COMMENT_THREADS,
+            },
+            negative_ttl=settings.YOUTUBE_CACHE_TTL_NEGATIVE,
+        )
+    return _response_cache
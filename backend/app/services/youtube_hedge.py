@@ -0,0 +1,200 @@
+"""
+YouTube API Request Hedging
+Sends a duplicate of a slow idempotent read and uses whichever response arrives first.
+"""
+
+from collections import deque
+from typing import Optional, Dict, Any, Iterable
+import logging
+
+from app.core.config import settings
+from app.services.youtube_quota import QuotaLedger
+
+logger = logging.getLogger(__name__)
+
+
+class RequestHedger:
+    """
+    Hedging policy for outbound YouTube API reads
+
+    Only opted-in endpoints are hedged, and only those costing the default
+    single quota unit (videos, channels, ...); search is never duplicated.
+    A request still unanswered after the endpoint's hedge delay - the
+    `percentile` latency of its last window_size responses, clamped to
+    [min_delay, max_delay] - gets one duplicate, and the first usable
+    (not failed or retryable) response wins.
+
+    Hedges are paid for from a token budget: every request adds `budget`
+    tokens (up to max_tokens) and every hedge spends one, so duplicates stay
+    below `budget` of the traffic even when the API slows down as a whole.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = (),
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window_size: int = 200,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        budget: float = 0.05,
+        max_tokens: float = 10.0
+    ):
+        """
+        Initialize request hedger
+
+        Args:
+            endpoints: Endpoints to hedge (empty disables hedging)
+            percentile: Latency percentile (0-1) used as the hedge delay
+            min_samples: Responses recorded before an endpoint is hedged
+            window_size: Recent response latencies kept per endpoint
+            min_delay: Lower bound of the hedge delay in seconds
+            max_delay: Upper bound of the hedge delay in seconds
+            budget: Hedges allowed per request, i.e. the quota overhead bound
+            max_tokens: Largest burst of hedges the budget can save up
+        """
+        endpoints = set(endpoints)
+        costly = {
+            endpoint for endpoint in endpoints
+            if QuotaLedger.UNIT_COSTS.get(endpoint, QuotaLedger.DEFAULT_COST)
+            > QuotaLedger.DEFAULT_COST
+        }
+        if costly:
+            logger.warning(f"Not hedging costly endpoints: {', '.join(sorted(costly))}")
+        self.endpoints = frozenset(endpoints) - costly
+        self.percentile = min(max(percentile, 0.0), 1.0)
+        self.min_samples = max(min_samples, 1)
+        self.window_size = max(window_size, self.min_samples)
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self.budget = budget
+        self.max_tokens = max(max_tokens, 1.0)
+
+        self._latencies: Dict[str, "deque[float]"] = {}
+        self._tokens = 0.0
+
+        self.hedged = 0
+        self.wins = 0
+        self.skipped = 0
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """
+        Get how long to wait for a response before hedging it
+
+        Every request to a hedged endpoint must call this once, since it
+        also adds the request's share to the hedge budget.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            Delay in seconds, or None if requests to the endpoint are not
+            hedged (not opted in or too few latency samples yet)
+        """
+        if endpoint not in self.endpoints:
+            return None
+        self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+        return self._delay_from(self._latencies.get(endpoint))
+
+    def _delay_from(self, latencies: Optional["deque[float]"]) -> Optional[float]:
+        """Get the clamped percentile of a latency window (None if too few samples)"""
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        delay = ordered[int(self.percentile * (len(ordered) - 1))]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def try_hedge(self) -> bool:
+        """
+        Spend a budget token on a hedge
+
+        Returns:
+            True if the hedge may be sent, False if the budget is used up
+        """
+        if self._tokens < 1.0:
+            self.skipped += 1
+            return False
+        self._tokens -= 1.0
+        self.hedged += 1
+        return True
+
+    def record_latency(self, endpoint: str, latency: float) -> None:
+        """
+        Record how long a response to an endpoint took
+
+        Args:
+            endpoint: API endpoint
+            latency: Seconds until the response arrived
+        """
+        if endpoint not in self.endpoints:
+            return
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window_size)
+        latencies.append(latency)
+
+    def record_race(self, hedge_won: bool) -> None:
+        """
+        Record which request of a hedged pair answered first
+
+        Args:
+            hedge_won: True if the duplicate beat the original request
+        """
+        if hedge_won:
+            self.wins += 1
+
+    def reset(self) -> None:
+        """Forget recorded latencies, the saved budget and counters"""
+        self._latencies.clear()
+        self._tokens = 0.0
+        self.hedged = 0
+        self.wins = 0
+        self.skipped = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics
+
+        Returns:
+            Dict with endpoints, hedged, wins, win_rate (share of hedges
+            that answered first), skipped (hedges refused by the budget)
+            and delays (current hedge delay in seconds per endpoint)
+        """
+        delays = {}
+        for endpoint, latencies in self._latencies.items():
+            delay = self._delay_from(latencies)
+            if delay is not None:
+                delays[endpoint] = round(delay, 4)
+        return {
+            "endpoints": sorted(self.endpoints),
+            "hedged": self.hedged,
+            "wins": self.wins,
+            "win_rate": round(self.wins / self.hedged, 4) if self.hedged else 0.0,
+            "skipped": self.skipped,
+            "delays": delays,
+        }
+
+
+# Process-wide request hedger shared by all YouTubeAPIClient instances
+_request_hedger: Optional[RequestHedger] = None
+
+
+def get_request_hedger() -> RequestHedger:
+    """
+    Get the shared request hedger
+
+    Returns:
+        RequestHedger configured from settings
+    """
+    global _request_hedger
+    if _request_hedger is None:
+        _request_hedger = RequestHedger(
+            endpoints=settings.YOUTUBE_HEDGE_ENDPOINTS,
+            percentile=settings.YOUTUBE_HEDGE_PERCENTILE,
+            min_samples=settings.YOUTUBE_HEDGE_MIN_SAMPLES,
+            min_delay=settings.YOUTUBE_HEDGE_MIN_DELAY,
+            max_delay=settings.YOUTUBE_HEDGE_MAX_DELAY,
+            budget=settings.YOUTUBE_HEDGE_BUDGET,
+        )
+    return _request_hedger
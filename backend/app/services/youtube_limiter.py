@@ -0,0 +1,148 @@
+"""
+YouTube API Rate Limiter
+Token-bucket rate limiting and in-flight concurrency cap for outbound YouTube API calls.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator
+import asyncio
+import time
+
+from app.core.config import settings
+
+
+class RateLimiter:
+    """
+    Shared async limiter for outbound YouTube API requests
+
+    Every request first takes one of max_in_flight slots, then waits for
+    its endpoint's weight in tokens from a bucket refilled at
+    rate_per_second (up to burst tokens). Waiters are served in order.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 10.0,
+        burst: float = 20.0,
+        max_in_flight: int = 10,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate_per_second: Token refill rate (<= 0 disables rate limiting)
+            burst: Bucket capacity, i.e. the largest burst allowed
+            max_in_flight: Maximum concurrent requests (<= 0 disables the cap)
+            weights: Tokens per request by endpoint (default 1.0)
+        """
+        self.rate = rate_per_second
+        self.burst = max(burst, 1.0)
+        self.max_in_flight = max_in_flight
+        self.weights = weights or {}
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._token_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def weight_for(self, endpoint: str) -> float:
+        """Get tokens consumed by one request to an endpoint (capped at burst)"""
+        return min(self.weights.get(endpoint, 1.0), self.burst)
+
+    @asynccontextmanager
+    async def limit(self, endpoint: str) -> AsyncIterator[float]:
+        """
+        Hold a rate-limited request slot for the duration of a request
+
+        Args:
+            endpoint: API endpoint (selects the token weight)
+
+        Yields:
+            Seconds spent waiting for the slot and tokens
+        """
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            if self._slots is not None:
+                await self._slots.acquire()
+            try:
+                await self._take_tokens(self.weight_for(endpoint))
+            except BaseException:
+                if self._slots is not None:
+                    self._slots.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+        self.in_flight += 1
+        try:
+            yield waited
+        finally:
+            self.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    async def _take_tokens(self, weight: float) -> None:
+        """Wait until the bucket holds `weight` tokens, then take them"""
+        if self.rate <= 0:
+            return
+
+        async with self._token_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                await asyncio.sleep((weight - self._tokens) / self.rate)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics
+
+        Returns:
+            Dict with queue_depth, in_flight, acquired, avg_wait_seconds
+            and max_wait_seconds
+        """
+        return {
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "acquired": self.acquired,
+            "avg_wait_seconds": round(self.total_wait / self.acquired, 4) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait, 4),
+        }
+
+
+# Process-wide rate limiter shared by all YouTubeAPIClient instances
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the shared rate limiter
+
+    Returns:
+        RateLimiter configured from settings
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            rate_per_second=settings.YOUTUBE_RATE_LIMIT_PER_SECOND,
+            burst=settings.YOUTUBE_RATE_LIMIT_BURST,
+            max_in_flight=settings.YOUTUBE_MAX_IN_FLIGHT,
+            weights=settings.YOUTUBE_RATE_LIMIT_WEIGHTS,
+        )
+    return _rate_limiter
@@ -0,0 +1,501 @@
+"""
+YouTube API Quota Ledger
+Tracks quota units spent per API key and Pacific-time day, budgets requests
+before they are sent, and rotates across a pool of API keys.
+"""
+
+import asyncio
+import hashlib
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple, Callable, List, Iterable
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.quota import QuotaUsage
+
+logger = logging.getLogger(__name__)
+
+try:
+    PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:  # pragma: no cover - tzdata missing (e.g., slim images)
+    PACIFIC_TZ = timezone(timedelta(hours=-8))
+
+
+def quota_day(now: Optional[datetime] = None) -> date:
+    """
+    Get the quota day (Pacific calendar date) for a moment in time
+
+    Args:
+        now: Aware datetime (default: current time)
+
+    Returns:
+        Pacific-time date
+    """
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(PACIFIC_TZ).date()
+
+
+def next_quota_reset(now: Optional[datetime] = None) -> datetime:
+    """
+    Get when the daily quota next resets (midnight Pacific time)
+
+    Args:
+        now: Aware datetime (default: current time)
+
+    Returns:
+        Reset time as an aware UTC datetime
+    """
+    next_day = quota_day(now) + timedelta(days=1)
+    midnight = datetime(next_day.year, next_day.month, next_day.day, tzinfo=PACIFIC_TZ)
+    return midnight.astimezone(timezone.utc)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Get a short, non-reversible identifier for an API key (safe to log/persist)"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+class QuotaLedger:
+    """
+    Ledger of YouTube Data API quota units spent today by one API key
+
+    Usage is counted in memory so budgeting never waits on the database.
+    When a session factory is attached, unflushed usage is periodically
+    added to the youtube_quota_usage table and today's totals are re-read,
+    so restarts and other worker processes are accounted for.
+    """
+
+    # Quota cost per request (https://developers.google.com/youtube/v3/determine_quota_cost)
+    UNIT_COSTS = {
+        "search": 100,
+        "videos": 1,
+        "channels": 1,
+        "commentThreads": 1,
+        "comments": 1,
+    }
+    DEFAULT_COST = 1
+
+    def __init__(
+        self,
+        daily_limit: int = 10000,
+        reserve: int = 0,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        key_id: str = "default"
+    ):
+        """
+        Initialize quota ledger
+
+        Args:
+            daily_limit: Quota units available per day
+            reserve: Units kept back for cheap (1-unit) requests; more expensive
+                requests are rejected once they would dip into the reserve
+            session_factory: Async session factory for persistence (None = memory only)
+            key_id: Fingerprint of the API key this ledger accounts for
+        """
+        self.key_id = key_id
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self.session_factory = session_factory
+        self._day = quota_day()
+        self._units: Dict[str, int] = {}
+        self._requests: Dict[str, int] = {}
+        self._pending: Dict[Tuple[date, str], list] = {}
+
+    def cost_of(self, endpoint: str) -> int:
+        """Get the quota cost of one request to an endpoint"""
+        return self.UNIT_COSTS.get(endpoint, self.DEFAULT_COST)
+
+    def _roll_over(self) -> None:
+        """Reset today's counters when the Pacific-time day has changed"""
+        today = quota_day()
+        if today != self._day:
+            self._day = today
+            self._units.clear()
+            self._requests.clear()
+
+    @property
+    def used(self) -> int:
+        """Units spent today"""
+        self._roll_over()
+        return sum(self._units.values())
+
+    @property
+    def remaining(self) -> int:
+        """Units left today"""
+        return max(0, self.daily_limit - self.used)
+
+    def can_afford(self, endpoint: str) -> bool:
+        """
+        Check whether a request fits in today's remaining budget
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            True if the request may be sent
+        """
+        cost = self.cost_of(endpoint)
+        floor = self.reserve if cost > self.DEFAULT_COST else 0
+        return self.remaining - cost >= floor
+
+    def charge(self, endpoint: str, units: Optional[int] = None) -> int:
+        """
+        Record units spent on a request
+
+        Args:
+            endpoint: API endpoint
+            units: Units to record (default: the endpoint's cost)
+
+        Returns:
+            Units recorded
+        """
+        self._roll_over()
+        units = self.cost_of(endpoint) if units is None else units
+        self._units[endpoint] = self._units.get(endpoint, 0) + units
+        self._requests[endpoint] = self._requests.get(endpoint, 0) + 1
+
+        pending = self._pending.setdefault((self._day, endpoint), [0, 0])
+        pending[0] += units
+        pending[1] += 1
+        return units
+
+    def mark_exhausted(self) -> None:
+        """Treat today's quota as spent (the API reported quotaExceeded)"""
+        remaining = self.remaining
+        if remaining > 0:
+            self._units["quotaExceeded"] = self._units.get("quotaExceeded", 0) + remaining
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get today's quota status
+
+        Returns:
+            Dict with daily_limit, used_units, remaining_units, resets_at and
+            per-endpoint units (by_endpoint)
+        """
+        self._roll_over()
+        return {
+            "daily_limit": self.daily_limit,
+            "used_units": self.used,
+            "remaining_units": self.remaining,
+            "resets_at": next_quota_reset(),
+            "by_endpoint": dict(self._units),
+        }
+
+    async def load(self) -> None:
+        """Load today's usage from the database"""
+        if self.session_factory is None:
+            return
+
+        try:
+            async with self.session_factory() as session:
+                await self._sync_totals(session)
+        except Exception as e:
+            logger.warning(f"Failed to load quota ledger: {e}")
+
+    async def _sync_totals(self, session: AsyncSession) -> None:
+        """Replace today's in-memory totals with persisted totals plus unflushed usage"""
+        self._roll_over()
+        day = self._day
+        result = await session.execute(
+            select(QuotaUsage).where(
+                QuotaUsage.quota_date == day, QuotaUsage.key_id == self.key_id
+            )
+        )
+        units = {}
+        requests = {}
+        for row in result.scalars():
+            units[row.endpoint] = row.units
+            requests[row.endpoint] = row.request_count
+        for (pending_day, endpoint), (pending_units, pending_requests) in self._pending.items():
+            if pending_day == day:
+                units[endpoint] = units.get(endpoint, 0) + pending_units
+                requests[endpoint] = requests.get(endpoint, 0) + pending_requests
+
+        # Keep a locally detected quotaExceeded until the day rolls over
+        if "quotaExceeded" in self._units:
+            units["quotaExceeded"] = self._units["quotaExceeded"]
+        self._units = units
+        self._requests = requests
+
+    async def flush(self) -> None:
+        """Add unflushed usage to the database and re-read today's totals"""
+        if self.session_factory is None:
+            return
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with self.session_factory() as session:
+                for (day, endpoint), (units, requests) in pending.items():
+                    await self._add_usage(session, day, self.key_id, endpoint, units, requests)
+                await session.commit()
+                await self._sync_totals(session)
+        except Exception as e:
+            logger.warning(f"Failed to flush quota ledger: {e}")
+            # Put usage back so it is retried on the next flush
+            for key, (units, requests) in pending.items():
+                current = self._pending.setdefault(key, [0, 0])
+                current[0] += units
+                current[1] += requests
+
+    @staticmethod
+    async def _add_usage(
+        session: AsyncSession,
+        day: date,
+        key_id: str,
+        endpoint: str,
+        units: int,
+        requests: int
+    ) -> None:
+        """Increment (or create) the usage row for a day, key and endpoint"""
+        stmt = (
+            update(QuotaUsage)
+            .where(
+                QuotaUsage.quota_date == day,
+                QuotaUsage.key_id == key_id,
+                QuotaUsage.endpoint == endpoint,
+            )
+            .values(
+                units=QuotaUsage.units + units,
+                request_count=QuotaUsage.request_count + requests,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        result = await session.execute(stmt)
+        if result.rowcount:
+            return
+
+        try:
+            async with session.begin_nested():
+                session.add(QuotaUsage(
+                    quota_date=day,
+                    key_id=key_id,
+                    endpoint=endpoint,
+                    units=units,
+                    request_count=requests,
+                    updated_at=datetime.utcnow(),
+                ))
+        except IntegrityError:
+            # Another worker inserted the row first
+            await session.execute(stmt)
+
+
+class APIKeyPool:
+    """
+    Pool of YouTube API keys, each with its own quota ledger
+
+    Requests go to the key with the most remaining budget that can afford
+    them, so throughput scales with the number of provisioned keys. A key
+    that hits quotaExceeded is marked exhausted until the daily reset.
+    """
+
+    def __init__(
+        self,
+        api_keys: Iterable[str] = (),
+        daily_limit: int = 10000,
+        reserve: int = 0,
+        session_factory: Optional[Callable[[], AsyncSession]] = None
+    ):
+        """
+        Initialize API key pool
+
+        Args:
+            api_keys: API keys to pool
+            daily_limit: Quota units available per key per day
+            reserve: Units per key kept back for cheap requests (see QuotaLedger)
+            session_factory: Async session factory for persistence (None = memory only)
+        """
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self.session_factory = session_factory
+        self._ledgers: Dict[str, QuotaLedger] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        for api_key in api_keys:
+            self.ledger_for(api_key)
+
+    @property
+    def keys(self) -> List[str]:
+        """API keys in the pool"""
+        return list(self._ledgers)
+
+    def ledger_for(self, api_key: str) -> QuotaLedger:
+        """
+        Get the ledger for an API key, adding the key to the pool if new
+
+        Args:
+            api_key: YouTube API key
+
+        Returns:
+            QuotaLedger for the key
+        """
+        ledger = self._ledgers.get(api_key)
+        if ledger is None:
+            ledger = QuotaLedger(
+                daily_limit=self.daily_limit,
+                reserve=self.reserve,
+                session_factory=self.session_factory,
+                key_id=key_fingerprint(api_key),
+            )
+            self._ledgers[api_key] = ledger
+        return ledger
+
+    def select(
+        self,
+        endpoint: str,
+        api_keys: Optional[Iterable[str]] = None,
+        exclude: Iterable[str] = ()
+    ) -> Optional[Tuple[str, QuotaLedger]]:
+        """
+        Pick the key with the most remaining budget that can afford a request
+
+        Args:
+            endpoint: API endpoint
+            api_keys: Keys to choose from (default: every key in the pool)
+            exclude: Keys to skip (e.g., already rejected for this request)
+
+        Returns:
+            Tuple of (api_key, ledger), or None if no key can afford it
+        """
+        excluded = set(exclude)
+        candidates = [
+            (api_key, self.ledger_for(api_key))
+            for api_key in (api_keys if api_keys is not None else self.keys)
+            if api_key not in excluded
+        ]
+        affordable = [(k, ledger) for k, ledger in candidates if ledger.can_afford(endpoint)]
+        if not affordable:
+            return None
+        return max(affordable, key=lambda candidate: candidate[1].remaining)
+
+    def status(self, api_keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Get combined quota status across keys
+
+        Args:
+            api_keys: Keys to include (default: every key in the pool)
+
+        Returns:
+            Dict with daily_limit, used_units, remaining_units and resets_at
+            summed over the keys, plus per-key status under keys
+        """
+        ledgers = [
+            self.ledger_for(api_key)
+            for api_key in (api_keys if api_keys is not None else self.keys)
+        ]
+        per_key = [
+            {"key_id": ledger.key_id, **ledger.status()}
+            for ledger in ledgers
+        ]
+        return {
+            "daily_limit": sum(s["daily_limit"] for s in per_key),
+            "used_units": sum(s["used_units"] for s in per_key),
+            "remaining_units": sum(s["remaining_units"] for s in per_key),
+            "resets_at": next_quota_reset(),
+            "keys": per_key,
+        }
+
+    def attach(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Attach database persistence to the pool and all its ledgers"""
+        self.session_factory = session_factory
+        for ledger in self._ledgers.values():
+            ledger.session_factory = session_factory
+
+    async def load(self) -> None:
+        """Load today's usage for every key from the database"""
+        for ledger in self._ledgers.values():
+            await ledger.load()
+
+    async def flush(self) -> None:
+        """Write unflushed usage for every key to the database"""
+        for ledger in list(self._ledgers.values()):
+            await ledger.flush()
+
+    def start(self, interval: float) -> None:
+        """
+        Start flushing usage to the database in the background
+
+        Args:
+            interval: Seconds between flushes
+        """
+        if self.session_factory is None or self._flush_task is not None:
+            return
+
+        async def flush_periodically():
+            while True:
+                await asyncio.sleep(interval)
+                await self.flush()
+
+        self._flush_task = asyncio.create_task(flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop background flushing and write any remaining usage"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+
+def configured_api_keys() -> List[str]:
+    """
+    Get API keys from settings (YOUTUBE_API_KEYS plus YOUTUBE_API_KEY)
+
+    Returns:
+        De-duplicated list of non-empty keys
+    """
+    keys = list(settings.YOUTUBE_API_KEYS)
+    if settings.YOUTUBE_API_KEY:
+        keys.append(settings.YOUTUBE_API_KEY)
+    return list(dict.fromkeys(k.strip() for k in keys if k and k.strip()))
+
+
+# Process-wide key pool shared by all YouTubeAPIClient instances
+_key_pool: Optional[APIKeyPool] = None
+
+
+def get_key_pool() -> APIKeyPool:
+    """
+    Get the shared API key pool (memory-only until init_quota_ledger() is called)
+
+    Returns:
+        APIKeyPool with the configured keys
+    """
+    global _key_pool
+    if _key_pool is None:
+        _key_pool = APIKeyPool(
+            configured_api_keys(),
+            daily_limit=settings.YOUTUBE_DAILY_QUOTA,
+            reserve=settings.YOUTUBE_QUOTA_RESERVE,
+        )
+    return _key_pool
+
+
+async def init_quota_ledger(session_factory: Callable[[], AsyncSession]) -> APIKeyPool:
+    """
+    Attach database persistence to the shared key pool (call from app startup)
+
+    Args:
+        session_factory: Async session factory
+
+    Returns:
+        The shared APIKeyPool
+    """
+    pool = get_key_pool()
+    pool.attach(session_factory)
+    await pool.load()
+    pool.start(settings.YOUTUBE_QUOTA_FLUSH_INTERVAL)
+    return pool
+
+
+async def close_quota_ledger() -> None:
+    """Flush and stop the shared key pool (call from app shutdown)"""
+    if _key_pool is not None:
+        await _key_pool.stop()
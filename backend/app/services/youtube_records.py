@@ -0,0 +1,75 @@
+"""
+YouTube Data Records
+Compact slotted records for parsed YouTube API entities.
+
+YouTubeAPIClient returns these instead of per-item dicts: slots keep each
+record small and attribute access cheap when thousands of comments are
+parsed. Fields left out of a partial-response projection keep their
+defaults.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """search.list video result"""
+
+    video_id: str
+    title: str = ""
+    description: str = ""
+    channel_id: str = ""
+    channel_title: str = ""
+    published_at: Optional[datetime] = None
+    thumbnail_url: str = ""
+
+
+@dataclass(slots=True)
+class VideoDetails:
+    """videos.list item"""
+
+    video_id: str
+    title: str = ""
+    description: str = ""
+    channel_id: str = ""
+    channel_title: str = ""
+    published_at: Optional[datetime] = None
+    duration: str = ""  # ISO 8601, e.g. PT15M30S
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    thumbnail_url: str = ""
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Comment:
+    """Top-level comment of a commentThreads.list item, or a reply to one"""
+
+    comment_id: str
+    text: str = ""
+    author_name: str = ""
+    author_channel_id: str = ""
+    like_count: int = 0
+    published_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    reply_count: int = 0  # total replies to a top-level comment
+    parent_id: str = ""  # top-level comment ID, set on replies only
+    replies: List["Comment"] = field(default_factory=list)  # replies embedded in the thread
+
+
+@dataclass(slots=True)
+class Channel:
+    """channels.list item"""
+
+    channel_id: str
+    title: str = ""
+    description: str = ""
+    custom_url: str = ""
+    published_at: Optional[datetime] = None
+    thumbnail_url: str = ""
+    subscriber_count: int = 0
+    video_count: int = 0
+    view_count: int = 0
@@ -0,0 +1,243 @@
+"""
+YouTube API Record/Replay Transport
+httpx transports that record YouTube Data API responses to disk and replay them offline.
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingNotFoundError(LookupError):
+    """No recorded response matches a replayed request"""
+    pass
+
+
+def recording_key(request: httpx.Request) -> Tuple[str, ...]:
+    """
+    Build the identity a recording is stored under
+
+    Same shape as YouTubeAPIClient._request_key: the endpoint plus the
+    sorted query params, ignoring the API key, so recordings made with one
+    key replay for any other.
+
+    Args:
+        request: Outbound request to the YouTube Data API
+
+    Returns:
+        Tuple of endpoint and sorted "name=value" params
+    """
+    endpoint = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+    normalized = sorted(
+        f"{name}={value}" for name, value in request.url.params.multi_items() if name != "key"
+    )
+    return (endpoint, *normalized)
+
+
+def recording_path(directory: Path, key: Tuple[str, ...]) -> Path:
+    """Get the file a recording is stored in: <directory>/<endpoint>/<sha1 of key>.json"""
+    digest = hashlib.sha1("\n".join(key).encode("utf-8")).hexdigest()
+    return directory / key[0] / f"{digest}.json"
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that sends requests upstream and saves every response to disk
+
+    Each response is written as one JSON file holding the request key,
+    status, ETag and content type, upstream latency and body. Re-recording
+    a request overwrites its file. The API key is never written.
+    """
+
+    RECORDED_HEADERS = ("content-type", "etag")
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize recording transport
+
+        Args:
+            directory: Directory recordings are written to (created if missing)
+            transport: Upstream transport. Defaults to a plain httpx.AsyncHTTPTransport.
+        """
+        self.directory = Path(directory)
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.recorded = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - started
+
+        headers = {
+            name: response.headers[name]
+            for name in self.RECORDED_HEADERS
+            if name in response.headers
+        }
+        key = recording_key(request)
+        # 304s only make sense for the client's cached copy; keep the full response
+        if response.status_code != 304:
+            self._save(key, {
+                "key": list(key),
+                "status": response.status_code,
+                "headers": headers,
+                "elapsed": round(elapsed, 4),
+                "body": body.decode("utf-8", errors="replace"),
+            })
+
+        # The body was already decompressed while reading it
+        passthrough = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            response.status_code, headers=passthrough, content=body, request=request
+        )
+
+    def _save(self, key: Tuple[str, ...], recording: Dict[str, Any]) -> None:
+        """Write one recording to disk"""
+        path = recording_path(self.directory, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(recording, ensure_ascii=False, indent=1), encoding="utf-8")
+        self.recorded += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that answers requests from recordings, without network access
+
+    Requests are matched by recording_key(). Each response is delayed by
+    `latency` seconds (the recorded upstream latency if None), plus or minus
+    up to `jitter` seconds. A request carrying the recorded ETag in
+    If-None-Match gets a 304, as the real API would answer. Recordings are
+    read from disk once and kept in memory.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        latency: Optional[float] = None,
+        jitter: float = 0.0
+    ):
+        """
+        Initialize replay transport
+
+        Args:
+            directory: Directory written by RecordingTransport
+            latency: Seconds each response is delayed (None = recorded latency)
+            jitter: Maximum seconds of uniform random jitter added or subtracted
+        """
+        self.directory = Path(directory)
+        self.latency = latency
+        self.jitter = max(jitter, 0.0)
+        self._recordings: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self.replayed = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = recording_key(request)
+        recording = self._load(key)
+
+        delay = recording.get("elapsed", 0.0) if self.latency is None else self.latency
+        if self.jitter:
+            delay += random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        self.replayed += 1
+        etag = recording["etag"]
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag}, request=request)
+
+        return httpx.Response(
+            recording["status"],
+            headers=recording["headers"],
+            content=recording["content"],
+            request=request,
+        )
+
+    def _load(self, key: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Get a recording, reading it from disk on first use
+
+        Raises:
+            RecordingNotFoundError: If the request was never recorded
+        """
+        recording = self._recordings.get(key)
+        if recording is not None:
+            return recording
+
+        path = recording_path(self.directory, key)
+        try:
+            recording = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise RecordingNotFoundError(
+                f"No recording for {key[0]} request {' '.join(key[1:])} in {self.directory}. "
+                "Record it first with YOUTUBE_REPLAY_MODE=record."
+            )
+
+        recording["content"] = recording.pop("body").encode("utf-8")
+        etag = recording["headers"].get("etag")
+        if etag is None and recording["status"] < 400:
+            try:
+                etag = json.loads(recording["content"]).get("etag")
+            except (ValueError, AttributeError):
+                etag = None
+        recording["etag"] = etag
+
+        self._recordings[key] = recording
+        return recording
+
+
+def create_replay_transport(
+    transport: httpx.AsyncBaseTransport
+) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Wrap the live transport according to settings.YOUTUBE_REPLAY_MODE
+
+    Args:
+        transport: Live transport to the YouTube Data API
+
+    Returns:
+        RecordingTransport for "record", ReplayTransport for "replay", or
+        None when replay mode is off
+
+    Raises:
+        ValueError: If YOUTUBE_REPLAY_MODE is not "", "record" or "replay"
+    """
+    mode = settings.YOUTUBE_REPLAY_MODE
+    if not mode:
+        return None
+
+    directory = settings.YOUTUBE_REPLAY_DIR
+    if mode == "record":
+        logger.warning(f"Recording YouTube API responses to {directory}")
+        return RecordingTransport(directory, transport)
+    if mode == "replay":
+        logger.warning(f"Replaying recorded YouTube API responses from {directory}")
+        return ReplayTransport(
+            directory,
+            latency=settings.YOUTUBE_REPLAY_LATENCY,
+            jitter=settings.YOUTUBE_REPLAY_JITTER,
+        )
+    raise ValueError(f"Unknown YOUTUBE_REPLAY_MODE: {mode!r} (expected 'record' or 'replay')")
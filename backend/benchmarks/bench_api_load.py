@@ -0,0 +1,135 @@
+"""
+HTTP load test for /keywords/analyze and /comments/analyze
+
+Sends concurrent requests to a running API server and reports latency
+percentiles, throughput, status codes and the server's request hedging
+statistics (/api/v1/metrics). Point the server at the fake
+YouTube API (benchmarks.fake_youtube) to measure it without network
+access or quota:
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_api_load --create-db ./bench.db
+    python -m benchmarks.fake_youtube --port 8100 --latency 0.08 --jitter 0.03 --daily-quota 0
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db \\
+    YOUTUBE_DAILY_QUOTA=100000000 YOUTUBE_QUOTA_RESERVE=0 \\
+    YOUTUBE_API_BASE_URL=http://127.0.0.1:8100/youtube/v3 YOUTUBE_API_KEY=fake \\
+        uvicorn main:app --port 8000
+    python -m benchmarks.bench_api_load --endpoint keywords \\
+        [--requests 200] [--concurrency 16] [--distinct 50]
+
+Run the server against a throwaway database (--create-db replaces the
+file with empty tables) and lift the client-side quota ledger: it
+persists usage per day, so with the production defaults a run exhausts
+the ledger and later runs that day fail with 503. Keyword analyses are
+cached in the database, so --distinct controls how many different
+keywords (or videos) the requests are spread over.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+KEYWORDS = ["파이썬 강의", "캠핑 브이로그", "iPhone review", "주식 투자", "home workout"]
+
+
+async def create_database(path: Path) -> None:
+    """Replace path with a new SQLite database holding empty app tables"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    import app.models  # noqa: F401  (registers the models' tables)
+    from app.db.base import Base
+
+    path.unlink(missing_ok=True)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+def request_body(endpoint: str, index: int) -> dict:
+    """Request body for the index-th distinct keyword or video"""
+    if endpoint == "keywords":
+        return {"keyword": f"{KEYWORDS[index % len(KEYWORDS)]} {index}"}
+    return {"video_url": f"https://youtu.be/load{index:07d}"}
+
+
+async def run(args: argparse.Namespace) -> None:
+    path = {"keywords": "/api/v1/keywords/analyze", "comments": "/api/v1/comments/analyze"}
+    url = args.target.rstrip("/") + path[args.endpoint]
+    slots = asyncio.Semaphore(args.concurrency)
+    durations = []
+    statuses: Counter = Counter()
+
+    async with httpx.AsyncClient(timeout=args.timeout) as client:
+        async def send(index: int) -> None:
+            async with slots:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        url, json=request_body(args.endpoint, index % args.distinct)
+                    )
+                    statuses[response.status_code] += 1
+                except httpx.HTTPError as e:
+                    statuses[type(e).__name__] += 1
+                durations.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(send(i) for i in range(args.requests)))
+        wall = time.perf_counter() - started
+
+        try:
+            metrics = await client.get(args.target.rstrip("/") + "/api/v1/metrics")
+            hedging = metrics.json()["data"]["youtube"]["hedging"]
+        except (httpx.HTTPError, ValueError, KeyError, TypeError):
+            hedging = None
+
+    durations.sort()
+
+    def percentile(share: float) -> float:
+        return durations[min(len(durations) - 1, int(len(durations) * share))] * 1000
+
+    print(f"{args.requests} requests to {url}, concurrency {args.concurrency}")
+    print(f"p50 {statistics.median(durations) * 1000:8.1f} ms")
+    print(f"p95 {percentile(0.95):8.1f} ms")
+    print(f"p99 {percentile(0.99):8.1f} ms")
+    print(f"throughput {args.requests / wall:6.2f} req/s")
+    print("status " + ", ".join(f"{status}: {count}" for status, count in statuses.most_common()))
+    if hedging is None:
+        print("hedging n/a (metrics unavailable)")
+    elif hedging["endpoints"]:
+        print(f"hedging {hedging['hedged']} hedged, win rate {hedging['win_rate']:.1%}, "
+              f"{hedging['skipped']} over budget (totals since server start)")
+    else:
+        print("hedging off (YOUTUBE_HEDGE_ENDPOINTS is empty)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoint", choices=["keywords", "comments"], default="keywords")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=50, help="different keywords/videos")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--create-db", type=Path, metavar="PATH",
+        help="create a throwaway SQLite database for the server at PATH and exit",
+    )
+    args = parser.parse_args()
+    args.distinct = max(args.distinct, 1)
+
+    if args.create_db:
+        asyncio.run(create_database(args.create_db))
+        print(f"Created {args.create_db}; start the server with "
+              f"DATABASE_URL=sqlite+aiosqlite:///{args.create_db}")
+        return
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+commentThreads decode microbenchmark
+
+Compares decoding commentThreads.list pages the old way (httpx
+Response.json(), stdlib decoder over a decoded str) with decode_json()
+(orjson over raw bytes when installed), both followed by record parsing.
+
+With --recordings, the pages are the commentThreads.list response bodies
+RecordingTransport saved to that directory (e.g. by
+`python -m benchmarks.bench_comment_pipeline --record`). Without it, the
+pages are synthetic: generated in the shape of commentThreads.list
+responses (full `snippet` part, 100 threads per page, mixed
+Korean/English text).
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_comment_decode [--pages 20] [--repeat 5]
+    python -m benchmarks.bench_comment_decode --recordings ./youtube_recordings
+"""
+import argparse
+import json
+from pathlib import Path
+import time
+
+import httpx
+
+from app.services import youtube
+from app.services.youtube import YouTubeAPIClient, decode_json
+from app.services.youtube_replay import recording_path
+
+TEXTS = [
+    "정말 좋은 영상이에요! 다음 영상도 기대됩니다 👍",
+    "파이썬 강의 덕분에 취업했습니다. 감사합니다!!",
+    "Great explanation, could you please make a video about asyncio?",
+    "3:15 부분에서 설명이 조금 빨라요. 천천히 다시 해주세요",
+    "This is the best tutorial on YouTube, hands down.",
+]
+
+
+def comment_thread(page: int, index: int) -> dict:
+    """One commentThreads.list item with the full snippet part"""
+    text = TEXTS[index % len(TEXTS)] * (1 + index % 3)
+    comment_id = f"Ugz{page:04d}{index:04d}xYz4AaABAg"
+    return {
+        "kind": "youtube#commentThread",
+        "etag": f"etag-{page}-{index}",
+        "id": comment_id,
+        "snippet": {
+            "channelId": "UCabcdefghijklmnopqrstuv",
+            "videoId": "dQw4w9WgXcQ",
+            "topLevelComment": {
+                "kind": "youtube#comment",
+                "etag": f"etag-c-{page}-{index}",
+                "id": comment_id,
+                "snippet": {
+                    "channelId": "UCabcdefghijklmnopqrstuv",
+                    "videoId": "dQw4w9WgXcQ",
+                    "textDisplay": text,
+                    "textOriginal": text,
+                    "authorDisplayName": f"@viewer{index}",
+                    "authorProfileImageUrl": f"https://yt3.ggpht.com/ytc/{comment_id}=s48-c-k-c0x00ffffff-no-rj",
+                    "authorChannelUrl": f"http://www.youtube.com/@viewer{index}",
+                    "authorChannelId": {"value": f"UCviewer{index:016d}"},
+                    "canRate": True,
+                    "viewerRating": "none",
+                    "likeCount": index * 7 % 500,
+                    "publishedAt": "2024-01-15T09:30:00Z",
+                    "updatedAt": "2024-01-15T09:30:00Z",
+                },
+            },
+            "canReply": True,
+            "totalReplyCount": index % 4,
+            "isPublic": True,
+        },
+    }
+
+
+def build_pages(count: int) -> list:
+    """Encode `count` 100-thread pages to bytes, as received off the wire"""
+    return [
+        json.dumps({
+            "kind": "youtube#commentThreadListResponse",
+            "etag": f"page-etag-{page}",
+            "nextPageToken": f"token-{page + 1}",
+            "pageInfo": {"totalResults": 100, "resultsPerPage": 100},
+            "items": [comment_thread(page, i) for i in range(100)],
+        }, ensure_ascii=False).encode()
+        for page in range(count)
+    ]
+
+
+def load_recorded_pages(directory: Path) -> list:
+    """Read the successful commentThreads.list bodies recorded in `directory` as bytes"""
+    pages = []
+    for path in sorted(recording_path(directory, ("commentThreads",)).parent.glob("*.json")):
+        recording = json.loads(path.read_text(encoding="utf-8"))
+        if recording["status"] < 400:
+            pages.append(recording["body"].encode("utf-8"))
+    return pages
+
+
+def run(label: str, pages: list, decode, repeat: int) -> float:
+    """Decode and parse every page `repeat` times; report the best round"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in pages:
+            data = decode(body)
+            for item in data["items"]:
+                YouTubeAPIClient._parse_comment_thread(item)
+        best = min(best, time.perf_counter() - started)
+
+    per_page_ms = best / len(pages) * 1000
+    print(f"{label:<34} {best * 1000:8.1f} ms total  {per_page_ms:6.3f} ms/page")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20, help="synthetic pages to build")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--recordings", type=Path, default=None,
+        help="RecordingTransport directory to take commentThreads pages from"
+    )
+    args = parser.parse_args()
+
+    if args.recordings is None:
+        pages = build_pages(args.pages)
+        source = "synthetic"
+    else:
+        pages = load_recorded_pages(args.recordings)
+        if not pages:
+            parser.error(f"no recorded commentThreads pages in {args.recordings}")
+        source = "recorded"
+    threads = sum(len(decode_json(body).get("items", [])) for body in pages)
+    size_kb = sum(len(body) for body in pages) / len(pages) / 1024
+    print(f"{len(pages)} {source} pages, {threads} threads, {size_kb:.1f} KiB/page\n")
+
+    baseline = run(
+        "httpx Response.json() (stdlib)",
+        pages,
+        lambda body: httpx.Response(200, content=body).json(),
+        args.repeat,
+    )
+    if youtube.orjson is None:
+        print("orjson is not installed; decode_json() uses the stdlib decoder")
+    fast = run("decode_json(bytes)", pages, decode_json, args.repeat)
+    print(f"\nspeedup: {baseline / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
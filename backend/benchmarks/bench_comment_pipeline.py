@@ -0,0 +1,110 @@
+"""
+Comment analysis pipeline load test against recorded API responses
+
+Runs CommentCollectorService.collect_comments() end to end (request,
+decode, parse, reply fetching, analysis) with the YouTube Data API
+answered by ReplayTransport, so it needs neither network nor API key.
+The response cache is bypassed so every run exercises the full path.
+
+Record the responses once on a machine with a key, then replay anywhere:
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_comment_pipeline --record --video dQw4w9WgXcQ
+    python -m benchmarks.bench_comment_pipeline --video dQw4w9WgXcQ \\
+        [--runs 20] [--concurrency 4] [--latency 0.08] [--jitter 0.03]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.services.comment_collector import CommentCollectorService
+from app.services.youtube import YouTubeAPIClient
+from app.services.youtube_breaker import CircuitBreaker
+from app.services.youtube_limiter import RateLimiter
+from app.services.youtube_quota import APIKeyPool
+from app.services.youtube_replay import RecordingTransport, ReplayTransport
+
+
+def make_client(transport: httpx.AsyncBaseTransport, api_key: str) -> YouTubeAPIClient:
+    """Client with private quota, limiter and breaker so replays never run dry"""
+    return YouTubeAPIClient(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(transport=transport, timeout=YouTubeAPIClient.TIMEOUT),
+        use_cache=False,
+        key_pool=APIKeyPool([api_key], daily_limit=10 ** 9),
+        limiter=RateLimiter(rate_per_second=0, max_in_flight=0),
+        breaker=CircuitBreaker(failure_rate=0),
+    )
+
+
+async def record(video_id: str, directory: str) -> None:
+    """Run the pipeline once against the live API, saving every response"""
+    api_key = settings.YOUTUBE_API_KEY or next(iter(settings.YOUTUBE_API_KEYS), None)
+    if not api_key:
+        raise SystemExit("Recording needs YOUTUBE_API_KEY")
+
+    transport = RecordingTransport(directory)
+    async with make_client(transport, api_key) as client:
+        await CommentCollectorService(client).collect_comments(f"https://youtu.be/{video_id}")
+        await client.client.aclose()
+    print(f"recorded {transport.recorded} responses to {directory}")
+
+
+async def replay(args: argparse.Namespace) -> None:
+    """Run the pipeline `runs` times, `concurrency` at a time, and report latencies"""
+    transport = ReplayTransport(args.dir, latency=args.latency, jitter=args.jitter)
+    client = make_client(transport, "replay")
+    service = CommentCollectorService(client)
+    url = f"https://youtu.be/{args.video}"
+    slots = asyncio.Semaphore(args.concurrency)
+    durations = []
+
+    async def run_once() -> None:
+        async with slots:
+            started = time.perf_counter()
+            await service.collect_comments(url)
+            durations.append(time.perf_counter() - started)
+
+    await service.collect_comments(url)  # warm up: load recordings into memory
+    transport.replayed = 0
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run_once() for _ in range(args.runs)))
+    wall = time.perf_counter() - started
+    await client.client.aclose()
+
+    durations.sort()
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    print(f"{args.runs} runs, concurrency {args.concurrency}, "
+          f"{transport.replayed / args.runs:.1f} API responses per run "
+          "(identical concurrent requests are coalesced)")
+    print(f"p50 {statistics.median(durations) * 1000:8.1f} ms")
+    print(f"p95 {p95 * 1000:8.1f} ms")
+    print(f"throughput {args.runs / wall:6.2f} runs/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--video", required=True, help="11-character video ID")
+    parser.add_argument("--dir", default=settings.YOUTUBE_REPLAY_DIR)
+    parser.add_argument("--record", action="store_true", help="record from the live API")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=None,
+                        help="seconds per response (default: as recorded)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.video, args.dir))
+    else:
+        asyncio.run(replay(args))
+
+
+if __name__ == "__main__":
+    main()
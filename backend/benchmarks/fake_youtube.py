@@ -0,0 +1,566 @@
+"""
+Fake YouTube Data API server for load testing
+
+A self-contained ASGI stand-in for search, videos, channels,
+commentThreads and comments (replies). Every resource is generated
+deterministically from its ID or query, with mixed Korean/English text,
+so repeated runs see the same data without network access.
+
+Follows the real API where the client depends on it:
+- maxResults bounds and nextPageToken/prevPageToken paging
+  (search stops after 500 results, like the real API)
+- comma-separated id= lookups of up to 50 IDs, unknown IDs left out
+- part= selects the resource parts returned
+- quota units charged per API key with the real unit costs; an exhausted
+  key gets the real 403 quotaExceeded error body
+- ETag headers and 304 answers to If-None-Match
+
+fields= masks and search filters (order, publishedAfter, ...) are
+accepted and ignored.
+
+Usage:
+    cd backend
+    python -m benchmarks.fake_youtube [--port 8100] [--latency 0.08] \\
+        [--jitter 0.03] [--daily-quota 10000]
+    YOUTUBE_API_BASE_URL=http://127.0.0.1:8100/youtube/v3 YOUTUBE_API_KEY=fake \\
+        uvicorn main:app --port 8000
+
+In-process: httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app()))
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+from collections import OrderedDict
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from app.services.youtube_quota import QuotaLedger
+
+BASE_PATH = "/youtube/v3"
+SEARCH_RESULT_CAP = 500  # results search.list serves per query, across pages
+MAX_IDS_PER_REQUEST = 50
+EMBEDDED_REPLIES = 5  # replies commentThreads.list includes per thread
+
+KO_WORDS = ["강의", "리뷰", "브이로그", "꿀팁", "입문", "총정리", "실전", "비교", "추천", "후기"]
+EN_WORDS = [
+    "tutorial", "review", "vlog", "tips", "beginner", "guide", "live", "vs", "setup", "2024",
+]
+COMMENTS = [
+    "정말 유익한 영상이네요! 감사합니다",
+    "다음에는 심화 내용도 다뤄주세요",
+    "3:15 부분 설명이 이해가 잘 안 돼요. 다시 설명해주실 수 있나요?",
+    "구독하고 갑니다 👍",
+    "Great video, thanks for sharing!",
+    "Could you make a follow-up about the advanced parts?",
+    "What software are you using for this?",
+    "음질이 조금 아쉬워요",
+    "This helped me a lot, subscribed.",
+    "최고의 설명입니다. 진짜 쉽게 이해됐어요",
+]
+REPLIES = [
+    "저도 궁금해요", "감사합니다!", "Same question here", "동의합니다", "Thanks, that helped",
+]
+
+
+def rng_for(*parts: Any) -> random.Random:
+    """Random generator seeded by the given parts, stable across processes"""
+    return random.Random(":".join(str(part) for part in parts))
+
+
+def make_id(prefix: str, length: int, *parts: Any) -> str:
+    """Deterministic URL-safe ID of `length` characters after `prefix`"""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode("utf-8")).digest()
+    return prefix + base64.urlsafe_b64encode(digest).decode("ascii")[:length]
+
+
+def encode_page_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_page_token(token: str) -> Optional[int]:
+    """Offset a page token points at, or None if the token is malformed"""
+    try:
+        text = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("ascii")
+        label, offset = text.split(":")
+        return int(offset) if label == "offset" and int(offset) >= 0 else None
+    except ValueError:
+        return None
+
+
+def api_error(
+    status: int,
+    reason: str,
+    message: str,
+    domain: str = "youtube.parameter"
+) -> JSONResponse:
+    """Error response in the YouTube Data API's error shape"""
+    return JSONResponse(
+        {"error": {
+            "code": status,
+            "message": message,
+            "errors": [{"message": message, "domain": domain, "reason": reason}],
+        }},
+        status_code=status,
+    )
+
+
+class FakeYouTube:
+    """Deterministic data and per-key quota accounting behind the fake server"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        daily_quota: int = 10000,
+        comments_per_video: int = 300,
+        missing_ids: Iterable[str] = (),
+        comments_disabled: Iterable[str] = ()
+    ):
+        """
+        Initialize fake API state
+
+        Args:
+            latency: Seconds every response is delayed
+            jitter: Maximum seconds of uniform random jitter added or subtracted
+            daily_quota: Quota units per API key (<= 0 for unlimited)
+            comments_per_video: Upper bound of top-level comments per video
+            missing_ids: Video/channel IDs that do not exist
+            comments_disabled: Video IDs whose comments are disabled
+        """
+        self.latency = latency
+        self.jitter = max(jitter, 0.0)
+        self.daily_quota = daily_quota
+        self.comments_per_video = comments_per_video
+        self.missing_ids = set(missing_ids)
+        self.comments_disabled = set(comments_disabled)
+        self.used: Dict[str, int] = {}
+        self.requests = 0
+        # Search query behind each issued video ID, so videos.list titles match
+        self._queries: "OrderedDict[str, str]" = OrderedDict()
+
+    # Quota and latency
+
+    def charge(self, api_key: Optional[str], endpoint: str) -> Optional[JSONResponse]:
+        """Charge an endpoint's quota cost to a key; an error response if it cannot pay"""
+        if not api_key:
+            return api_error(
+                403, "forbidden",
+                "The request is missing a valid API key.", domain="global",
+            )
+        cost = QuotaLedger.UNIT_COSTS.get(endpoint, QuotaLedger.DEFAULT_COST)
+        used = self.used.get(api_key, 0)
+        if 0 < self.daily_quota < used + cost:
+            return api_error(
+                403, "quotaExceeded",
+                "The request cannot be completed because you have exceeded your "
+                "<a href=\"/youtube/v3/getting-started#quota\">quota</a>.",
+                domain="youtube.quota",
+            )
+        self.used[api_key] = used + cost
+        return None
+
+    async def delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    # Resources
+
+    def published_at(self, rng: random.Random, max_days: int = 730) -> str:
+        """Timestamp up to max_days before today (stable within a day)"""
+        today = datetime.combine(datetime.now(timezone.utc).date(), time(), timezone.utc)
+        moment = today - timedelta(days=rng.randint(0, max_days), seconds=rng.randint(0, 86399))
+        return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def video_title(self, video_id: str) -> str:
+        rng = rng_for("title", video_id)
+        query = self._queries.get(video_id) or rng.choice(KO_WORDS)
+        english = f"{rng.choice(EN_WORDS).title()} {rng.choice(EN_WORDS)}"
+        return f"{query} {rng.choice(KO_WORDS)} | {english}"
+
+    def channel_for(self, video_id: str) -> str:
+        """Channel of a video; a query's videos share a small pool of channels"""
+        query = self._queries.get(video_id, video_id)
+        return make_id("UC", 22, "channel", query, rng_for("channel", video_id).randrange(30))
+
+    def thumbnails(self, resource_id: str) -> Dict[str, Any]:
+        base = f"https://i.ytimg.com/vi/{resource_id}"
+        return {
+            "default": {"url": f"{base}/default.jpg", "width": 120, "height": 90},
+            "medium": {"url": f"{base}/mqdefault.jpg", "width": 320, "height": 180},
+            "high": {"url": f"{base}/hqdefault.jpg", "width": 480, "height": 360},
+        }
+
+    def search_item(self, query: str, index: int) -> Dict[str, Any]:
+        video_id = make_id("", 11, "video", query, index)
+        self._queries[video_id] = query
+        self._queries.move_to_end(video_id)
+        while len(self._queries) > 100_000:
+            self._queries.popitem(last=False)
+
+        channel_id = self.channel_for(video_id)
+        rng = rng_for("video", video_id)
+        return {
+            "kind": "youtube#searchResult",
+            "etag": make_id("", 27, "etag", video_id),
+            "id": {"kind": "youtube#video", "videoId": video_id},
+            "snippet": {
+                "publishedAt": self.published_at(rng_for("published", video_id)),
+                "channelId": channel_id,
+                "title": self.video_title(video_id),
+                "description": f"{query} 관련 영상입니다. Watch the full {rng.choice(EN_WORDS)}.",
+                "thumbnails": self.thumbnails(video_id),
+                "channelTitle": self.channel_title(channel_id),
+                "liveBroadcastContent": "none",
+            },
+        }
+
+    def video(self, video_id: str) -> Dict[str, Any]:
+        rng = rng_for("video", video_id)
+        channel_id = self.channel_for(video_id)
+        views = int(rng.paretovariate(1.2) * 1000)
+        return {
+            "kind": "youtube#video",
+            "etag": make_id("", 27, "etag", video_id),
+            "id": video_id,
+            "snippet": {
+                "publishedAt": self.published_at(rng_for("published", video_id)),
+                "channelId": channel_id,
+                "title": self.video_title(video_id),
+                "description": f"{rng.choice(COMMENTS)}\n#{rng.choice(KO_WORDS)} #{rng.choice(EN_WORDS)}",
+                "thumbnails": self.thumbnails(video_id),
+                "channelTitle": self.channel_title(channel_id),
+                "tags": rng.sample(KO_WORDS + EN_WORDS, 4),
+                "categoryId": "27",
+            },
+            "contentDetails": {
+                "duration": f"PT{rng.randint(1, 59)}M{rng.randint(0, 59)}S",
+                "definition": "hd",
+            },
+            "statistics": {
+                "viewCount": str(views),
+                "likeCount": str(int(views * rng.uniform(0.01, 0.06))),
+                "favoriteCount": "0",
+                "commentCount": str(self.comment_total(video_id)),
+            },
+        }
+
+    def channel_title(self, channel_id: str) -> str:
+        rng = rng_for("channel-title", channel_id)
+        return f"{rng.choice(KO_WORDS)}{rng.choice(['TV', '채널', 'Lab', 'Studio'])} {rng.randint(1, 99)}"
+
+    def channel(self, channel_id: str) -> Dict[str, Any]:
+        rng = rng_for("channel", channel_id)
+        return {
+            "kind": "youtube#channel",
+            "etag": make_id("", 27, "etag", channel_id),
+            "id": channel_id,
+            "snippet": {
+                "title": self.channel_title(channel_id),
+                "description": f"{rng.choice(KO_WORDS)} 전문 채널 / {rng.choice(EN_WORDS)} channel",
+                "customUrl": f"@{channel_id[2:10].lower()}",
+                "publishedAt": self.published_at(rng, max_days=3650),
+                "thumbnails": self.thumbnails(channel_id),
+            },
+            "statistics": {
+                "viewCount": str(int(rng.paretovariate(1.1) * 50000)),
+                "subscriberCount": str(int(rng.paretovariate(1.1) * 500)),
+                "hiddenSubscriberCount": False,
+                "videoCount": str(rng.randint(5, 2000)),
+            },
+        }
+
+    def comment_total(self, video_id: str) -> int:
+        return rng_for("comments", video_id).randint(0, self.comments_per_video)
+
+    def comment(
+        self,
+        comment_id: str,
+        video_id: str,
+        text: str,
+        parent_id: str = ""
+    ) -> Dict[str, Any]:
+        rng = rng_for("comment", comment_id)
+        published = self.published_at(rng, max_days=365)
+        snippet = {
+            "channelId": self.channel_for(video_id),
+            "videoId": video_id,
+            "textDisplay": text,
+            "textOriginal": text,
+            "authorDisplayName": f"@viewer{rng.randint(1, 99999)}",
+            "authorProfileImageUrl": f"https://yt3.ggpht.com/ytc/{comment_id}=s48",
+            "authorChannelId": {"value": make_id("UC", 22, "author", comment_id)},
+            "canRate": True,
+            "viewerRating": "none",
+            "likeCount": int(rng.paretovariate(1.5)) - 1,
+            "publishedAt": published,
+            "updatedAt": published,
+        }
+        if parent_id:
+            snippet["parentId"] = parent_id
+        return {
+            "kind": "youtube#comment",
+            "etag": make_id("", 27, "etag", comment_id),
+            "id": comment_id,
+            "snippet": snippet,
+        }
+
+    def reply_total(self, thread_id: str) -> int:
+        rng = rng_for("replies", thread_id)
+        return rng.randint(0, 12) if rng.random() < 0.3 else 0
+
+    def reply(self, thread_id: str, index: int) -> Dict[str, Any]:
+        video_id = self.thread_video(thread_id)
+        text = rng_for("reply", thread_id, index).choice(REPLIES)
+        reply_id = f"{thread_id}.{make_id('', 22, 'reply', thread_id, index)}"
+        return self.comment(reply_id, video_id, text, thread_id)
+
+    @staticmethod
+    def thread_id(video_id: str, index: int) -> str:
+        # Top-level comment IDs carry their video so replies can be generated from parentId
+        return f"Ug{video_id}{make_id('', 13, 'thread', video_id, index)}"
+
+    @staticmethod
+    def thread_video(thread_id: str) -> str:
+        return thread_id[2:13]
+
+    def comment_thread(self, video_id: str, index: int, parts: set) -> Dict[str, Any]:
+        thread_id = self.thread_id(video_id, index)
+        replies = self.reply_total(thread_id)
+        text = rng_for("thread", thread_id).choice(COMMENTS)
+        thread: Dict[str, Any] = {
+            "kind": "youtube#commentThread",
+            "etag": make_id("", 27, "etag", thread_id),
+            "id": thread_id,
+            "snippet": {
+                "channelId": self.channel_for(video_id),
+                "videoId": video_id,
+                "topLevelComment": self.comment(thread_id, video_id, text),
+                "canReply": True,
+                "totalReplyCount": replies,
+                "isPublic": True,
+            },
+        }
+        if "replies" in parts and replies:
+            thread["replies"] = {
+                "comments": [self.reply(thread_id, i) for i in range(min(replies, EMBEDDED_REPLIES))]
+            }
+        return thread
+
+
+def select_parts(resource: Dict[str, Any], parts: set) -> Dict[str, Any]:
+    """Keep only the requested parts of a resource (plus kind, etag and id)"""
+    return {
+        key: value for key, value in resource.items()
+        if key in ("kind", "etag", "id") or key in parts
+    }
+
+
+def page_bounds(
+    params: Any,
+    total: int,
+    default: int,
+    maximum: int
+) -> Tuple[Optional[Tuple[int, int]], Optional[JSONResponse]]:
+    """Resolve maxResults/pageToken into (start, end), or an error response"""
+    try:
+        max_results = int(params.get("maxResults", default))
+    except ValueError:
+        max_results = -1
+    if not 0 <= max_results <= maximum:
+        return None, api_error(
+            400, "invalidParameter",
+            f"Invalid value for parameter maxResults. Expected 0-{maximum}.",
+        )
+
+    start = 0
+    if "pageToken" in params:
+        start = decode_page_token(params["pageToken"])
+        if start is None:
+            return None, api_error(400, "invalidPageToken", "The page token is not valid.")
+    return (start, max(start, min(start + max_results, total))), None
+
+
+def paged(
+    kind: str,
+    items: List[Dict[str, Any]],
+    start: int,
+    end: int,
+    total: int,
+    reported_total: Optional[int] = None
+) -> Dict[str, Any]:
+    """List response with pageInfo and page tokens"""
+    body: Dict[str, Any] = {"kind": kind, "etag": ""}
+    if end < total:
+        body["nextPageToken"] = encode_page_token(end)
+    if start > 0 and kind == "youtube#searchListResponse":
+        body["prevPageToken"] = encode_page_token(max(0, start - (end - start)))
+    body["pageInfo"] = {
+        "totalResults": total if reported_total is None else reported_total,
+        "resultsPerPage": end - start,
+    }
+    body["items"] = items
+    return body
+
+
+def requested_ids(params: Any) -> Tuple[Optional[List[str]], Optional[JSONResponse]]:
+    ids = [i for i in params.get("id", "").split(",") if i]
+    if len(ids) > MAX_IDS_PER_REQUEST:
+        return None, api_error(
+            400, "invalidFilters",
+            f"The request specifies more than {MAX_IDS_PER_REQUEST} IDs.",
+        )
+    return ids, None
+
+
+def create_app(**options: Any) -> FastAPI:
+    """
+    Build the fake API server
+
+    Args:
+        **options: FakeYouTube options (latency, jitter, daily_quota, ...)
+
+    Returns:
+        FastAPI app serving BASE_PATH; its FakeYouTube is app.state.youtube
+    """
+    fake = FakeYouTube(**options)
+    app = FastAPI(title="Fake YouTube Data API", docs_url=None, redoc_url=None)
+    app.state.youtube = fake
+
+    def endpoint(name: str) -> Callable:
+        """Register a list endpoint with quota, latency and ETag handling"""
+        def register(build: Callable[[Any, set], Any]) -> Callable:
+            async def handle(request: Request) -> Response:
+                fake.requests += 1
+                await fake.delay()
+                params = request.query_params
+                error = fake.charge(params.get("key"), name)
+                if error is not None:
+                    return error
+
+                parts = set(params.get("part", "snippet").split(","))
+                body = build(params, parts)
+                if isinstance(body, Response):
+                    return body
+
+                etag = make_id("", 27, "etag", json.dumps(body["items"], sort_keys=True))
+                body["etag"] = etag
+                if request.headers.get("If-None-Match") == etag:
+                    return Response(status_code=304, headers={"ETag": etag})
+                return JSONResponse(body, headers={"ETag": etag})
+
+            app.add_api_route(f"{BASE_PATH}/{name}", handle, methods=["GET"], name=name)
+            return build
+        return register
+
+    @endpoint("search")
+    def search(params: Any, parts: set) -> Any:
+        query = params.get("q", "")
+        bounds, error = page_bounds(params, SEARCH_RESULT_CAP, default=5, maximum=50)
+        if error is not None:
+            return error
+        start, end = bounds
+        items = [select_parts(fake.search_item(query, i), parts) for i in range(start, end)]
+        reported = rng_for("total", query).randint(10_000, 1_000_000)
+        return paged("youtube#searchListResponse", items, start, end, SEARCH_RESULT_CAP, reported)
+
+    @endpoint("videos")
+    def videos(params: Any, parts: set) -> Any:
+        ids, error = requested_ids(params)
+        if error is not None:
+            return error
+        items = [
+            select_parts(fake.video(video_id), parts)
+            for video_id in ids if video_id not in fake.missing_ids
+        ]
+        return paged("youtube#videoListResponse", items, 0, len(items), len(items))
+
+    @endpoint("channels")
+    def channels(params: Any, parts: set) -> Any:
+        ids, error = requested_ids(params)
+        if error is not None:
+            return error
+        items = [
+            select_parts(fake.channel(channel_id), parts)
+            for channel_id in ids if channel_id not in fake.missing_ids
+        ]
+        return paged("youtube#channelListResponse", items, 0, len(items), len(items))
+
+    @endpoint("commentThreads")
+    def comment_threads(params: Any, parts: set) -> Any:
+        video_id = params.get("videoId", "")
+        if not video_id or video_id in fake.missing_ids:
+            return api_error(
+                404, "videoNotFound",
+                "The video identified by the videoId parameter could not be found.",
+            )
+        if video_id in fake.comments_disabled:
+            return api_error(
+                403, "commentsDisabled",
+                "The video identified by the videoId parameter has disabled comments.",
+            )
+        total = fake.comment_total(video_id)
+        bounds, error = page_bounds(params, total, default=20, maximum=100)
+        if error is not None:
+            return error
+        start, end = bounds
+        items = [
+            select_parts(fake.comment_thread(video_id, i, parts), parts)
+            for i in range(start, end)
+        ]
+        return paged("youtube#commentThreadListResponse", items, start, end, total)
+
+    @endpoint("comments")
+    def comments(params: Any, parts: set) -> Any:
+        parent_id = params.get("parentId", "")
+        if not parent_id.startswith("Ug"):
+            return api_error(
+                404, "commentNotFound",
+                "The comment identified by the parentId parameter could not be found.",
+            )
+        total = fake.reply_total(parent_id)
+        bounds, error = page_bounds(params, total, default=20, maximum=100)
+        if error is not None:
+            return error
+        start, end = bounds
+        items = [select_parts(fake.reply(parent_id, i), parts) for i in range(start, end)]
+        return paged("youtube#commentListResponse", items, start, end, total)
+
+    return app
+
+
+# Default instance for `uvicorn benchmarks.fake_youtube:app`
+app = create_app()
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--daily-quota", type=int, default=10000, help="units per key (0 = unlimited)")
+    parser.add_argument("--comments-per-video", type=int, default=300)
+    args = parser.parse_args()
+
+    fake_app = create_app(
+        latency=args.latency,
+        jitter=args.jitter,
+        daily_quota=args.daily_quota,
+        comments_per_video=args.comments_per_video,
+    )
+    uvicorn.run(fake_app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,10 @@ FastAPI main application.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import api_router
+from app.db.session import AsyncSessionLocal
+from app.services.youtube import init_http_client, close_http_client
+from app.services.youtube_quota import init_quota_ledger, close_quota_ledger
+from app.services.keyword_analyzer import cancel_keyword_refreshes
 
 
 app = FastAPI(
@@ -28,6 +32,21 @@ app.add_middleware(
 app.include_router(api_router)
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Open the shared YouTube HTTP connection pool and quota ledger."""
+    init_http_client()
+    await init_quota_ledger(AsyncSessionLocal)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop keyword refreshes, flush the quota ledger and close the shared HTTP pool."""
+    await cancel_keyword_refreshes()
+    await close_quota_ledger()
+    await close_http_client()
+
+
 @app.get("/", tags=["health"])
 async def health_check():
     """Health check endpoint."""
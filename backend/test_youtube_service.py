@@ -27,10 +27,10 @@ async def test_search():
         print(f"Found {len(results)} videos")
 
         for idx, video in enumerate(results, 1):
-            print(f"\n{idx}. {video['title']}")
-            print(f"   Video ID: {video['video_id']}")
-            print(f"   Channel: {video['channel_title']}")
-            print(f"   Published: {video['published_at']}")
+            print(f"\n{idx}. {video.title}")
+            print(f"   Video ID: {video.video_id}")
+            print(f"   Channel: {video.channel_title}")
+            print(f"   Published: {video.published_at}")
 
 
 async def test_video_details():
@@ -42,13 +42,13 @@ async def test_video_details():
     async with YouTubeAPIClient() as client:
         details = await client.get_video_details(video_id)
 
-        print(f"\nTitle: {details['title']}")
-        print(f"Channel: {details['channel_title']}")
-        print(f"Views: {details['view_count']:,}")
-        print(f"Likes: {details['like_count']:,}")
-        print(f"Comments: {details['comment_count']:,}")
-        print(f"Duration: {details['duration']}")
-        print(f"Published: {details['published_at']}")
+        print(f"\nTitle: {details.title}")
+        print(f"Channel: {details.channel_title}")
+        print(f"Views: {details.view_count:,}")
+        print(f"Likes: {details.like_count:,}")
+        print(f"Comments: {details.comment_count:,}")
+        print(f"Duration: {details.duration}")
+        print(f"Published: {details.published_at}")
 
 
 async def test_comments():
@@ -62,9 +62,9 @@ async def test_comments():
         print(f"Found {len(comments)} comments")
 
         for idx, comment in enumerate(comments, 1):
-            print(f"\n{idx}. {comment['author_name']} ({comment['like_count']} likes)")
-            text = comment['text'][:100]
-            if len(comment['text']) > 100:
+            print(f"\n{idx}. {comment.author_name} ({comment.like_count} likes)")
+            text = comment.text[:100]
+            if len(comment.text) > 100:
                 text += "..."
             print(f"   {text}")
 
@@ -78,11 +78,11 @@ async def test_channel():
     async with YouTubeAPIClient() as client:
         info = await client.get_channel_info(channel_id)
 
-        print(f"\nChannel: {info['title']}")
-        print(f"Subscribers: {info['subscriber_count']:,}")
-        print(f"Videos: {info['video_count']:,}")
-        print(f"Total views: {info['view_count']:,}")
-        print(f"Custom URL: {info['custom_url']}")
+        print(f"\nChannel: {info.title}")
+        print(f"Subscribers: {info.subscriber_count:,}")
+        print(f"Videos: {info.video_count:,}")
+        print(f"Total views: {info.view_count:,}")
+        print(f"Custom URL: {info.custom_url}")
 
 
 async def test_quota():
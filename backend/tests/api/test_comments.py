@@ -1,54 +1,58 @@
 """
 Test cases for comment analysis API endpoints.
 """
+from datetime import datetime, timezone
+
 import pytest
 from httpx import AsyncClient
 from unittest.mock import patch, AsyncMock
 
+from app.services.youtube_records import Comment, VideoDetails
+
 
 @pytest.mark.asyncio
 class TestCommentAnalyze:
     """Test suite for /api/v1/comments/analyze endpoint"""
 
-    async def test_analyze_comments_success(self, async_client: AsyncClient):
+    async def test_analyze_comments_success(self, async_client: AsyncClient, comment_pages):
         """댓글 분석 성공 케이스"""
         # Mock YouTube API responses
-        mock_video_details = {
-            "video_id": "dQw4w9WgXcQ",
-            "title": "Test Video Title",
-            "description": "Test description",
-            "channel_id": "UCTest123",
-            "channel_title": "Test Channel",
-            "published_at": "2024-01-01T00:00:00+00:00",
-            "duration": "PT15M30S",
-            "view_count": 15000,
-            "like_count": 500,
-            "comment_count": 342,
-            "thumbnail_url": "https://example.com/thumb.jpg",
-            "tags": ["test", "video"]
-        }
+        mock_video_details = VideoDetails(
+            video_id="dQw4w9WgXcQ",
+            title="Test Video Title",
+            description="Test description",
+            channel_id="UCTest123",
+            channel_title="Test Channel",
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            duration="PT15M30S",
+            view_count=15000,
+            like_count=500,
+            comment_count=342,
+            thumbnail_url="https://example.com/thumb.jpg",
+            tags=["test", "video"]
+        )
 
         mock_comments = [
-            {
-                "comment_id": "comment_1",
-                "text": "Great video!",
-                "author_name": "User1",
-                "author_channel_id": "UC123",
-                "like_count": 10,
-                "published_at": "2024-01-01T00:00:00+00:00",
-                "updated_at": "2024-01-01T00:00:00+00:00",
-                "reply_count": 2
-            },
-            {
-                "comment_id": "comment_2",
-                "text": "Very helpful!",
-                "author_name": "User2",
-                "author_channel_id": "UC456",
-                "like_count": 5,
-                "published_at": "2024-01-02T00:00:00+00:00",
-                "updated_at": "2024-01-02T00:00:00+00:00",
-                "reply_count": 0
-            }
+            Comment(
+                comment_id="comment_1",
+                text="Great video!",
+                author_name="User1",
+                author_channel_id="UC123",
+                like_count=10,
+                published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                reply_count=2
+            ),
+            Comment(
+                comment_id="comment_2",
+                text="Very helpful!",
+                author_name="User2",
+                author_channel_id="UC456",
+                like_count=5,
+                published_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                updated_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                reply_count=0
+            )
         ]
 
         with patch('app.services.comment_collector.YouTubeAPIClient') as mock_client_class:
@@ -56,7 +60,8 @@ class TestCommentAnalyze:
             mock_client.__aenter__.return_value = mock_client
             mock_client.__aexit__.return_value = None
             mock_client.get_video_details.return_value = mock_video_details
-            mock_client.get_video_comments.return_value = mock_comments
+            mock_client.iter_video_comments = comment_pages(mock_comments)
+            mock_client.get_thread_replies.return_value = {}
             mock_client_class.return_value = mock_client
 
             response = await async_client.post(
@@ -71,34 +76,34 @@ class TestCommentAnalyze:
         assert "frequent_words" in data["data"]
         assert "analyzed_at" in data["data"]
 
-    async def test_analyze_comments_video_info(self, async_client: AsyncClient):
+    async def test_analyze_comments_video_info(self, async_client: AsyncClient, comment_pages):
         """비디오 정보 검증"""
-        mock_video_details = {
-            "video_id": "dQw4w9WgXcQ",
-            "title": "Python Tutorial",
-            "description": "Learn Python",
-            "channel_id": "UCTest123",
-            "channel_title": "Code Channel",
-            "published_at": "2024-01-01T00:00:00+00:00",
-            "duration": "PT10M",
-            "view_count": 10000,
-            "like_count": 200,
-            "comment_count": 150,
-            "thumbnail_url": "https://example.com/thumb.jpg",
-            "tags": []
-        }
+        mock_video_details = VideoDetails(
+            video_id="dQw4w9WgXcQ",
+            title="Python Tutorial",
+            description="Learn Python",
+            channel_id="UCTest123",
+            channel_title="Code Channel",
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            duration="PT10M",
+            view_count=10000,
+            like_count=200,
+            comment_count=150,
+            thumbnail_url="https://example.com/thumb.jpg",
+            tags=[]
+        )
 
         mock_comments = [
-            {
-                "comment_id": "c1",
-                "text": "Nice",
-                "author_name": "User",
-                "author_channel_id": "UC123",
-                "like_count": 1,
-                "published_at": "2024-01-01T00:00:00+00:00",
-                "updated_at": "2024-01-01T00:00:00+00:00",
-                "reply_count": 0
-            }
+            Comment(
+                comment_id="c1",
+                text="Nice",
+                author_name="User",
+                author_channel_id="UC123",
+                like_count=1,
+                published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                reply_count=0
+            )
         ]
 
         with patch('app.services.comment_collector.YouTubeAPIClient') as mock_client_class:
@@ -106,7 +111,8 @@ class TestCommentAnalyze:
             mock_client.__aenter__.return_value = mock_client
             mock_client.__aexit__.return_value = None
             mock_client.get_video_details.return_value = mock_video_details
-            mock_client.get_video_comments.return_value = mock_comments
+            mock_client.iter_video_comments = comment_pages(mock_comments)
+            mock_client.get_thread_replies.return_value = {}
             mock_client_class.return_value = mock_client
 
             response = await async_client.post(
@@ -138,22 +144,22 @@ class TestCommentAnalyze:
         )
         assert response.status_code == 422
 
-    async def test_analyze_youtube_shortlink(self, async_client: AsyncClient):
+    async def test_analyze_youtube_shortlink(self, async_client: AsyncClient, comment_pages):
         """youtu.be 짧은 링크 지원"""
-        mock_video_details = {
-            "video_id": "dQw4w9WgXcQ",
-            "title": "Test",
-            "description": "",
-            "channel_id": "UC123",
-            "channel_title": "Channel",
-            "published_at": "2024-01-01T00:00:00+00:00",
-            "duration": "PT5M",
-            "view_count": 1000,
-            "like_count": 50,
-            "comment_count": 10,
-            "thumbnail_url": "",
-            "tags": []
-        }
+        mock_video_details = VideoDetails(
+            video_id="dQw4w9WgXcQ",
+            title="Test",
+            description="",
+            channel_id="UC123",
+            channel_title="Channel",
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            duration="PT5M",
+            view_count=1000,
+            like_count=50,
+            comment_count=10,
+            thumbnail_url="",
+            tags=[]
+        )
 
         mock_comments = []
 
@@ -162,7 +168,8 @@ class TestCommentAnalyze:
             mock_client.__aenter__.return_value = mock_client
             mock_client.__aexit__.return_value = None
             mock_client.get_video_details.return_value = mock_video_details
-            mock_client.get_video_comments.return_value = mock_comments
+            mock_client.iter_video_comments = comment_pages(mock_comments)
+            mock_client.get_thread_replies.return_value = {}
             mock_client_class.return_value = mock_client
 
             response = await async_client.post(
@@ -172,22 +179,22 @@ class TestCommentAnalyze:
 
         assert response.status_code == 200
 
-    async def test_analyze_embed_url(self, async_client: AsyncClient):
+    async def test_analyze_embed_url(self, async_client: AsyncClient, comment_pages):
         """embed URL 지원"""
-        mock_video_details = {
-            "video_id": "dQw4w9WgXcQ",
-            "title": "Test",
-            "description": "",
-            "channel_id": "UC123",
-            "channel_title": "Channel",
-            "published_at": "2024-01-01T00:00:00+00:00",
-            "duration": "PT5M",
-            "view_count": 1000,
-            "like_count": 50,
-            "comment_count": 10,
-            "thumbnail_url": "",
-            "tags": []
-        }
+        mock_video_details = VideoDetails(
+            video_id="dQw4w9WgXcQ",
+            title="Test",
+            description="",
+            channel_id="UC123",
+            channel_title="Channel",
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            duration="PT5M",
+            view_count=1000,
+            like_count=50,
+            comment_count=10,
+            thumbnail_url="",
+            tags=[]
+        )
 
         mock_comments = []
 
@@ -196,7 +203,8 @@ class TestCommentAnalyze:
             mock_client.__aenter__.return_value = mock_client
             mock_client.__aexit__.return_value = None
             mock_client.get_video_details.return_value = mock_video_details
-            mock_client.get_video_comments.return_value = mock_comments
+            mock_client.iter_video_comments = comment_pages(mock_comments)
+            mock_client.get_thread_replies.return_value = {}
             mock_client_class.return_value = mock_client
 
             response = await async_client.post(
@@ -205,3 +213,163 @@ class TestCommentAnalyze:
             )
 
         assert response.status_code == 200
+
+    async def test_replies_included_in_analysis(self, async_client: AsyncClient, comment_pages):
+        """스레드 답글도 분석 대상에 포함"""
+        mock_video_details = VideoDetails(
+            video_id="rEpliesVid1", title="Replies Video", channel_title="Channel"
+        )
+        thread = Comment(comment_id="c1", text="Great video!", like_count=4, reply_count=1)
+        reply = Comment(
+            comment_id="r1", text="What software are you using?", like_count=2, parent_id="c1"
+        )
+
+        with patch('app.services.comment_collector.YouTubeAPIClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get_video_details.return_value = mock_video_details
+            mock_client.iter_video_comments = comment_pages([thread])
+            mock_client.get_thread_replies.return_value = {"c1": [reply]}
+            mock_client_class.return_value = mock_client
+
+            response = await async_client.post(
+                "/api/v1/comments/analyze",
+                json={"video_url": "https://youtu.be/rEpliesVid1"}
+            )
+
+        assert response.status_code == 200
+        mock_client.get_thread_replies.assert_awaited_once_with([thread])
+        questions = response.json()["data"]["viewer_questions"]
+        assert [q["text"] for q in questions] == ["What software are you using?"]
+
+    async def test_short_deadline_returns_partial_analysis(
+        self, async_client: AsyncClient, comment_pages
+    ):
+        """마감 시간이 부족하면 첫 페이지만 분석하고 답글 조회 없이 partial로 반환"""
+        mock_video_details = VideoDetails(
+            video_id="dEadlineVid", title="Deadline Video", channel_title="Channel"
+        )
+        comments = [
+            Comment(comment_id=f"c{i}", text=f"Comment {i}", reply_count=3) for i in range(250)
+        ]
+        served = []
+
+        def tracked_pages(video_id, **kwargs):
+            async def pages():
+                async for page in comment_pages(comments)(video_id, **kwargs):
+                    served.append(len(page))
+                    yield page
+            return pages()
+
+        with patch('app.services.comment_collector.YouTubeAPIClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get_video_details.return_value = mock_video_details
+            mock_client.iter_video_comments = tracked_pages
+            mock_client_class.return_value = mock_client
+
+            response = await async_client.post(
+                "/api/v1/comments/analyze",
+                json={"video_url": "https://youtu.be/dEadlineVid"},
+                headers={"X-Request-Timeout": "1"}
+            )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["partial"] is True
+        assert data["sentiment"]["total_analyzed"] == 100
+        assert served == [100]
+        mock_client.get_thread_replies.assert_not_awaited()
+
+    async def test_short_deadline_keeps_embedded_replies(
+        self, async_client: AsyncClient, comment_pages
+    ):
+        """마감 시간이 부족해도 스레드에 포함된 답글은 분석"""
+        mock_video_details = VideoDetails(
+            video_id="eMbeddedVid", title="Embedded Video", channel_title="Channel"
+        )
+        reply = Comment(
+            comment_id="r1", text="What software are you using?", like_count=2, parent_id="c1"
+        )
+        thread = Comment(
+            comment_id="c1", text="Great video!", like_count=4, reply_count=1, replies=[reply]
+        )
+
+        with patch('app.services.comment_collector.YouTubeAPIClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get_video_details.return_value = mock_video_details
+            mock_client.iter_video_comments = comment_pages([thread])
+            mock_client_class.return_value = mock_client
+
+            response = await async_client.post(
+                "/api/v1/comments/analyze",
+                json={"video_url": "https://youtu.be/eMbeddedVid"},
+                headers={"X-Request-Timeout": "1"}
+            )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["sentiment"]["total_analyzed"] == 2
+        assert [q["text"] for q in data["viewer_questions"]] == ["What software are you using?"]
+        mock_client.get_thread_replies.assert_not_awaited()
+
+    async def test_invalid_deadline_header(self, async_client: AsyncClient):
+        """잘못된 X-Request-Timeout 헤더는 422"""
+        response = await async_client.post(
+            "/api/v1/comments/analyze",
+            json={"video_url": "https://youtu.be/dEadlineVid"},
+            headers={"X-Request-Timeout": "soon"}
+        )
+
+        assert response.status_code == 422
+
+    async def test_circuit_open_serves_last_result_as_stale(
+        self, async_client: AsyncClient, comment_pages
+    ):
+        """서킷이 열려 있으면 마지막 분석 결과를 stale로 반환"""
+        from app.services.youtube import YouTubeCircuitOpenError
+
+        mock_video_details = VideoDetails(
+            video_id="stAleVideo1",
+            title="Cached Video",
+            description="",
+            channel_id="UC123",
+            channel_title="Channel",
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            duration="PT5M",
+            view_count=1000,
+            like_count=50,
+            comment_count=10,
+            thumbnail_url="",
+            tags=[]
+        )
+
+        with patch('app.services.comment_collector.YouTubeAPIClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get_video_details.return_value = mock_video_details
+            mock_client.iter_video_comments = comment_pages([])
+            mock_client.get_thread_replies.return_value = {}
+            mock_client_class.return_value = mock_client
+
+            fresh = await async_client.post(
+                "/api/v1/comments/analyze",
+                json={"video_url": "https://youtu.be/stAleVideo1"}
+            )
+
+            mock_client.get_video_details.side_effect = YouTubeCircuitOpenError("circuit open")
+            stale = await async_client.post(
+                "/api/v1/comments/analyze",
+                json={"video_url": "https://youtu.be/stAleVideo1"}
+            )
+
+        assert fresh.json()["data"]["stale"] is False
+        data = stale.json()
+        assert data["success"] is True
+        assert data["data"]["stale"] is True
+        assert data["data"]["video_info"]["title"] == "Cached Video"
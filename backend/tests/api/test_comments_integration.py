@@ -10,6 +10,8 @@ import pytest
 from httpx import AsyncClient
 from unittest.mock import Mock, AsyncMock, patch
 
+from app.services.youtube_records import Comment, VideoDetails
+
 
 @pytest.mark.asyncio
 class TestCommentAnalysisIntegration:
@@ -18,30 +20,32 @@ class TestCommentAnalysisIntegration:
     @pytest.fixture
     def mock_youtube_video_details(self):
         """Mock YouTube video details response."""
-        return {
-            "title": "파이썬 기초 강의",
-            "channel_title": "코딩 채널",
-            "view_count": 10000,
-            "comment_count": 50
-        }
+        return VideoDetails(
+            video_id="dQw4w9WgXcQ",
+            title="파이썬 기초 강의",
+            channel_title="코딩 채널",
+            view_count=10000,
+            comment_count=50
+        )
 
     @pytest.fixture
     def mock_youtube_comments(self):
         """Mock YouTube comments with diverse content."""
         return [
-            {"text": "정말 좋은 영상이에요! 감사합니다", "like_count": 50, "author": "user1"},
-            {"text": "다음에는 클래스 강의 해주세요!", "like_count": 100, "author": "user2"},
-            {"text": "너무 유익해요 추천합니다", "like_count": 30, "author": "user3"},
-            {"text": "설명이 아주 좋네요", "like_count": 25, "author": "user4"},
-            {"text": "별로에요 실망입니다", "like_count": 5, "author": "user5"},
-            {"text": "리스트 강의도 올려주세요!", "like_count": 80, "author": "user6"},
-            {"text": "좋은 강의 감사합니다", "like_count": 40, "author": "user7"},
-            {"text": "최고예요 훌륭합니다", "like_count": 35, "author": "user8"},
+            Comment(comment_id="user1", text="정말 좋은 영상이에요! 감사합니다", like_count=50, author_name="user1"),
+            Comment(comment_id="user2", text="다음에는 클래스 강의 해주세요!", like_count=100, author_name="user2"),
+            Comment(comment_id="user3", text="너무 유익해요 추천합니다", like_count=30, author_name="user3"),
+            Comment(comment_id="user4", text="설명이 아주 좋네요", like_count=25, author_name="user4"),
+            Comment(comment_id="user5", text="별로에요 실망입니다", like_count=5, author_name="user5"),
+            Comment(comment_id="user6", text="리스트 강의도 올려주세요!", like_count=80, author_name="user6"),
+            Comment(comment_id="user7", text="좋은 강의 감사합니다", like_count=40, author_name="user7"),
+            Comment(comment_id="user8", text="최고예요 훌륭합니다", like_count=35, author_name="user8"),
         ]
 
     async def test_analyze_comments_with_text_analysis(
         self,
         async_client: AsyncClient,
+        comment_pages,
         mock_youtube_video_details,
         mock_youtube_comments
     ):
@@ -53,7 +57,8 @@ class TestCommentAnalysisIntegration:
             mock_instance.__aenter__.return_value = mock_instance
             mock_instance.__aexit__.return_value = None
             mock_instance.get_video_details.return_value = mock_youtube_video_details
-            mock_instance.get_video_comments.return_value = mock_youtube_comments
+            mock_instance.iter_video_comments = comment_pages(mock_youtube_comments)
+            mock_instance.get_thread_replies.return_value = {}
             MockClient.return_value = mock_instance
 
             # Make request
@@ -129,7 +134,7 @@ class TestCommentAnalysisIntegration:
             # Given the mock comments (mostly positive), positive should be highest
             assert sentiment["positive"] > sentiment["negative"]
 
-    async def test_empty_comments_analysis(self, async_client: AsyncClient):
+    async def test_empty_comments_analysis(self, async_client: AsyncClient, comment_pages):
         """Test analysis with no comments."""
 
         with patch("app.services.comment_collector.YouTubeAPIClient") as MockClient:
@@ -137,14 +142,15 @@ class TestCommentAnalysisIntegration:
             mock_instance = AsyncMock()
             mock_instance.__aenter__.return_value = mock_instance
             mock_instance.__aexit__.return_value = None
-            mock_instance.get_video_details.return_value = {
-                "video_id": "dQw4w9WgXcQ",
-                "title": "Test Video",
-                "channel_title": "Test Channel",
-                "view_count": 1000,
-                "comment_count": 0
-            }
-            mock_instance.get_video_comments.return_value = []
+            mock_instance.get_video_details.return_value = VideoDetails(
+                video_id="dQw4w9WgXcQ",
+                title="Test Video",
+                channel_title="Test Channel",
+                view_count=1000,
+                comment_count=0
+            )
+            mock_instance.iter_video_comments = comment_pages([])
+            mock_instance.get_thread_replies.return_value = {}
             MockClient.return_value = mock_instance
 
             response = await async_client.post(
@@ -166,32 +172,33 @@ class TestCommentAnalysisIntegration:
             assert sentiment["neutral"] == 0
             assert sentiment["negative"] == 0
 
-    async def test_sentiment_accuracy(self, async_client: AsyncClient):
+    async def test_sentiment_accuracy(self, async_client: AsyncClient, comment_pages):
         """Test sentiment analysis accuracy with clear positive/negative comments."""
 
         positive_comments = [
-            {"text": "최고예요 정말 좋아요", "like_count": 10, "author": "user1"},
-            {"text": "감사합니다 훌륭해요", "like_count": 20, "author": "user2"},
-            {"text": "완벽합니다 추천해요", "like_count": 15, "author": "user3"},
+            Comment(comment_id="user1", text="최고예요 정말 좋아요", like_count=10, author_name="user1"),
+            Comment(comment_id="user2", text="감사합니다 훌륭해요", like_count=20, author_name="user2"),
+            Comment(comment_id="user3", text="완벽합니다 추천해요", like_count=15, author_name="user3"),
         ]
 
         negative_comments = [
-            {"text": "별로에요 실망입니다", "like_count": 5, "author": "user4"},
-            {"text": "최악이네요 후회됩니다", "like_count": 3, "author": "user5"},
+            Comment(comment_id="user4", text="별로에요 실망입니다", like_count=5, author_name="user4"),
+            Comment(comment_id="user5", text="최악이네요 후회됩니다", like_count=3, author_name="user5"),
         ]
 
         with patch("app.services.comment_collector.YouTubeAPIClient") as MockClient:
             mock_instance = AsyncMock()
             mock_instance.__aenter__.return_value = mock_instance
             mock_instance.__aexit__.return_value = None
-            mock_instance.get_video_details.return_value = {
-                "video_id": "dQw4w9WgXcQ",
-                "title": "Test Video",
-                "channel_title": "Test Channel",
-                "view_count": 1000,
-                "comment_count": 5
-            }
-            mock_instance.get_video_comments.return_value = positive_comments + negative_comments
+            mock_instance.get_video_details.return_value = VideoDetails(
+                video_id="dQw4w9WgXcQ",
+                title="Test Video",
+                channel_title="Test Channel",
+                view_count=1000,
+                comment_count=5
+            )
+            mock_instance.iter_video_comments = comment_pages(positive_comments + negative_comments)
+            mock_instance.get_thread_replies.return_value = {}
             MockClient.return_value = mock_instance
 
             response = await async_client.post(
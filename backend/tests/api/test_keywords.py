@@ -148,6 +148,24 @@ class TestKeywordAnalyze:
         assert data1["metrics"]["competition"] == data2["metrics"]["competition"]
         assert data1["metrics"]["recommendation_score"] == data2["metrics"]["recommendation_score"]
 
+    async def test_short_deadline_returns_uncached_partial(self, async_client: AsyncClient):
+        """마감 시간이 부족하면 partial로 반환하고 캐시하지 않음"""
+        keyword = "마감테스트키워드"
+        short = await async_client.post(
+            "/api/v1/keywords/analyze",
+            json={"keyword": keyword},
+            headers={"X-Request-Timeout": "1"}
+        )
+        full = await async_client.post(
+            "/api/v1/keywords/analyze",
+            json={"keyword": keyword}
+        )
+
+        assert short.status_code == 200
+        assert short.json()["data"]["partial"] is True
+        assert full.json()["data"]["partial"] is False
+        assert full.json()["data"]["analyzed_at"] != short.json()["data"]["analyzed_at"]
+
 
 @pytest.mark.asyncio
 class TestRelatedKeywords:
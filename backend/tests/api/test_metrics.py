@@ -0,0 +1,40 @@
+"""
+Test cases for the runtime metrics endpoint.
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.services.youtube import YouTubeAPIClient, get_youtube_client
+from app.services.youtube_breaker import CircuitBreaker
+from app.services.youtube_cache import ResponseCache
+from app.services.youtube_hedge import RequestHedger
+from app.services.youtube_limiter import RateLimiter
+from main import app
+
+
+@pytest.mark.asyncio
+class TestMetrics:
+    """Test suite for /api/v1/metrics endpoint."""
+
+    async def test_reports_youtube_and_keyword_cache_stats(self, async_client: AsyncClient):
+        """YouTube 클라이언트 구성요소와 키워드 캐시 통계를 반환"""
+        for _ in range(2):
+            await async_client.post("/api/v1/keywords/analyze", json={"keyword": "파이썬 강의"})
+        app.dependency_overrides[get_youtube_client] = lambda: YouTubeAPIClient(
+            api_key="test-key",
+            cache=ResponseCache(),
+            limiter=RateLimiter(),
+            breaker=CircuitBreaker(),
+            hedger=RequestHedger(endpoints=["videos"]),
+        )
+
+        response = await async_client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["youtube"]["rate_limiter"]["queue_depth"] == 0
+        assert data["youtube"]["circuit_breaker"]["state"] == CircuitBreaker.CLOSED
+        assert data["youtube"]["response_cache"]["size"] == 0
+        assert data["youtube"]["hedging"]["endpoints"] == ["videos"]
+        assert data["youtube"]["hedging"]["win_rate"] == 0.0
+        assert data["keyword_cache"]["hits"] == 1
@@ -0,0 +1,51 @@
+"""
+Test cases for the YouTube data router (app.routers.youtube).
+"""
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.routers import youtube as youtube_router
+from app.services.youtube_records import Channel, VideoDetails
+
+
+class FakeYouTubeClient:
+    """Stand-in returning records without publishedAt (e.g. masked out by fields)."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def get_video_details(self, video_id):
+        return VideoDetails(video_id=video_id)
+
+    async def get_channel_info(self, channel_id):
+        return Channel(channel_id=channel_id)
+
+
+@pytest.fixture
+async def router_client(monkeypatch):
+    monkeypatch.setattr(youtube_router, "YouTubeAPIClient", FakeYouTubeClient)
+    app = FastAPI()
+    app.include_router(youtube_router.router, prefix="/api/v1/youtube")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+class TestMissingPublishedAt:
+    async def test_video_without_published_at(self, router_client):
+        """publishedAt이 없는 영상도 null로 응답"""
+        response = await router_client.get("/api/v1/youtube/videos/abc")
+
+        assert response.status_code == 200
+        assert response.json()["published_at"] is None
+
+    async def test_channel_without_published_at(self, router_client):
+        """publishedAt이 없는 채널도 null로 응답"""
+        response = await router_client.get("/api/v1/youtube/channels/ch")
+
+        assert response.status_code == 200
+        assert response.json()["published_at"] is None
@@ -30,6 +30,16 @@ def test_settings():
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_keyword_cache():
+    """Start every test with an empty in-process keyword analysis cache."""
+    from app.services.keyword_cache import get_keyword_cache
+
+    cache = get_keyword_cache()
+    if cache is not None:
+        cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_db_engine():
     """Create a test database engine."""
@@ -77,7 +87,9 @@ async def async_client(test_settings, test_db_engine) -> AsyncGenerator[AsyncCli
     from app.core.database import get_db
     from app.services.youtube import get_youtube_client
     from unittest.mock import AsyncMock
+    from dataclasses import replace
     from datetime import datetime, timezone
+    from app.services.youtube_records import Channel, SearchResult, VideoDetails
 
     # Override settings
     app.dependency_overrides = {}
@@ -108,45 +120,64 @@ async def async_client(test_settings, test_db_engine) -> AsyncGenerator[AsyncCli
 
     # Mock search results
     mock_youtube_client.search_videos.return_value = [
-        {
-            "video_id": f"test_video_{i}",
-            "title": f"Test Video Title {i}",
-            "description": "Test description",
-            "channel_id": f"channel_{i}",
-            "channel_title": f"Channel {i}",
-            "published_at": datetime(2024, 1, 15, tzinfo=timezone.utc),
-            "thumbnail_url": "https://example.com/thumb.jpg"
-        }
+        SearchResult(
+            video_id=f"test_video_{i}",
+            title=f"Test Video Title {i}",
+            description="Test description",
+            channel_id=f"channel_{i}",
+            channel_title=f"Channel {i}",
+            published_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            thumbnail_url="https://example.com/thumb.jpg"
+        )
         for i in range(10)
     ]
 
+    # Mock paged search (the search results above as a single page)
+    async def iter_search_results(query, limit=None, order="relevance", fields=None,
+                                  min_relevance=None):
+        yield mock_youtube_client.search_videos.return_value
+
+    mock_youtube_client.iter_search_results = iter_search_results
+
     # Mock video details
-    mock_youtube_client.get_video_details.return_value = {
-        "video_id": "test_video_0",
-        "title": "Test Video Title",
-        "description": "Test description",
-        "channel_id": "channel_0",
-        "channel_title": "Channel 0",
-        "published_at": datetime(2024, 1, 15, tzinfo=timezone.utc),
-        "duration": "PT15M30S",
-        "view_count": 10000,
-        "like_count": 500,
-        "comment_count": 100,
-        "thumbnail_url": "https://example.com/thumb.jpg",
-        "tags": ["test", "video"]
+    mock_youtube_client.get_video_details.return_value = VideoDetails(
+        video_id="test_video_0",
+        title="Test Video Title",
+        description="Test description",
+        channel_id="channel_0",
+        channel_title="Channel 0",
+        published_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        duration="PT15M30S",
+        view_count=10000,
+        like_count=500,
+        comment_count=100,
+        thumbnail_url="https://example.com/thumb.jpg",
+        tags=["test", "video"]
+    )
+
+    # Mock batched video details (keyed by video_id)
+    mock_youtube_client.get_videos_details.side_effect = lambda video_ids, fields=None: {
+        video_id: replace(mock_youtube_client.get_video_details.return_value, video_id=video_id)
+        for video_id in video_ids
     }
 
     # Mock channel info
-    mock_youtube_client.get_channel_info.return_value = {
-        "channel_id": "channel_0",
-        "title": "Channel 0",
-        "description": "Test channel",
-        "custom_url": "@testchannel",
-        "published_at": datetime(2023, 1, 1, tzinfo=timezone.utc),
-        "thumbnail_url": "https://example.com/channel.jpg",
-        "subscriber_count": 50000,
-        "video_count": 100,
-        "view_count": 1000000
+    mock_youtube_client.get_channel_info.return_value = Channel(
+        channel_id="channel_0",
+        title="Channel 0",
+        description="Test channel",
+        custom_url="@testchannel",
+        published_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        thumbnail_url="https://example.com/channel.jpg",
+        subscriber_count=50000,
+        video_count=100,
+        view_count=1000000
+    )
+
+    # Mock batched channel info (keyed by channel_id)
+    mock_youtube_client.get_channels_info.side_effect = lambda channel_ids, fields=None: {
+        channel_id: replace(mock_youtube_client.get_channel_info.return_value, channel_id=channel_id)
+        for channel_id in channel_ids
     }
 
     def override_get_youtube_client():
@@ -220,3 +251,14 @@ def mock_comments_data():
     ]
 
 
+
+
+@pytest.fixture(scope="function")
+def comment_pages():
+    """Build a stand-in for YouTubeAPIClient.iter_video_comments yielding 100-comment pages."""
+    def build(comments):
+        async def iter_video_comments(video_id, limit=None, order="relevance", fields=None):
+            for start in range(0, len(comments), 100):
+                yield comments[start:start + 100]
+        return iter_video_comments
+    return build
@@ -8,6 +8,11 @@ Tests comment text analysis functionality:
 """
 import pytest
 from app.services.comment_analyzer import CommentAnalyzerService
+from app.services.youtube_records import Comment
+
+
+def comment(text, like_count, author):
+    return Comment(comment_id=author, text=text, like_count=like_count, author_name=author)
 
 
 class TestCommentAnalyzer:
@@ -18,11 +23,11 @@ class TestCommentAnalyzer:
     @pytest.fixture
     def sample_comments(self):
         return [
-            {"text": "정말 좋은 영상이에요! 다음 영상도 기대됩니다", "like_count": 50, "author": "user1"},
-            {"text": "너무 재미있어요 감사합니다", "like_count": 30, "author": "user2"},
-            {"text": "이런 영상 더 올려주세요!", "like_count": 100, "author": "user3"},
-            {"text": "별로에요... 실망입니다", "like_count": 5, "author": "user4"},
-            {"text": "다음에는 파이썬 강의 해주세요!", "like_count": 80, "author": "user5"},
+            comment("정말 좋은 영상이에요! 다음 영상도 기대됩니다", 50, "user1"),
+            comment("너무 재미있어요 감사합니다", 30, "user2"),
+            comment("이런 영상 더 올려주세요!", 100, "user3"),
+            comment("별로에요... 실망입니다", 5, "user4"),
+            comment("다음에는 파이썬 강의 해주세요!", 80, "user5"),
         ]
 
     def test_extract_frequent_words(self, analyzer, sample_comments):
@@ -74,8 +79,8 @@ class TestCommentAnalyzer:
     def test_extract_frequent_words_filters_stopwords(self, analyzer):
         """불용어 필터링 테스트"""
         comments = [
-            {"text": "이것은 좋은 강의입니다", "like_count": 10, "author": "user1"},
-            {"text": "이것도 좋은 설명이에요", "like_count": 20, "author": "user2"},
+            comment("이것은 좋은 강의입니다", 10, "user1"),
+            comment("이것도 좋은 설명이에요", 20, "user2"),
         ]
 
         result = analyzer.extract_frequent_words(comments)
@@ -90,7 +95,7 @@ class TestCommentAnalyzer:
         """요청사항 최대 10개로 제한"""
         # 15개의 요청 댓글 생성
         comments = [
-            {"text": f"{i}번째 영상 올려주세요", "like_count": i, "author": f"user{i}"}
+            comment(f"{i}번째 영상 올려주세요", i, f"user{i}")
             for i in range(15)
         ]
 
@@ -101,9 +106,9 @@ class TestCommentAnalyzer:
     def test_sentiment_with_positive_comments(self, analyzer):
         """긍정 댓글 비율 테스트"""
         comments = [
-            {"text": "정말 좋아요 최고예요", "like_count": 10, "author": "user1"},
-            {"text": "감사합니다 훌륭해요", "like_count": 20, "author": "user2"},
-            {"text": "별로네요", "like_count": 5, "author": "user3"},
+            comment("정말 좋아요 최고예요", 10, "user1"),
+            comment("감사합니다 훌륭해요", 20, "user2"),
+            comment("별로네요", 5, "user3"),
         ]
 
         result = analyzer.analyze_sentiment(comments)
@@ -115,9 +120,9 @@ class TestCommentAnalyzer:
     def test_sentiment_with_negative_comments(self, analyzer):
         """부정 댓글 비율 테스트"""
         comments = [
-            {"text": "별로에요 실망입니다", "like_count": 10, "author": "user1"},
-            {"text": "최악이네요 후회됩니다", "like_count": 20, "author": "user2"},
-            {"text": "좋아요", "like_count": 5, "author": "user3"},
+            comment("별로에요 실망입니다", 10, "user1"),
+            comment("최악이네요 후회됩니다", 20, "user2"),
+            comment("좋아요", 5, "user3"),
         ]
 
         result = analyzer.analyze_sentiment(comments)
@@ -0,0 +1,349 @@
+"""
+Tests for KeywordAnalyzerService
+
+Tests keyword analysis stages with a mocked YouTube client:
+- Competition analysis (concurrent fetches, partial failures)
+- Search paging overlapped with competition scoring
+- Partial results when the request deadline runs low
+- Stale-while-revalidate for expired cached analyses
+- In-memory cache in front of the database
+- Stale cache fallback while the YouTube circuit is open
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.deadline import Deadline
+from app.models.analysis import KeywordAnalysis
+from app.services import keyword_analyzer
+from app.services.keyword_analyzer import KeywordAnalyzerService
+from app.services.keyword_cache import KeywordAnalysisCache
+from app.services.youtube import YouTubeAPIError, YouTubeCircuitOpenError
+from app.services.youtube_records import Channel, SearchResult, VideoDetails
+
+
+def search_result(i):
+    return SearchResult(
+        video_id=f"video_{i}",
+        title=f"Video {i}",
+        channel_id=f"channel_{i}",
+        channel_title=f"Channel {i}",
+        published_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
+    )
+
+
+def video_details(video_id, channel_id):
+    return VideoDetails(
+        video_id=video_id,
+        channel_id=channel_id,
+        published_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        view_count=100000,
+        like_count=5000,
+    )
+
+
+class TestCompetitionAnalysis:
+    @pytest.fixture
+    def search_results(self):
+        return [search_result(i) for i in range(3)]
+
+    @pytest.fixture
+    def youtube_client(self):
+        client = AsyncMock()
+        client.get_videos_details.side_effect = lambda ids, fields=None: {
+            video_id: video_details(video_id, video_id.replace("video", "channel"))
+            for video_id in ids
+        }
+        client.get_channels_info.side_effect = lambda ids, fields=None: {
+            channel_id: Channel(channel_id=channel_id, subscriber_count=2000000)
+            for channel_id in ids
+        }
+        return client
+
+    async def test_video_and_channel_fetches_overlap(self, search_results, youtube_client):
+        """영상/채널 조회가 순차가 아닌 동시에 진행됨"""
+        started = []
+        both_started = asyncio.Event()
+
+        def track(name, result):
+            async def fetch(ids, fields=None):
+                started.append(name)
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return result(ids, fields)
+            return fetch
+
+        youtube_client.get_videos_details.side_effect = track(
+            "videos", youtube_client.get_videos_details.side_effect
+        )
+        youtube_client.get_channels_info.side_effect = track(
+            "channels", youtube_client.get_channels_info.side_effect
+        )
+
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        competition, complete = await analyzer._calculate_competition(search_results)
+
+        assert sorted(started) == ["channels", "videos"]
+        assert 0.0 < competition <= 1.0
+        assert complete is True
+
+    async def test_channel_failure_keeps_video_scores(self, search_results, youtube_client):
+        """채널 조회 실패 시 구독자 0으로 계산"""
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        with_channels, _ = await analyzer._calculate_competition(search_results)
+
+        youtube_client.get_channels_info.side_effect = Exception("boom")
+        without_channels, complete = await analyzer._calculate_competition(search_results)
+
+        assert 0.0 < without_channels < with_channels
+        assert complete is False
+
+    async def test_missing_videos_are_skipped(self, search_results, youtube_client):
+        """조회되지 않은 영상은 건너뛰고, 전부 실패하면 0.5"""
+        youtube_client.get_videos_details.side_effect = lambda ids, fields=None: {
+            video_id: None for video_id in ids
+        }
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+
+        assert await analyzer._calculate_competition(search_results) == (0.5, True)
+
+
+class TestSearchPaging:
+    @pytest.fixture
+    def youtube_client(self):
+        client = AsyncMock()
+        client.get_videos_details.side_effect = lambda ids, fields=None: {
+            video_id: video_details(video_id, video_id.replace("video", "channel"))
+            for video_id in ids
+        }
+        client.get_channels_info.return_value = {}
+        return client
+
+    async def test_competition_scored_while_paging(self, youtube_client):
+        """첫 페이지로 경쟁도를 계산하는 동안 나머지 페이지를 받고, 실패한 페이지 전까지 사용"""
+        competition_started = asyncio.Event()
+        fetch_videos = youtube_client.get_videos_details.side_effect
+
+        async def get_videos_details(ids, fields=None):
+            competition_started.set()
+            return fetch_videos(ids, fields)
+
+        async def iter_search_results(query, **kwargs):
+            yield [search_result(i) for i in range(50)]
+            await asyncio.wait_for(competition_started.wait(), timeout=1)
+            yield [search_result(i) for i in range(50, 100)]
+            raise YouTubeAPIError("page 3 failed")
+
+        youtube_client.get_videos_details.side_effect = get_videos_details
+        youtube_client.iter_search_results = iter_search_results
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        analyzer._save_to_cache = AsyncMock()
+
+        result = await analyzer._analyze_fresh("video")
+
+        [video_ids] = youtube_client.get_videos_details.call_args.args
+        assert len(video_ids) == KeywordAnalyzerService.TOP_VIDEOS_FOR_COMPETITION
+        # 100 results are scaled to the 50-result sample of a single page
+        assert result["metrics"]["search_volume"] == 50 * 20
+        assert 0.0 < result["metrics"]["competition"] <= 1.0
+
+
+    async def test_deadline_running_low_returns_partial(self, youtube_client):
+        """마감이 임박하면 다음 페이지와 채널 조회를 건너뛰고 partial로 반환, 캐시하지 않음"""
+        requested_pages = []
+
+        async def iter_search_results(query, **kwargs):
+            for index in range(3):
+                requested_pages.append(index)
+                yield [search_result(i) for i in range(index * 50, index * 50 + 50)]
+
+        youtube_client.iter_search_results = iter_search_results
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        analyzer._get_cached_analysis = AsyncMock(return_value=None)
+        analyzer._save_to_cache = AsyncMock()
+
+        result = await analyzer.analyze("video", deadline=Deadline(10, reserve=10))
+
+        assert result["partial"] is True
+        assert result["metrics"]["search_volume"] == 50 * 20
+        assert requested_pages == [0]
+        assert youtube_client.get_channels_info.call_args.args == ([],)
+        analyzer._save_to_cache.assert_not_awaited()
+
+    async def test_failed_video_lookup_returns_partial(self, youtube_client):
+        """영상 조회가 실패하면 기본 경쟁도로 partial 반환, 캐시하지 않음"""
+        async def iter_search_results(query, **kwargs):
+            yield [search_result(i) for i in range(50)]
+
+        youtube_client.iter_search_results = iter_search_results
+        youtube_client.get_videos_details.side_effect = YouTubeAPIError("quota exceeded")
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        analyzer._get_cached_analysis = AsyncMock(return_value=None)
+        analyzer._save_to_cache = AsyncMock()
+
+        result = await analyzer.analyze("video")
+
+        assert result["partial"] is True
+        assert result["metrics"]["competition"] == 0.5
+        analyzer._save_to_cache.assert_not_awaited()
+
+
+def cached_analysis(age_days, keyword="파이썬"):
+    analyzed_at = datetime.utcnow() - timedelta(days=age_days)
+    return KeywordAnalysis(
+        keyword=keyword,
+        search_volume=1200,
+        competition=0.6,
+        recommendation_score=0.7,
+        related_keywords=[],
+        analyzed_at=analyzed_at,
+        expires_at=analyzed_at + timedelta(days=KeywordAnalyzerService.CACHE_TTL_DAYS),
+    )
+
+
+class TestStaleWhileRevalidate:
+    @pytest.fixture
+    def youtube_client(self):
+        searches = []
+
+        async def iter_search_results(query, **kwargs):
+            searches.append(query)
+            yield [search_result(i) for i in range(3)]
+
+        client = AsyncMock()
+        client.iter_search_results = iter_search_results
+        client.get_videos_details.return_value = {}
+        client.get_channels_info.return_value = {}
+        client.searches = searches
+        return client
+
+    async def test_soft_expired_served_stale_and_refreshed_once(
+        self, db_session, youtube_client
+    ):
+        """soft TTL이 지나면 바로 stale로 반환하고 백그라운드에서 한 번만 갱신"""
+        db_session.add(cached_analysis(age_days=8))
+        await db_session.commit()
+        analyzer = KeywordAnalyzerService(db=db_session, youtube_client=youtube_client)
+
+        first = await analyzer.analyze("파이썬")
+        second = await analyzer.analyze("파이썬")
+        assert len(keyword_analyzer._refresh_tasks) == 1
+        await asyncio.gather(*keyword_analyzer._refresh_tasks.values())
+
+        assert first["stale"] is second["stale"] is True
+        assert first["metrics"]["search_volume"] == 1200
+        assert youtube_client.searches == ["파이썬"]
+
+        db_session.expire_all()
+        refreshed = await analyzer.analyze("파이썬")
+        assert refreshed["stale"] is False
+        assert refreshed["metrics"]["search_volume"] == 3 * 20
+
+    async def test_hard_expired_waits_for_fresh_analysis(self, youtube_client):
+        """hard TTL이 지나면 새로 분석할 때까지 기다림"""
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        analyzer._get_cached_analysis = AsyncMock(return_value=cached_analysis(age_days=20))
+        analyzer._save_to_cache = AsyncMock()
+
+        result = await analyzer.analyze("파이썬")
+
+        assert result["stale"] is False
+        assert result["metrics"]["search_volume"] == 3 * 20
+        assert not keyword_analyzer._refresh_tasks
+
+
+class TestInMemoryCache:
+    async def test_hot_keyword_skips_database(self):
+        """DB에서 읽은 신선한 결과는 메모리에 두고 다음 요청은 DB를 거치지 않음"""
+        analyzer = KeywordAnalyzerService(
+            db=AsyncMock(), youtube_client=AsyncMock(), cache=KeywordAnalysisCache()
+        )
+        analyzer._get_cached_analysis = AsyncMock(return_value=cached_analysis(age_days=1))
+
+        first = await analyzer.analyze("파이썬")
+        second = await analyzer.analyze(" 파이썬 ")
+
+        assert first == second
+        assert second["metrics"]["search_volume"] == 1200
+        analyzer._get_cached_analysis.assert_awaited_once()
+
+    async def test_save_replaces_cached_analysis(self, db_session):
+        """저장하면 메모리 캐시도 새 결과로 교체"""
+        cache = KeywordAnalysisCache()
+        analyzer = KeywordAnalyzerService(db=db_session, youtube_client=AsyncMock(), cache=cache)
+        row = cached_analysis(age_days=1)
+        cache.set("파이썬", row.to_dict(), row.expires_at)
+
+        await analyzer._save_to_cache({
+            "keyword": "파이썬",
+            "search_volume": 60,
+            "competition": 0.2,
+            "recommendation_score": 0.9,
+            "related_keywords": [],
+            "analyzed_at": datetime.utcnow(),
+        })
+
+        assert cache.get("파이썬")["metrics"]["search_volume"] == 60
+        assert (await analyzer._get_cached_analysis("파이썬")).search_volume == 60
+
+
+class TestDatabaseCache:
+    async def test_concurrent_first_save_updates_row(self, db_session, test_db_engine):
+        """동시에 처음 분석된 키워드는 먼저 저장된 행을 갱신"""
+        async with async_sessionmaker(test_db_engine)() as other_session:
+            other_session.add(cached_analysis(age_days=1))
+            await other_session.commit()
+
+        analyzer = KeywordAnalyzerService(db=db_session, youtube_client=AsyncMock())
+        lookup = analyzer._get_cached_analysis
+        # The row is inserted between this analysis' lookup and its insert
+        analyzer._get_cached_analysis = AsyncMock(side_effect=[None, await lookup("파이썬")])
+
+        await analyzer._save_to_cache({
+            "keyword": "파이썬",
+            "search_volume": 60,
+            "competition": 0.2,
+            "recommendation_score": 0.9,
+            "related_keywords": [],
+            "analyzed_at": datetime.utcnow(),
+        })
+
+        assert (await lookup("파이썬")).search_volume == 60
+
+
+class TestCircuitOpenFallback:
+    @pytest.fixture
+    def youtube_client(self):
+        async def iter_search_results(query, **kwargs):
+            raise YouTubeCircuitOpenError("circuit open")
+            yield
+
+        client = AsyncMock()
+        client.iter_search_results = iter_search_results
+        return client
+
+    def analyzer_with_cached(self, youtube_client, cached):
+        analyzer = KeywordAnalyzerService(db=AsyncMock(), youtube_client=youtube_client)
+        analyzer._get_cached_analysis = AsyncMock(return_value=cached)
+        return analyzer
+
+    async def test_expired_cache_served_as_stale(self, youtube_client):
+        """서킷이 열려 있으면 hard TTL이 지난 캐시도 stale로 반환"""
+        cached = cached_analysis(age_days=20)
+        analyzer = self.analyzer_with_cached(youtube_client, cached)
+
+        result = await analyzer.analyze("파이썬")
+
+        assert result["stale"] is True
+        assert result["metrics"]["search_volume"] == 1200
+
+    async def test_no_cache_fails_fast(self, youtube_client):
+        """캐시가 없으면 그대로 실패"""
+        analyzer = self.analyzer_with_cached(youtube_client, None)
+
+        with pytest.raises(YouTubeCircuitOpenError):
+            await analyzer.analyze("파이썬")
@@ -0,0 +1,58 @@
+"""
+Tests for KeywordAnalysisCache
+
+Tests the in-process cache in front of the keyword_analyses table:
+- Expiry at the row's expires_at
+- LRU eviction
+- Hit/miss counters
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.keyword_cache import KeywordAnalysisCache
+
+
+def analysis(keyword):
+    return {"keyword": keyword, "metrics": {}, "related_keywords": []}
+
+
+def in_days(days):
+    return datetime.utcnow() + timedelta(days=days)
+
+
+class TestKeywordAnalysisCache:
+    @pytest.fixture
+    def cache(self):
+        return KeywordAnalysisCache(max_entries=2)
+
+    def test_entry_expires_with_row(self, cache):
+        """DB 행의 expires_at이 지나면 캐시에서도 만료"""
+        cache.set("fresh", analysis("fresh"), in_days(1))
+        cache.set("expired", analysis("expired"), in_days(-1))
+
+        assert cache.get("fresh") == analysis("fresh")
+        assert cache.get("expired") is None
+        assert len(cache) == 1
+
+    def test_least_recently_used_evicted(self, cache):
+        """가득 차면 가장 오래 사용하지 않은 키워드를 제거"""
+        cache.set("a", analysis("a"), in_days(1))
+        cache.set("b", analysis("b"), in_days(1))
+        cache.get("a")
+        cache.set("c", analysis("c"), in_days(1))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_invalidate_and_stats(self, cache):
+        """무효화 후에는 미스로 집계"""
+        cache.set("a", analysis("a"), in_days(1))
+        cache.get("a")
+        cache.invalidate("a")
+        cache.get("a")
+
+        assert cache.stats() == {
+            "size": 0, "max_entries": 2, "hits": 1, "misses": 1, "hit_rate": 0.5,
+        }
@@ -0,0 +1,86 @@
+"""
+Tests for CircuitBreaker
+
+Tests YouTube API circuit breaker state transitions:
+- Opening on error rate and on slow calls
+- Half-open probing after the open period
+- Closing on a healthy probe, reopening on a failed one
+"""
+import time
+
+from app.services.youtube_breaker import CircuitBreaker
+
+
+def expire_open_period(breaker):
+    breaker._opened_at = time.monotonic() - breaker.open_seconds - 1
+
+
+class TestCircuitBreaker:
+    def test_opens_when_failure_rate_reached(self):
+        """최소 호출 수 이상에서 실패율이 임계치를 넘으면 열림"""
+        breaker = CircuitBreaker(window_size=4, min_calls=4, failure_rate=0.5)
+
+        breaker.record(True)
+        breaker.record(False)
+        breaker.record(True)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record(False)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.stats()["rejected"] == 1
+
+    def test_slow_calls_count_as_failures(self):
+        """느린 응답도 실패로 집계"""
+        breaker = CircuitBreaker(min_calls=2, slow_call_seconds=1.0)
+
+        breaker.record(True, latency=2.0)
+        breaker.record(True, latency=3.0)
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_probe_closes_on_success(self):
+        """대기 시간이 지나면 시험 요청 1건만 허용, 성공 시 닫힘"""
+        breaker = CircuitBreaker(min_calls=1, half_open_calls=1)
+        breaker.record(False)
+        expire_open_period(breaker)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record(True, latency=0.1)
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_half_open_probe_failure_reopens(self):
+        """시험 요청이 실패하면 다시 열림"""
+        breaker = CircuitBreaker(min_calls=1)
+        breaker.record(False)
+        expire_open_period(breaker)
+
+        assert breaker.allow_request() is True
+        breaker.record(False)
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.stats()["times_opened"] == 2
+
+    def test_cancelled_probe_frees_slot(self):
+        """완료되지 않은 시험 요청은 슬롯만 반환"""
+        breaker = CircuitBreaker(min_calls=1)
+        breaker.record(False)
+        expire_open_period(breaker)
+
+        assert breaker.allow_request() is True
+        breaker.record(None)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is True
+
+    def test_zero_failure_rate_disables_breaker(self):
+        """실패율 0이면 서킷 비활성화"""
+        breaker = CircuitBreaker(min_calls=1, failure_rate=0)
+        breaker.record(False)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request() is True
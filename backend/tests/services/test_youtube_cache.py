@@ -0,0 +1,80 @@
+"""
+Tests for ResponseCache
+
+Tests in-memory YouTube response caching:
+- Per-endpoint TTL expiry
+- LRU eviction
+- Hit/miss counters
+- Negative results with their own TTL
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.services.youtube_cache import ResponseCache
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def cache(self):
+        return ResponseCache(max_entries=2, ttls={"videos": 10, "channels": 100})
+
+    def test_hit_and_miss_counters(self, cache):
+        """조회 결과에 따라 hit/miss 카운트"""
+        assert cache.get("a") is None
+        cache.set("a", "videos", {"items": []})
+        assert cache.get("a") == {"items": []}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_per_endpoint_ttl(self, cache):
+        """엔드포인트별 TTL이 지나면 만료"""
+        with patch("app.services.youtube_cache.time.monotonic", return_value=1000.0):
+            cache.set("video", "videos", {"v": 1})
+            cache.set("channel", "channels", {"c": 1})
+
+        with patch("app.services.youtube_cache.time.monotonic", return_value=1050.0):
+            assert cache.get("video") is None
+            assert cache.get("channel") == {"c": 1}
+
+    def test_lru_eviction(self, cache):
+        """최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache.set("a", "videos", {"a": 1})
+        cache.set("b", "videos", {"b": 1})
+        cache.get("a")
+        cache.set("c", "videos", {"c": 1})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == {"a": 1}
+
+    def test_zero_ttl_disables_caching(self):
+        """TTL 0인 엔드포인트는 저장하지 않음"""
+        cache = ResponseCache(ttls={"search": 0})
+        cache.set("q", "search", {"items": []})
+        assert len(cache) == 0
+
+    def test_negative_results_expire_separately(self):
+        """없는 리소스는 별도의 짧은 TTL 동안 기억"""
+        cache = ResponseCache(negative_ttl=60)
+        with patch("app.services.youtube_cache.time.monotonic", return_value=1000.0):
+            cache.mark_missing("videos", "gone")
+
+        with patch("app.services.youtube_cache.time.monotonic", return_value=1030.0):
+            assert cache.is_missing("videos", "gone") is True
+            assert cache.is_missing("channels", "gone") is False
+            assert len(cache) == 0
+
+        with patch("app.services.youtube_cache.time.monotonic", return_value=1061.0):
+            assert cache.is_missing("videos", "gone") is False
+
+        assert cache.stats()["negative_hits"] == 1
+
+    def test_zero_negative_ttl_disables_negative_results(self):
+        """negative_ttl 0이면 기억하지 않음"""
+        cache = ResponseCache(negative_ttl=0)
+        cache.mark_missing("videos", "gone")
+        assert cache.is_missing("videos", "gone") is False
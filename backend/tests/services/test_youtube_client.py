@@ -0,0 +1,1309 @@
+"""
+Tests for YouTubeAPIClient
+
+Runs the real request/parse path against an in-process httpx.MockTransport:
+- Shared HTTP connection pool lifecycle
+- Batched multi-ID lookups
+- Partial-response fields= projections
+- Search pagination with next-page prefetch and early stop
+- Comment pagination via nextPageToken
+- Reply thread completion with bounded concurrency
+- Single-flight coalescing of identical requests
+- Response caching and ETag revalidation
+- Negative caching of missing resources and disabled comments
+- Quota ledger budgeting and API key rotation
+- Retry with backoff on transient errors
+- Hedged duplicates of slow reads
+- Request deadlines bounding calls and retries
+- Circuit breaker fail-fast
+- Response decoding and structured error reasons
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.deadline import Deadline, deadline_scope
+from app.services import youtube, youtube_breaker, youtube_limiter, youtube_quota
+from app.services.youtube import (
+    YouTubeAPIClient,
+    YouTubeAPIError,
+    YouTubeCircuitOpenError,
+    YouTubeDeadlineExceededError,
+    YouTubeQuotaExceededError,
+)
+from app.services.youtube_breaker import CircuitBreaker
+from app.services.youtube_cache import ResponseCache
+from app.services.youtube_hedge import RequestHedger
+from app.services.youtube_limiter import RateLimiter
+from app.services.youtube_quota import APIKeyPool
+from app.services.youtube_records import Comment, VideoDetails
+
+
+def make_transport(handler):
+    """Wrap a request handler into an AsyncClient with a mock transport."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def video_item(video_id, channel_id="channel_0", view_count=1000):
+    return {
+        "id": video_id,
+        "snippet": {
+            "title": f"Video {video_id}",
+            "description": "",
+            "channelId": channel_id,
+            "channelTitle": f"Channel {channel_id}",
+            "publishedAt": "2024-01-15T00:00:00Z",
+            "thumbnails": {"high": {"url": "https://example.com/thumb.jpg"}},
+        },
+        "contentDetails": {"duration": "PT1M"},
+        "statistics": {"viewCount": str(view_count), "likeCount": "10", "commentCount": "1"},
+    }
+
+
+def channel_item(channel_id, subscriber_count=5000):
+    return {
+        "id": channel_id,
+        "snippet": {
+            "title": f"Channel {channel_id}",
+            "description": "",
+            "publishedAt": "2020-01-01T00:00:00Z",
+            "thumbnails": {"high": {"url": "https://example.com/channel.jpg"}},
+        },
+        "statistics": {
+            "subscriberCount": str(subscriber_count),
+            "videoCount": "10",
+            "viewCount": "100000",
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+async def reset_http_pool():
+    """Make sure no shared pool leaks between tests."""
+    await youtube.close_http_client()
+    yield
+    await youtube.close_http_client()
+
+
+@pytest.fixture(autouse=True)
+def reset_key_pool(monkeypatch):
+    """Give every test a fresh shared API key pool."""
+    monkeypatch.setattr(youtube_quota, "_key_pool", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter(monkeypatch):
+    """Give every test a fresh limiter bound to its own event loop."""
+    monkeypatch.setattr(youtube_limiter, "_rate_limiter", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker(monkeypatch):
+    """Keep failures recorded by one test from tripping the breaker in the next."""
+    monkeypatch.setattr(youtube_breaker, "_circuit_breaker", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Start every test with an empty shared response cache."""
+    cache = youtube.get_response_cache()
+    if cache is not None:
+        cache.clear()
+    yield
+    if cache is not None:
+        cache.clear()
+
+
+class TestSharedHTTPPool:
+    async def test_client_attaches_to_shared_pool(self):
+        """앱 수명주기 풀이 있으면 재사용하고 닫지 않음"""
+        shared = youtube.init_http_client()
+
+        client = YouTubeAPIClient(api_key="test-key")
+        async with client:
+            assert client.client is shared
+        async with client:
+            assert client.client is shared
+
+        assert not shared.is_closed
+
+    async def test_client_without_pool_owns_private_client(self):
+        """풀이 없으면 전용 클라이언트를 만들고 종료 시 닫음"""
+        client = YouTubeAPIClient(api_key="test-key")
+        async with client:
+            private = client.client
+            assert private is not None
+        assert private.is_closed
+        assert client.client is None
+
+    async def test_reused_singleton_survives_context_exit(self):
+        """재사용되는 클라이언트는 첫 async with 이후에도 요청 가능"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.params["id"])
+            return httpx.Response(200, json={"items": [video_item(request.url.params["id"])]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        async with client:
+            await client.get_video_details("abc")
+        async with client:
+            details = await client.get_video_details("def")
+
+        assert details.video_id == "def"
+        assert calls == ["abc", "def"]
+
+
+class TestBatchedVideoLookup:
+    async def test_chunks_ids_by_50(self):
+        """50개 단위로 묶어서 요청하고 video_id 키로 반환"""
+        requested = []
+
+        def handler(request):
+            ids = request.url.params["id"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json={"items": [video_item(i) for i in ids]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        video_ids = [f"vid_{i}" for i in range(120)]
+        results = await client.get_videos_details(video_ids)
+
+        assert [len(ids) for ids in requested] == [50, 50, 20]
+        assert list(results) == video_ids
+        assert results["vid_7"].view_count == 1000
+        assert isinstance(results["vid_7"], VideoDetails)
+        assert not hasattr(results["vid_7"], "__dict__")  # slotted record
+
+    async def test_reports_missing_ids_and_dedupes(self):
+        """없는 영상은 None으로 표시하고 중복 ID는 한 번만 요청"""
+        requested = []
+
+        def handler(request):
+            ids = request.url.params["id"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json={"items": [video_item("a")]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        results = await client.get_videos_details(["a", "b", "a", " "])
+
+        assert requested == [["a", "b"]]
+        assert results["a"].video_id == "a"
+        assert results["b"] is None
+
+
+class TestBatchedChannelLookup:
+    async def test_dedupes_and_chunks_channels(self):
+        """채널 ID 중복 제거 후 50개 단위로 조회"""
+        requested = []
+
+        def handler(request):
+            assert request.url.path.endswith("/channels")
+            ids = request.url.params["id"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json={"items": [channel_item(i) for i in ids if i != "gone"]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        channel_ids = [f"ch_{i % 60}" for i in range(120)] + ["gone"]
+        results = await client.get_channels_info(channel_ids)
+
+        assert sorted(len(ids) for ids in requested) == [11, 50]
+        assert len(results) == 61
+        assert results["ch_3"].subscriber_count == 5000
+        assert results["gone"] is None
+
+
+class TestFieldProjection:
+    async def test_default_mask_matches_returned_keys(self):
+        """기본 fields 마스크는 반환하는 키만 요청"""
+        requested = []
+
+        def handler(request):
+            requested.append(dict(request.url.params))
+            return httpx.Response(200, json={"items": [video_item("abc")]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        details = await client.get_video_details("abc")
+
+        fields = requested[0]["fields"]
+        assert fields.startswith("etag,items(id,snippet/title,")
+        assert "snippet/thumbnails/high/url" in fields
+        assert "snippet/localized" not in fields
+        assert details.thumbnail_url == "https://example.com/thumb.jpg"
+
+    async def test_narrow_projection_trims_parts_and_keys(self):
+        """좁은 projection은 필요한 part와 필드만 요청, 나머지는 기본값"""
+        requested = []
+
+        def handler(request):
+            requested.append(dict(request.url.params))
+            return httpx.Response(200, json={"items": [
+                {"id": video_id, "statistics": {"viewCount": "1000"}} for video_id in ("a", "b")
+            ]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        results = await client.get_videos_details(["a", "b"], fields=["view_count"])
+
+        assert requested[0]["part"] == "statistics"
+        assert requested[0]["fields"] == "etag,items(id,statistics/viewCount)"
+        assert results["a"] == VideoDetails(video_id="a", view_count=1000)
+
+    async def test_comment_projection(self):
+        """댓글도 요청한 필드만 채움"""
+        def handler(request):
+            assert "snippet/topLevelComment/snippet/textDisplay" in request.url.params["fields"]
+            return httpx.Response(200, json={"items": [{
+                "snippet": {
+                    "totalReplyCount": 2,
+                    "topLevelComment": {"id": "c1", "snippet": {"textDisplay": "좋아요"}},
+                },
+            }]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        comments = await client.get_video_comments("abc", fields=["text"])
+
+        assert comments == [Comment(comment_id="c1", text="좋아요", reply_count=2)]
+
+    async def test_unknown_field_rejected(self):
+        """알 수 없는 필드는 요청 전에 거부"""
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: pytest.fail("should not be called")),
+        )
+        with pytest.raises(ValueError, match="Unknown fields"):
+            await client.get_channel_info("ch", fields=["likes"])
+
+
+def search_page(start, count, title="파이썬 강의", next_token=None):
+    page = {"items": [
+        {"id": {"videoId": f"v{i}"}, "snippet": {"title": f"{title} {i}", "description": ""}}
+        for i in range(start, start + count)
+    ]}
+    if next_token:
+        page["nextPageToken"] = next_token
+    return page
+
+
+class TestSearchPaging:
+    @staticmethod
+    def paged_handler(requested, titles=("파이썬 강의",) * 10):
+        """Serve one page of search results per title, linked by nextPageToken."""
+        def handler(request):
+            params = dict(request.url.params)
+            requested.append(params)
+            index = int(params.get("pageToken", "0"))
+            next_token = str(index + 1) if index + 1 < len(titles) else None
+            return httpx.Response(200, json=search_page(
+                index * 50, int(params["maxResults"]), titles[index], next_token
+            ))
+        return handler
+
+    async def test_search_videos_follows_pages(self):
+        """50건을 넘는 검색은 페이지를 이어서 요청하고 마지막 페이지는 필요한 만큼만"""
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested))
+        )
+
+        results = await client.search_videos("파이썬", max_results=120)
+
+        assert len(results) == 120
+        assert len({r.video_id for r in results}) == 120
+        assert [r["maxResults"] for r in requested] == ["50", "50", "20"]
+        assert [r.get("pageToken") for r in requested] == [None, "1", "2"]
+        assert requested[0]["fields"].startswith("nextPageToken,")
+
+    async def test_max_results_validated(self):
+        """max_results는 1~500"""
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(None))
+
+        with pytest.raises(ValueError, match="500"):
+            await client.search_videos("파이썬", max_results=501)
+
+    async def test_next_page_prefetched(self):
+        """현재 페이지를 처리하는 동안 다음 페이지를 미리 요청"""
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested))
+        )
+
+        pages = client.iter_search_results("파이썬", limit=100)
+        await anext(pages)
+        await asyncio.sleep(0.01)
+        assert len(requested) == 2
+
+        await anext(pages)
+        await pages.aclose()
+        assert len(requested) == 2
+
+    async def test_early_stop_cancels_prefetch(self):
+        """소비자가 중단하면 미리 받은 페이지를 버리고 더 요청하지 않음"""
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested))
+        )
+
+        async for page in client.iter_search_results("파이썬", limit=500):
+            break
+        await asyncio.sleep(0.01)
+
+        assert len(page) == 50
+        assert len(requested) <= 2
+
+    async def test_stops_when_results_turn_irrelevant(self):
+        """검색어가 드문 페이지 다음은 요청하지 않음"""
+        requested = []
+        titles = ("파이썬 강의", "고양이 영상", "파이썬 강의")
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested, titles))
+        )
+
+        pages = [
+            page async for page in client.iter_search_results(
+                "파이썬", limit=150, min_relevance=0.3
+            )
+        ]
+
+        assert [len(page) for page in pages] == [50, 50]
+        assert len(requested) == 2
+
+    async def test_stops_at_quota_reserve(self):
+        """검색 한 번을 감당할 쿼터가 없으면 다음 페이지를 요청하지 않음"""
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(self.paged_handler(requested)),
+            key_pool=APIKeyPool(["test-key"], daily_limit=300, reserve=100),
+        )
+
+        results = await client.search_videos("파이썬", max_results=500)
+
+        assert len(results) == 100
+        assert client.key_pool.ledger_for("test-key").remaining == 100
+
+
+def comment_page(start, count, next_token=None):
+    page = {"items": [
+        {"snippet": {"topLevelComment": {"id": f"c{i}", "snippet": {"textDisplay": f"댓글 {i}"}}}}
+        for i in range(start, start + count)
+    ]}
+    if next_token:
+        page["nextPageToken"] = next_token
+    return page
+
+
+class TestCommentPaging:
+    @staticmethod
+    def paged_handler(requested, pages=5):
+        """Serve `pages` pages of 100 comments linked by nextPageToken."""
+        def handler(request):
+            params = dict(request.url.params)
+            requested.append(params)
+            index = int(params.get("pageToken", "0"))
+            next_token = str(index + 1) if index + 1 < pages else None
+            return httpx.Response(
+                200, json=comment_page(index * 100, int(params["maxResults"]), next_token)
+            )
+        return handler
+
+    async def test_follows_page_tokens_up_to_limit(self):
+        """nextPageToken을 따라가며 limit에서 멈추고 마지막 페이지는 필요한 만큼만 요청"""
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested))
+        )
+
+        pages = [page async for page in client.iter_video_comments("abc", limit=250)]
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert [r.get("pageToken") for r in requested] == [None, "1", "2"]
+        assert requested[-1]["maxResults"] == "50"
+        assert requested[0]["fields"].startswith("nextPageToken,")
+
+    async def test_pages_fetched_lazily(self):
+        """소비자가 중단하면 다음 페이지를 요청하지 않음"""
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested))
+        )
+
+        async for page in client.iter_video_comments("abc", limit=1000):
+            break
+
+        assert len(requested) == 1
+
+    async def test_stops_at_quota_reserve(self, monkeypatch):
+        """남은 쿼터가 예비분 이하이면 다음 페이지를 요청하지 않음"""
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_DAILY_QUOTA", 502)
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_QUOTA_RESERVE", 500)
+        requested = []
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(self.paged_handler(requested))
+        )
+
+        pages = [page async for page in client.iter_video_comments("abc", limit=1000)]
+
+        assert len(pages) == 2
+        assert client.key_pool.ledger_for("test-key").remaining == 500
+
+    async def test_disabled_comments_end_stream(self):
+        """댓글이 비활성화된 영상은 빈 스트림"""
+        body = {"error": {"errors": [{"reason": "commentsDisabled"}]}}
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: httpx.Response(403, json=body)),
+        )
+
+        assert [page async for page in client.iter_video_comments("abc")] == []
+
+
+def reply_item(reply_id, parent_id):
+    return {"id": reply_id, "snippet": {"textDisplay": f"답글 {reply_id}", "parentId": parent_id}}
+
+
+class TestReplyFetching:
+    async def test_thread_embeds_first_replies(self):
+        """commentThreads 응답에 포함된 답글을 함께 파싱"""
+        def handler(request):
+            assert request.url.params["part"] == "snippet,replies"
+            assert "replies/comments(id," in request.url.params["fields"]
+            return httpx.Response(200, json={"items": [{
+                "snippet": {
+                    "totalReplyCount": 1,
+                    "topLevelComment": {"id": "c1", "snippet": {"textDisplay": "질문"}},
+                },
+                "replies": {"comments": [reply_item("r1", "c1")]},
+            }]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        [thread] = await client.get_video_comments("abc")
+
+        assert thread.replies == [Comment(comment_id="r1", text="답글 r1", parent_id="c1")]
+
+    async def test_fetches_only_incomplete_threads(self):
+        """포함된 답글보다 reply_count가 많은 스레드만 comments.list로 조회"""
+        requested = []
+
+        def handler(request):
+            params = dict(request.url.params)
+            requested.append(params)
+            parent_id = params["parentId"]
+            return httpx.Response(200, json={"items": [
+                reply_item(f"{parent_id}-r{i}", parent_id) for i in range(3)
+            ]})
+
+        threads = [
+            Comment(comment_id="full", reply_count=1, replies=[Comment(comment_id="r0", parent_id="full")]),
+            Comment(comment_id="partial", reply_count=3, replies=[Comment(comment_id="r1", parent_id="partial")]),
+            Comment(comment_id="none", reply_count=0),
+        ]
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        replies = await client.get_thread_replies(threads)
+
+        assert [r["parentId"] for r in requested] == ["partial"]
+        assert list(replies) == ["full", "partial"]
+        assert [reply.comment_id for reply in replies["full"]] == ["r0"]
+        assert len(replies["partial"]) == 3
+
+    async def test_concurrency_bounded(self):
+        """동시에 조회하는 스레드 수를 제한"""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={"items": [reply_item("r", request.url.params["parentId"])]})
+
+        threads = [Comment(comment_id=f"c{i}", reply_count=10) for i in range(8)]
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        replies = await client.get_thread_replies(threads, concurrency=2)
+
+        assert peak == 2
+        assert all(len(thread) == 1 for thread in replies.values())
+
+    async def test_failed_thread_keeps_embedded_replies(self):
+        """조회에 실패한 스레드는 포함된 답글만 유지"""
+        embedded = [Comment(comment_id="r1", parent_id="c1")]
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: httpx.Response(404, json={})),
+        )
+        replies = await client.get_thread_replies(
+            [Comment(comment_id="c1", reply_count=5, replies=embedded)]
+        )
+
+        assert replies == {"c1": embedded}
+
+
+class TestRequestCoalescing:
+    async def test_identical_concurrent_requests_share_one_call(self):
+        """동시에 들어온 동일 요청은 업스트림 호출 1회로 합쳐짐"""
+        calls = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            calls.append(request.url.params["id"])
+            await release.wait()
+            return httpx.Response(200, json={"items": [video_item(request.url.params["id"])]})
+
+        http_client = make_transport(handler)
+        clients = [
+            YouTubeAPIClient(api_key="test-key", http_client=http_client) for _ in range(3)
+        ]
+        tasks = [asyncio.create_task(c.get_video_details("same")) for c in clients]
+        tasks.append(asyncio.create_task(clients[0].get_video_details("other")))
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert sorted(calls) == ["other", "same"]
+        assert [r.video_id for r in results] == ["same", "same", "same", "other"]
+        assert youtube._inflight_requests == {}
+
+    async def test_coalesced_callers_share_exception(self):
+        """공유된 요청의 예외는 모든 호출자에게 전달"""
+        calls = []
+
+        async def handler(request):
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        results = await asyncio.gather(
+            client.get_video_details("x"),
+            client.get_video_details("x"),
+            return_exceptions=True,
+        )
+
+        assert len(calls) == 1
+        assert all(isinstance(r, YouTubeAPIError) for r in results)
+
+    async def test_clients_with_own_http_clients_not_coalesced(self):
+        """HTTP 클라이언트나 API 키가 다른 클라이언트의 요청은 합치지 않음"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.params["key"])
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"items": [video_item(request.url.params["id"])]})
+
+        shared = make_transport(handler)
+        clients = [
+            YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler)),
+            YouTubeAPIClient(api_key="test-key", http_client=shared),
+            YouTubeAPIClient(api_key="other-key", http_client=shared),
+        ]
+        results = await asyncio.gather(*(c.get_video_details("same") for c in clients))
+
+        assert sorted(calls) == ["other-key", "test-key", "test-key"]
+        assert [r.video_id for r in results] == ["same"] * 3
+
+
+class TestResponseCaching:
+    async def test_repeated_lookup_served_from_cache(self):
+        """같은 조회는 캐시에서 반환하고 API를 다시 호출하지 않음"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"items": [channel_item("ch")]})
+
+        cache = ResponseCache()
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), cache=cache
+        )
+        first = await client.get_channel_info("ch")
+        second = await client.get_channel_info("ch")
+
+        assert first == second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_bypass_flag_skips_cache(self):
+        """use_cache=False이면 항상 API 호출"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"items": [channel_item("ch")]})
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), use_cache=False
+        )
+        await client.get_channel_info("ch")
+        await client.get_channel_info("ch")
+
+        assert len(calls) == 2
+
+    async def test_expired_entry_revalidated_with_etag(self):
+        """만료된 캐시는 If-None-Match로 재검증하고 304면 TTL만 갱신"""
+        seen_etags = []
+
+        def handler(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"items": [channel_item("ch")]}, headers={"ETag": '"v1"'}
+            )
+
+        cache = ResponseCache(ttls={"channels": 0.01})
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), cache=cache
+        )
+        first = await client.get_channel_info("ch")
+        await asyncio.sleep(0.02)
+        second = await client.get_channel_info("ch")
+
+        assert seen_etags == [None, '"v1"']
+        assert second == first
+        assert cache.stats()["revalidations"] == 1
+
+
+class TestNegativeCaching:
+    async def test_missing_video_not_requested_again(self):
+        """없는 영상은 다른 fields로 조회해도 다시 요청하지 않음"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"items": []})
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), cache=ResponseCache()
+        )
+        for fields in (None, ["title"]):
+            with pytest.raises(ValueError, match="Video not found"):
+                await client.get_video_details("gone", fields=fields)
+
+        assert len(calls) == 1
+        assert client.key_pool.ledger_for("test-key").used == 1
+
+    async def test_batched_lookup_skips_missing_ids(self):
+        """일괄 조회에서 없는 것으로 확인된 ID는 다음 요청에서 제외"""
+        requested = []
+
+        def handler(request):
+            ids = request.url.params["id"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json={"items": [channel_item(i) for i in ids if i != "gone"]})
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), cache=ResponseCache()
+        )
+        await client.get_channels_info(["a", "gone"])
+        results = await client.get_channels_info(["b", "gone"])
+        with pytest.raises(ValueError, match="Channel not found"):
+            await client.get_channel_info("gone")
+
+        assert requested == [["a", "gone"], ["b"]]
+        assert results["gone"] is None
+
+    async def test_disabled_comments_not_requested_again(self):
+        """댓글이 꺼진 영상은 다시 요청하지 않고 빈 스트림"""
+        calls = []
+        body = {"error": {"errors": [{"reason": "commentsDisabled"}]}}
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(403, json=body)
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), cache=ResponseCache()
+        )
+
+        assert await client.get_video_comments("abc") == []
+        assert await client.get_video_comments("abc") == []
+        assert len(calls) == 1
+
+    async def test_bypass_flag_skips_negative_cache(self):
+        """use_cache=False이면 없는 영상도 매번 확인"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"items": []})
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), use_cache=False
+        )
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await client.get_video_details("gone")
+
+        assert len(calls) == 2
+
+
+class TestQuotaBudgeting:
+    async def test_requests_are_charged_to_ledger(self):
+        """업스트림 요청마다 쿼터 비용 기록, 캐시 히트는 무료"""
+        def handler(request):
+            return httpx.Response(200, json={"items": []})
+
+        pool = APIKeyPool(daily_limit=1000)
+        ledger = pool.ledger_for("test-key")
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), key_pool=pool
+        )
+        await client.search_videos("python")
+        await client.search_videos("python")
+        await client.get_channels_info(["a"])
+
+        assert ledger.status()["by_endpoint"] == {"search": 100, "channels": 1}
+
+    async def test_preflight_rejects_without_calling_api(self):
+        """잔여 쿼터가 부족하면 API 호출 없이 거절"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"items": []})
+
+        pool = APIKeyPool(daily_limit=150, reserve=100)
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), key_pool=pool
+        )
+        with pytest.raises(YouTubeQuotaExceededError):
+            await client.search_videos("python")
+        assert calls == []
+
+    async def test_check_quota_reads_ledger(self):
+        """check_quota는 API를 호출하지 않고 원장 기준으로 응답"""
+        def handler(request):
+            raise AssertionError("check_quota must not call the API")
+
+        pool = APIKeyPool(daily_limit=1000)
+        pool.ledger_for("test-key").charge("search")
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), key_pool=pool
+        )
+        status = await client.check_quota()
+
+        assert status["available"] is True
+        assert status["used_units"] == 100
+        assert status["remaining_units"] == 900
+
+    async def test_picks_key_with_most_remaining_budget(self, monkeypatch):
+        """잔여 쿼터가 가장 많은 키로 요청"""
+        used_keys = []
+
+        def handler(request):
+            used_keys.append(request.url.params["key"])
+            return httpx.Response(200, json={"items": []})
+
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_API_KEYS", ["key-a", "key-b"])
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_API_KEY", None)
+        pool = APIKeyPool(["key-a", "key-b"], daily_limit=1000)
+        pool.ledger_for("key-a").charge("search")
+        client = YouTubeAPIClient(http_client=make_transport(handler), key_pool=pool)
+        await client.get_channels_info(["a"])
+
+        assert used_keys == ["key-b"]
+
+    async def test_rotates_key_on_quota_exceeded(self, monkeypatch):
+        """quotaExceeded 응답 시 해당 키를 소진 처리하고 다른 키로 재시도"""
+        used_keys = []
+
+        def handler(request):
+            key = request.url.params["key"]
+            used_keys.append(key)
+            if key == "key-a":
+                return httpx.Response(
+                    403, json={"error": {"errors": [{"reason": "quotaExceeded"}]}}
+                )
+            return httpx.Response(200, json={"items": [channel_item("ch")]})
+
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_API_KEYS", ["key-a", "key-b"])
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_API_KEY", None)
+        pool = APIKeyPool(["key-a", "key-b"], daily_limit=1000)
+        pool.ledger_for("key-b").charge("search")
+        client = YouTubeAPIClient(http_client=make_transport(handler), key_pool=pool)
+        info = await client.get_channel_info("ch")
+
+        assert info.channel_id == "ch"
+        assert used_keys == ["key-a", "key-b"]
+        assert pool.ledger_for("key-a").remaining == 0
+
+        with pytest.raises(YouTubeQuotaExceededError):
+            pool.ledger_for("key-b").mark_exhausted()
+            await client.get_channel_info("other")
+
+
+class TestRetryPolicy:
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff delays instead of sleeping."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(youtube.asyncio, "sleep", fake_sleep)
+        return delays
+
+    async def test_retries_transient_status_then_succeeds(self, sleeps):
+        """503 응답은 백오프 후 재시도"""
+        responses = [
+            httpx.Response(503),
+            httpx.Response(500),
+            httpx.Response(200, json={"items": [channel_item("ch")]}),
+        ]
+
+        def handler(request):
+            return responses.pop(0)
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), use_cache=False
+        )
+        info = await client.get_channel_info("ch")
+
+        assert info.channel_id == "ch"
+        assert len(sleeps) == 2
+        assert all(0 <= d <= youtube.settings.YOUTUBE_RETRY_MAX_DELAY for d in sleeps)
+
+    async def test_honors_retry_after(self, sleeps):
+        """429의 Retry-After 헤더만큼 대기"""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"items": [channel_item("ch")]}),
+        ]
+
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: responses.pop(0)),
+            use_cache=False,
+        )
+        await client.get_channel_info("ch")
+
+        assert sleeps == [2.0]
+
+    async def test_non_transient_error_not_retried(self, sleeps):
+        """400 에러는 재시도하지 않음"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(400, json={"error": {"message": "Invalid id"}})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        with pytest.raises(YouTubeAPIError, match="Invalid id"):
+            await client.get_channel_info("ch")
+
+        assert len(calls) == 1
+        assert sleeps == []
+
+    async def test_gives_up_after_max_retries(self, sleeps):
+        """최대 재시도 횟수를 넘기면 실패"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            raise httpx.ConnectError("connection refused")
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        with pytest.raises(YouTubeAPIError, match="Network error"):
+            await client.get_channel_info("ch")
+
+        assert len(calls) == youtube.settings.YOUTUBE_MAX_RETRIES + 1
+
+    async def test_dropped_keepalive_connection_retried(self, sleeps):
+        """서버가 응답 없이 연결을 끊으면 네트워크 오류로 재시도하고 서킷에 기록"""
+        breaker = CircuitBreaker(min_calls=2, failure_rate=1.0)
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            if len(calls) == 1:
+                raise httpx.RemoteProtocolError("Server disconnected without sending a response")
+            return httpx.Response(200, json={"items": [channel_item("ch")]})
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), breaker=breaker
+        )
+
+        assert (await client.get_channel_info("ch")).channel_id == "ch"
+        assert len(calls) == 2
+        assert breaker.stats()["window_failure_rate"] == 0.5
+
+    async def test_unexpected_error_wrapped(self, sleeps):
+        """예상하지 못한 예외는 YouTubeAPIError로 감싸서 전달"""
+        def handler(request):
+            raise RuntimeError("boom")
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        with pytest.raises(YouTubeAPIError, match="Unexpected error: boom"):
+            await client.get_channel_info("ch")
+
+    async def test_retry_budget_limits_total_wait(self, sleeps, monkeypatch):
+        """전체 재시도 시간 예산을 넘는 대기는 하지 않음"""
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_RETRY_BUDGET", 1.0)
+
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(
+                lambda request: httpx.Response(503, headers={"Retry-After": "30"})
+            ),
+        )
+        with pytest.raises(YouTubeAPIError):
+            await client.get_channel_info("ch")
+
+        assert sleeps == []
+
+
+class TestRequestHedging:
+    @staticmethod
+    def hedger(budget=1.0):
+        """Hedger for videos that hedges after 20 ms."""
+        hedger = RequestHedger(endpoints=["videos"], min_samples=1, min_delay=0.02, budget=budget)
+        hedger.record_latency("videos", 0.02)
+        return hedger
+
+    @staticmethod
+    def handler(calls, delays):
+        """Answer the n-th request after delays[n] seconds."""
+        async def handler(request):
+            calls.append(1)
+            await asyncio.sleep(delays[len(calls) - 1])
+            return httpx.Response(200, json={"items": [video_item(request.url.params["id"])]})
+        return handler
+
+    async def test_slow_request_hedged(self):
+        """응답이 늦으면 중복 요청을 보내 먼저 온 응답을 사용"""
+        calls = []
+        hedger = self.hedger()
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(self.handler(calls, [1.0, 0.0])),
+            hedger=hedger,
+        )
+
+        started = asyncio.get_running_loop().time()
+        details = await client.get_video_details("abc")
+
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert details.video_id == "abc"
+        assert len(calls) == 2
+        assert hedger.stats()["win_rate"] == 1.0
+        assert client.key_pool.ledger_for("test-key").used == 2
+
+    async def test_fast_request_not_hedged(self):
+        """지연 시간 안에 응답하면 중복 요청 없음"""
+        calls = []
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(self.handler(calls, [0.0])),
+            hedger=self.hedger(),
+        )
+
+        await client.get_video_details("abc")
+
+        assert len(calls) == 1
+
+    async def test_budget_exhausted(self):
+        """헤징 예산이 없으면 원래 요청만 기다림"""
+        calls = []
+        hedger = self.hedger(budget=0.5)
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(self.handler(calls, [0.05])),
+            hedger=hedger,
+        )
+
+        await client.get_video_details("abc")
+
+        assert len(calls) == 1
+        assert hedger.stats()["skipped"] == 1
+
+    async def test_retryable_hedge_response_does_not_win(self):
+        """중복 요청의 빠른 503보다 원래 요청의 응답을 기다리고, 원래 요청의 지연만 기록"""
+        calls = []
+
+        async def handler(request):
+            calls.append(1)
+            if len(calls) == 2:
+                return httpx.Response(503, json={"error": {"message": "backend error"}})
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json={"items": [video_item(request.url.params["id"])]})
+
+        hedger = RequestHedger(
+            endpoints=["videos"], percentile=1.0, min_samples=1, min_delay=0.02, budget=1.0
+        )
+        hedger.record_latency("videos", 0.02)
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), hedger=hedger
+        )
+
+        details = await client.get_video_details("abc")
+
+        assert details.video_id == "abc"
+        assert len(calls) == 2
+        stats = hedger.stats()
+        assert stats["wins"] == 0
+        assert stats["delays"]["videos"] >= 0.1
+
+    async def test_search_never_hedged(self):
+        """search는 헤징 대상이 아님"""
+        calls = []
+
+        async def handler(request):
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"items": []})
+
+        hedger = RequestHedger(endpoints=["search"], min_samples=1, min_delay=0.0, budget=1.0)
+        hedger.record_latency("search", 0.0)
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), hedger=hedger
+        )
+
+        await client.search_videos("파이썬")
+
+        assert len(calls) == 1
+
+
+class TestRequestDeadline:
+    async def test_slow_call_cut_at_deadline(self):
+        """남은 시간이 지나면 응답을 기다리지 않고 실패하며 서킷에 실패로 기록하지 않음"""
+        async def handler(request):
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json={"items": [video_item("abc")]})
+
+        breaker = CircuitBreaker(min_calls=1)
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), breaker=breaker
+        )
+
+        started = asyncio.get_running_loop().time()
+        with deadline_scope(Deadline(0.05)):
+            with pytest.raises(YouTubeDeadlineExceededError):
+                await client.get_video_details("abc")
+
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    async def test_expired_deadline_skips_request(self):
+        """마감이 지난 요청은 보내지 않음"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(200, json={"items": []})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        with deadline_scope(Deadline(0)):
+            with pytest.raises(YouTubeDeadlineExceededError):
+                await client.get_video_details("abc")
+
+        assert calls == []
+        assert client.key_pool.ledger_for("test-key").used == 0
+
+    async def test_no_retry_past_deadline(self, monkeypatch):
+        """재시도 대기가 남은 시간을 넘으면 바로 실패"""
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_RETRY_BASE_DELAY", 5.0)
+        monkeypatch.setattr(youtube.random, "uniform", lambda low, high: high)
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(503)
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+        with deadline_scope(Deadline(1.0)):
+            with pytest.raises(YouTubeDeadlineExceededError, match="no time left to retry"):
+                await client.get_channel_info("ch")
+
+        assert len(calls) == 1
+
+    async def test_limiter_wait_counts_against_deadline(self):
+        """리미터 대기 중 마감이 지나면 요청을 보내지 않음"""
+        calls = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            calls.append(request.url.params["id"])
+            await release.wait()
+            return httpx.Response(200, json={"items": [video_item(request.url.params["id"])]})
+
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(handler),
+            limiter=RateLimiter(rate_per_second=0, max_in_flight=1),
+        )
+        blocking = asyncio.create_task(client.get_video_details("first"))
+        await asyncio.sleep(0.01)
+
+        async def queued():
+            with deadline_scope(Deadline(0.05)):
+                await client.get_video_details("second")
+
+        waiting = asyncio.create_task(queued())
+        await asyncio.sleep(0.1)
+        release.set()
+
+        with pytest.raises(YouTubeDeadlineExceededError):
+            await waiting
+        await blocking
+        await asyncio.sleep(0.01)
+        assert calls == ["first"]
+        assert client.key_pool.ledger_for("test-key").used == 1
+
+    async def test_shared_request_runs_until_latest_deadline(self, monkeypatch):
+        """합쳐진 요청은 첫 호출자의 마감이 아닌 가장 늦은 마감까지 재시도"""
+        monkeypatch.setattr(youtube.settings, "YOUTUBE_RETRY_BASE_DELAY", 0.2)
+        monkeypatch.setattr(youtube.random, "uniform", lambda low, high: high)
+        calls = []
+
+        async def handler(request):
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                return httpx.Response(503)
+            return httpx.Response(200, json={"items": [channel_item("ch")]})
+
+        client = YouTubeAPIClient(api_key="test-key", http_client=make_transport(handler))
+
+        async def call(deadline):
+            with deadline_scope(deadline):
+                return await client.get_channel_info("ch")
+
+        hurried = asyncio.create_task(call(Deadline(0.1)))
+        await asyncio.sleep(0.01)
+        patient = asyncio.create_task(call(None))
+
+        with pytest.raises(YouTubeDeadlineExceededError):
+            await hurried
+        assert (await patient).channel_id == "ch"
+        assert len(calls) == 2
+
+    async def test_cached_response_served_after_deadline(self):
+        """캐시된 응답은 마감이 지나도 반환"""
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(
+                lambda request: httpx.Response(200, json={"items": [video_item("abc")]})
+            ),
+            cache=ResponseCache(),
+        )
+        await client.get_video_details("abc")
+
+        with deadline_scope(Deadline(0)):
+            details = await client.get_video_details("abc")
+
+        assert details.video_id == "abc"
+
+
+class TestErrorDecoding:
+    async def test_quota_detected_from_reason_only(self):
+        """quota 판정은 메시지가 아닌 error.errors[].reason 기준"""
+        body = {"error": {
+            "message": "quotaExceeded mentioned in text",
+            "errors": [{"reason": "forbidden"}],
+        }}
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: httpx.Response(403, json=body)),
+        )
+        with pytest.raises(YouTubeAPIError) as exc_info:
+            await client.get_channel_info("ch")
+
+        assert not isinstance(exc_info.value, YouTubeQuotaExceededError)
+        assert exc_info.value.reasons == {"forbidden"}
+        assert str(exc_info.value) == "quotaExceeded mentioned in text"
+
+    async def test_comments_disabled_reason_returns_empty(self):
+        """commentsDisabled 사유는 빈 댓글 목록으로 처리"""
+        body = {"error": {
+            "message": "The video has disabled comments.",
+            "errors": [{"reason": "commentsDisabled"}],
+        }}
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: httpx.Response(403, json=body)),
+        )
+
+        assert await client.get_video_comments("abc") == []
+
+    async def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        """orjson이 없으면 표준 json으로 디코딩"""
+        monkeypatch.setattr(youtube, "orjson", None)
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(
+                lambda request: httpx.Response(200, json={"items": [channel_item("ch")]})
+            ),
+        )
+
+        assert (await client.get_channel_info("ch")).channel_id == "ch"
+
+    async def test_non_object_body_rejected(self):
+        """JSON 객체가 아닌 응답은 오류"""
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(lambda request: httpx.Response(200, content=b"[]")),
+        )
+        with pytest.raises(YouTubeAPIError, match="not a JSON object"):
+            await client.get_channel_info("ch")
+
+
+class TestCircuitBreaker:
+    async def test_open_breaker_fails_fast_without_network(self):
+        """서킷이 열리면 네트워크 호출 없이 즉시 실패"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(400, json={"error": {"message": "Invalid id"}})
+
+        breaker = CircuitBreaker(min_calls=1, open_seconds=60)
+        breaker.record(False)
+
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), breaker=breaker
+        )
+        with pytest.raises(YouTubeCircuitOpenError):
+            await client.get_channel_info("ch")
+
+        assert calls == []
+        assert client.key_pool.ledger_for("test-key").used == 0
+
+    async def test_server_errors_trip_breaker_mid_retry(self, monkeypatch):
+        """5xx 응답이 누적되면 재시도 도중 서킷이 열림"""
+        async def no_sleep(delay):
+            pass
+
+        monkeypatch.setattr(youtube.asyncio, "sleep", no_sleep)
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            return httpx.Response(503)
+
+        breaker = CircuitBreaker(window_size=2, min_calls=2, open_seconds=60)
+        client = YouTubeAPIClient(
+            api_key="test-key", http_client=make_transport(handler), breaker=breaker
+        )
+        with pytest.raises(YouTubeCircuitOpenError):
+            await client.get_channel_info("ch")
+
+        assert len(calls) == 2
+        assert breaker.state == CircuitBreaker.OPEN
+
+    async def test_client_errors_do_not_count_as_failures(self):
+        """4xx 응답은 API 장애로 보지 않음"""
+        breaker = CircuitBreaker(min_calls=1)
+        client = YouTubeAPIClient(
+            api_key="test-key",
+            http_client=make_transport(
+                lambda request: httpx.Response(404, json={"error": {"message": "nope"}})
+            ),
+            breaker=breaker,
+        )
+        with pytest.raises(YouTubeAPIError):
+            await client.get_channel_info("ch")
+
+        assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,117 @@
+"""
+Tests for the fake YouTube Data API server (benchmarks.fake_youtube)
+
+Drives the real YouTubeAPIClient against the fake over ASGI:
+- Deterministic search results and page tokens
+- id= batching and unknown IDs
+- Comment thread paging, embedded replies and disabled comments
+- Quota exhaustion in the real error shape
+"""
+import httpx
+import pytest
+
+from benchmarks.fake_youtube import create_app, encode_page_token
+from app.services.youtube import YouTubeAPIClient, YouTubeQuotaExceededError
+from app.services.youtube_breaker import CircuitBreaker
+from app.services.youtube_limiter import RateLimiter
+from app.services.youtube_quota import APIKeyPool
+
+
+def make_client(fake_app, api_key="fake-key"):
+    """Client bound to the fake server, isolated from the shared singletons."""
+    return YouTubeAPIClient(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_app)),
+        use_cache=False,
+        key_pool=APIKeyPool([api_key], daily_limit=10 ** 6),
+        limiter=RateLimiter(rate_per_second=0, max_in_flight=0),
+        breaker=CircuitBreaker(failure_rate=0),
+    )
+
+
+@pytest.mark.asyncio
+class TestFakeYouTube:
+    async def test_search_is_deterministic(self):
+        """같은 검색어는 서버 인스턴스가 달라도 같은 결과"""
+        first = await make_client(create_app()).search_videos("파이썬 강의", max_results=10)
+        second = await make_client(create_app()).search_videos("파이썬 강의", max_results=10)
+
+        assert [r.video_id for r in first] == [r.video_id for r in second]
+        assert all(r.title.startswith("파이썬 강의") for r in first)
+
+    async def test_search_pages(self):
+        """pageToken으로 다음 페이지를 이어서 반환하고 500건에서 끝남"""
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_app()), base_url="http://fake"
+        ) as http:
+            params = {"key": "k", "part": "snippet", "q": "캠핑", "maxResults": 50}
+            first = (await http.get("/youtube/v3/search", params=params)).json()
+            second = (await http.get(
+                "/youtube/v3/search", params={**params, "pageToken": first["nextPageToken"]}
+            )).json()
+            last = (await http.get(
+                "/youtube/v3/search", params={**params, "pageToken": encode_page_token(450)}
+            )).json()
+
+        first_ids = {item["id"]["videoId"] for item in first["items"]}
+        assert len(first["items"]) == len(second["items"]) == 50
+        assert first_ids.isdisjoint(item["id"]["videoId"] for item in second["items"])
+        assert "prevPageToken" in second
+        assert "nextPageToken" not in last
+
+    async def test_batched_ids(self):
+        """id=는 50개씩 나눠 조회하고 없는 ID는 None"""
+        fake_app = create_app(missing_ids={"missing0001"})
+        ids = [f"video{i:06d}" for i in range(120)] + ["missing0001"]
+
+        details = await make_client(fake_app).get_videos_details(ids)
+
+        assert fake_app.state.youtube.requests == 3
+        assert details["missing0001"] is None
+        assert details["video000000"].view_count > 0
+
+    async def test_too_many_ids_rejected(self):
+        """50개를 넘는 id= 요청은 400"""
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_app()), base_url="http://fake"
+        ) as http:
+            response = await http.get("/youtube/v3/videos", params={
+                "key": "k", "part": "snippet", "id": ",".join(f"v{i}" for i in range(51)),
+            })
+
+        assert response.status_code == 400
+        assert response.json()["error"]["errors"][0]["reason"] == "invalidFilters"
+
+    async def test_comment_threads(self):
+        """댓글 페이지와 포함된 답글, 답글 조회가 일관됨"""
+        fake_app = create_app(comments_per_video=250)
+        client = make_client(fake_app)
+        video_id = "abcdefghijk"
+        total = fake_app.state.youtube.comment_total(video_id)
+
+        comments = [c async for page in client.iter_video_comments(video_id) for c in page]
+        replies = await client.get_thread_replies(comments, max_threads=len(comments))
+
+        assert len(comments) == total
+        for thread in comments:
+            if thread.reply_count:
+                assert len(replies[thread.comment_id]) == thread.reply_count
+                assert all(r.parent_id == thread.comment_id for r in replies[thread.comment_id])
+
+    async def test_comments_disabled(self):
+        """댓글이 비활성화된 영상은 commentsDisabled"""
+        client = make_client(create_app(comments_disabled={"noComments1"}))
+
+        assert await client.get_video_comments("noComments1") == []
+
+    async def test_quota_exhaustion(self):
+        """일일 쿼터를 넘으면 실제와 같은 403 quotaExceeded"""
+        fake_app = create_app(daily_quota=250)
+        client = make_client(fake_app)
+
+        await client.search_videos("a")
+        await client.search_videos("b")
+        with pytest.raises(YouTubeQuotaExceededError):
+            await client.search_videos("c")
+
+        assert fake_app.state.youtube.used["fake-key"] == 200
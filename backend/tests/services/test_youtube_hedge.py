@@ -0,0 +1,67 @@
+"""
+Tests for RequestHedger
+
+Tests the hedging policy for YouTube API reads:
+- Opt-in endpoints, never costly ones
+- Percentile-based hedge delay
+- Hedge budget
+- Win rate statistics
+"""
+from app.services.youtube_hedge import RequestHedger
+
+
+def warmed_up(**kwargs):
+    hedger = RequestHedger(endpoints=["videos"], min_samples=10, min_delay=0.0, **kwargs)
+    for i in range(1, 101):
+        hedger.record_latency("videos", i / 1000)
+    return hedger
+
+
+class TestRequestHedger:
+    def test_only_opted_in_cheap_endpoints(self):
+        """지정한 1단위 엔드포인트만 헤징하고 search는 제외"""
+        hedger = RequestHedger(endpoints=["videos", "search"], min_samples=1)
+        hedger.record_latency("videos", 0.1)
+        hedger.record_latency("channels", 0.1)
+
+        assert hedger.endpoints == {"videos"}
+        assert hedger.hedge_delay("videos") is not None
+        assert hedger.hedge_delay("channels") is None
+
+    def test_delay_follows_latency_percentile(self):
+        """지연 시간은 최근 응답 시간의 백분위수를 따르고 범위로 제한"""
+        assert warmed_up(percentile=0.9).hedge_delay("videos") == 0.090
+        assert warmed_up(percentile=0.9, max_delay=0.05).hedge_delay("videos") == 0.05
+
+    def test_no_hedging_before_min_samples(self):
+        """표본이 부족하면 헤징하지 않음"""
+        hedger = RequestHedger(endpoints=["videos"], min_samples=10)
+        for _ in range(9):
+            hedger.record_latency("videos", 0.1)
+
+        assert hedger.hedge_delay("videos") is None
+
+    def test_budget_bounds_hedges(self):
+        """요청당 budget 만큼만 헤징 토큰이 쌓임"""
+        hedger = warmed_up(budget=0.25)
+
+        granted = 0
+        for _ in range(100):
+            hedger.hedge_delay("videos")
+            granted += hedger.try_hedge()
+
+        assert granted == 25
+        assert hedger.stats()["skipped"] == 75
+
+    def test_win_rate(self):
+        """먼저 도착한 헤지 비율을 통계로 제공"""
+        hedger = warmed_up(budget=1.0)
+        for hedge_won in (True, False, True, True):
+            hedger.hedge_delay("videos")
+            hedger.try_hedge()
+            hedger.record_race(hedge_won)
+
+        stats = hedger.stats()
+        assert stats["hedged"] == 4
+        assert stats["win_rate"] == 0.75
+        assert stats["delays"]["videos"] == 0.095
@@ -0,0 +1,62 @@
+"""
+Tests for RateLimiter
+
+Tests outbound YouTube request limiting:
+- Token-bucket rate and per-endpoint weights
+- In-flight concurrency cap
+- Queue depth and wait statistics
+"""
+import asyncio
+import time
+
+from app.services.youtube_limiter import RateLimiter
+
+
+async def hold(limiter, endpoint="videos", seconds=0.0):
+    async with limiter.limit(endpoint) as waited:
+        await asyncio.sleep(seconds)
+        return waited
+
+
+class TestRateLimiter:
+    async def test_token_bucket_spaces_requests(self):
+        """버스트를 넘는 요청은 초당 속도에 맞춰 대기"""
+        limiter = RateLimiter(rate_per_second=20, burst=1, max_in_flight=0)
+
+        started = time.monotonic()
+        await asyncio.gather(*(hold(limiter) for _ in range(3)))
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.09
+        assert limiter.stats()["acquired"] == 3
+
+    async def test_endpoint_weight_consumes_more_tokens(self):
+        """가중치가 큰 엔드포인트는 토큰을 더 소모"""
+        limiter = RateLimiter(rate_per_second=1, burst=5, weights={"search": 5})
+
+        await hold(limiter, "search")
+        assert limiter.weight_for("search") == 5
+        assert limiter.weight_for("videos") == 1
+        assert limiter._tokens < 1
+
+    async def test_in_flight_cap_and_queue_depth(self):
+        """동시 요청 수 제한과 대기열 길이 노출"""
+        limiter = RateLimiter(rate_per_second=0, max_in_flight=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.limit("videos"):
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.02)
+
+        tasks = [asyncio.create_task(request()) for _ in range(5)]
+        await asyncio.sleep(0.005)
+        assert limiter.stats()["queue_depth"] == 3
+        await asyncio.gather(*tasks)
+
+        stats = limiter.stats()
+        assert peak == 2
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["max_wait_seconds"] > 0
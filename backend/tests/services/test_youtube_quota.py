@@ -0,0 +1,92 @@
+"""
+Tests for QuotaLedger
+
+Tests YouTube API quota accounting:
+- Per-endpoint unit costs and pre-flight budgeting
+- Pacific-time daily reset
+- Database persistence
+"""
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.quota import QuotaUsage
+from app.services.youtube_quota import QuotaLedger, next_quota_reset, quota_day
+
+
+class TestQuotaBudget:
+    def test_unit_costs(self):
+        """엔드포인트별 쿼터 비용"""
+        ledger = QuotaLedger()
+        assert ledger.cost_of("search") == 100
+        assert ledger.cost_of("videos") == 1
+
+    def test_charge_tracks_used_and_remaining(self):
+        """사용량/잔여량 기록"""
+        ledger = QuotaLedger(daily_limit=1000)
+        ledger.charge("search")
+        ledger.charge("videos")
+
+        status = ledger.status()
+        assert status["used_units"] == 101
+        assert status["remaining_units"] == 899
+        assert status["by_endpoint"] == {"search": 100, "videos": 1}
+
+    def test_reserve_sheds_expensive_requests_first(self):
+        """예비분에 닿으면 search는 거절, 1단위 요청은 허용"""
+        ledger = QuotaLedger(daily_limit=250, reserve=100)
+        ledger.charge("search")
+
+        assert ledger.can_afford("search") is False
+        assert ledger.can_afford("videos") is True
+
+    def test_mark_exhausted(self):
+        """API가 quotaExceeded를 보고하면 잔여량 0"""
+        ledger = QuotaLedger(daily_limit=1000)
+        ledger.mark_exhausted()
+        assert ledger.remaining == 0
+        assert ledger.can_afford("videos") is False
+
+    def test_resets_on_pacific_day_boundary(self):
+        """태평양 시간 자정이 지나면 사용량 초기화"""
+        with patch("app.services.youtube_quota.quota_day", return_value=date(2026, 1, 1)):
+            ledger = QuotaLedger(daily_limit=1000)
+            ledger.charge("search")
+            assert ledger.used == 100
+
+        with patch("app.services.youtube_quota.quota_day", return_value=date(2026, 1, 2)):
+            assert ledger.used == 0
+
+    def test_quota_day_uses_pacific_time(self):
+        """UTC 07:59는 태평양 시간으로 전날"""
+        now = datetime(2026, 1, 2, 7, 59, tzinfo=timezone.utc)
+        assert quota_day(now) == date(2026, 1, 1)
+        assert next_quota_reset(now) == datetime(2026, 1, 2, 8, 0, tzinfo=timezone.utc)
+
+
+class TestQuotaPersistence:
+    @pytest.fixture
+    def session_factory(self, test_db_engine):
+        return async_sessionmaker(test_db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def test_flush_and_reload(self, session_factory):
+        """사용량을 DB에 누적 저장하고 새 프로세스에서 불러옴"""
+        ledger = QuotaLedger(session_factory=session_factory)
+        await ledger.load()
+        ledger.charge("search")
+        ledger.charge("videos")
+        await ledger.flush()
+        ledger.charge("videos")
+        await ledger.flush()
+
+        async with session_factory() as session:
+            rows = (await session.execute(select(QuotaUsage))).scalars().all()
+        by_endpoint = {row.endpoint: (row.units, row.request_count) for row in rows}
+        assert by_endpoint == {"search": (100, 1), "videos": (2, 2)}
+
+        restarted = QuotaLedger(session_factory=session_factory)
+        await restarted.load()
+        assert restarted.used == 102
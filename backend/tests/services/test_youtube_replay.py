@@ -0,0 +1,139 @@
+"""
+Tests for the YouTube API record/replay transports
+
+- Recording live responses to disk, without the API key
+- Replaying them through the real client request/parse path
+- Replay latency, ETag revalidation and missing recordings
+- Transport selection from settings
+"""
+import json
+import time
+
+import httpx
+import pytest
+
+from app.services import youtube_replay
+from app.services.youtube import YouTubeAPIClient, YouTubeAPIError
+from app.services.youtube_breaker import CircuitBreaker
+from app.services.youtube_limiter import RateLimiter
+from app.services.youtube_quota import APIKeyPool
+from app.services.youtube_replay import (
+    RecordingNotFoundError,
+    RecordingTransport,
+    ReplayTransport,
+    create_replay_transport,
+)
+
+
+def make_client(transport, api_key="live-key"):
+    """Client isolated from the shared cache, limiter, breaker and key pool."""
+    return YouTubeAPIClient(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(transport=transport),
+        use_cache=False,
+        key_pool=APIKeyPool([api_key]),
+        limiter=RateLimiter(rate_per_second=0, max_in_flight=0),
+        breaker=CircuitBreaker(failure_rate=0),
+    )
+
+
+def upstream(request):
+    return httpx.Response(
+        200,
+        headers={"ETag": '"v1"'},
+        json={"items": [{
+            "id": request.url.params["id"],
+            "snippet": {"title": "파이썬 강의", "channelTitle": "코딩 채널"},
+            "statistics": {"viewCount": "1500"},
+        }]},
+    )
+
+
+@pytest.mark.asyncio
+class TestRecordReplay:
+    async def test_replay_matches_recorded_response(self, tmp_path):
+        """녹화한 응답을 네트워크 없이 동일하게 재생"""
+        recorder = RecordingTransport(tmp_path, httpx.MockTransport(upstream))
+        live = await make_client(recorder).get_video_details("abc")
+
+        replayer = make_client(ReplayTransport(tmp_path, latency=0), api_key="other-key")
+        replayed = await replayer.get_video_details("abc")
+
+        assert recorder.recorded == 1
+        assert replayed == live
+        assert replayed.title == "파이썬 강의"
+
+    async def test_api_key_not_recorded(self, tmp_path):
+        """API 키는 녹화 파일에 남지 않음"""
+        recorder = RecordingTransport(tmp_path, httpx.MockTransport(upstream))
+        await make_client(recorder, "secret-key").get_video_details("abc")
+
+        [path] = tmp_path.rglob("*.json")
+        recording = json.loads(path.read_text(encoding="utf-8"))
+        assert "secret-key" not in path.read_text(encoding="utf-8")
+        assert recording["key"][0] == "videos"
+        assert recording["headers"]["etag"] == '"v1"'
+
+    async def test_missing_recording_fails_loudly(self, tmp_path):
+        """녹화되지 않은 요청은 재생 시 명확한 오류"""
+        client = make_client(ReplayTransport(tmp_path))
+
+        with pytest.raises(YouTubeAPIError, match="No recording for videos") as exc_info:
+            await client.get_video_details("abc")
+
+        assert isinstance(exc_info.value.__cause__, RecordingNotFoundError)
+
+    async def test_replay_latency(self, tmp_path):
+        """설정한 지연 시간만큼 응답을 늦춤"""
+        recorder = RecordingTransport(tmp_path, httpx.MockTransport(upstream))
+        await make_client(recorder).get_video_details("abc")
+        client = make_client(ReplayTransport(tmp_path, latency=0.05, jitter=0.01))
+
+        started = time.monotonic()
+        await client.get_video_details("abc")
+
+        assert time.monotonic() - started >= 0.04
+
+    async def test_matching_etag_replays_not_modified(self, tmp_path):
+        """녹화된 ETag로 조건부 요청하면 304"""
+        recorder = RecordingTransport(tmp_path, httpx.MockTransport(upstream))
+        await make_client(recorder).get_video_details("abc")
+        transport = ReplayTransport(tmp_path, latency=0)
+
+        [path] = tmp_path.rglob("*.json")
+        recorded_params = json.loads(path.read_text(encoding="utf-8"))["key"][1:]
+        request = httpx.Request(
+            "GET",
+            f"{YouTubeAPIClient.BASE_URL}/videos",
+            params=dict(param.split("=", 1) for param in recorded_params),
+            headers={"If-None-Match": '"v1"'},
+        )
+        response = await transport.handle_async_request(request)
+
+        assert response.status_code == 304
+
+
+class TestTransportSelection:
+    def test_off_by_default(self, monkeypatch):
+        """기본값은 실제 API로 전송"""
+        monkeypatch.setattr(youtube_replay.settings, "YOUTUBE_REPLAY_MODE", "")
+        assert create_replay_transport(httpx.MockTransport(upstream)) is None
+
+    def test_modes(self, monkeypatch, tmp_path):
+        """record/replay 모드에 맞는 트랜스포트 선택"""
+        monkeypatch.setattr(youtube_replay.settings, "YOUTUBE_REPLAY_DIR", str(tmp_path))
+        live = httpx.MockTransport(upstream)
+
+        monkeypatch.setattr(youtube_replay.settings, "YOUTUBE_REPLAY_MODE", "record")
+        recorder = create_replay_transport(live)
+        assert isinstance(recorder, RecordingTransport)
+        assert recorder.transport is live
+
+        monkeypatch.setattr(youtube_replay.settings, "YOUTUBE_REPLAY_MODE", "replay")
+        assert isinstance(create_replay_transport(live), ReplayTransport)
+
+    def test_unknown_mode_rejected(self, monkeypatch):
+        """알 수 없는 모드는 거부"""
+        monkeypatch.setattr(youtube_replay.settings, "YOUTUBE_REPLAY_MODE", "playback")
+        with pytest.raises(ValueError, match="YOUTUBE_REPLAY_MODE"):
+            create_replay_transport(httpx.MockTransport(upstream))